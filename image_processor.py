@@ -5,20 +5,299 @@ Focuses on brightness and contrast adjustment with a simple GUI interface
 """
 
 import tkinter as tk
-from tkinter import filedialog, Scale, Button, Label, Frame, StringVar, IntVar, DoubleVar, BooleanVar, Radiobutton, Checkbutton, Canvas, Scrollbar, Entry
+from tkinter import filedialog, Scale, Button, Label, Frame, StringVar, IntVar, DoubleVar, Radiobutton, Checkbutton, Canvas, Scrollbar, Entry
 from tkinter import ttk, messagebox, simpledialog
-from PIL import Image, ImageTk, ImageOps, ImageFilter, ImageDraw, ImageEnhance, ImageChops
+from PIL import Image, ImageTk, ImageOps, ImageFilter, ImageDraw, ImageEnhance, ImageChops, ImageFont
 import tkinter.font as tkFont
 import os
+import threading
+import zlib
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from image_utils import (
     adjust_brightness_contrast, rotate_image, flip_image_horizontal,
     flip_image_vertical, adjust_saturation, adjust_hue,
-    apply_histogram_equalization, apply_sepia, apply_pencil_sketch, crop_image, resize_image,
-    resize_by_percentage, get_image_info
+    apply_histogram_equalization, apply_sepia, apply_pencil_sketch, apply_gaussian_blur,
+    crop_image, resize_image,
+    resize_by_percentage, get_resize_dimensions, get_percentage_dimensions, get_image_info,
+    adjust_hue_numba, adjust_all_numba, brightness_contrast_lut,
+    build_sepia_luts, apply_sepia_luts, adjust_brightness_contrast_lut,
+    adjust_saturation_hue_cv2, NUMBA_AVAILABLE, CV2_AVAILABLE, PILLOW_SIMD
 )
 
+if CV2_AVAILABLE:
+    import cv2
+
+# Try to import numpy, but make it optional
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # No Layer class needed as we're removing layer functionality
 
+@lru_cache(maxsize=256)
+def _hex_to_rgb(color):
+    """Return the (r, g, b) channels of a "#rrggbb" color"""
+    return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+@lru_cache(maxsize=256)
+def _interp_hex(start_color, end_color, steps):
+    """Return the steps + 1 hex colors of a linear transition between two colors"""
+    start = _hex_to_rgb(start_color)
+    end = _hex_to_rgb(end_color)
+    if NUMPY_AVAILABLE:
+        # Blend every step at once; trunc matches int() on the per-step offsets
+        t = np.arange(steps + 1)[:, None] / steps
+        rgb = np.array(start) + np.trunc((np.array(end) - np.array(start)) * t).astype(int)
+        return tuple("#%02x%02x%02x" % (r, g, b) for r, g, b in rgb.tolist())
+    colors = []
+    for step in range(steps + 1):
+        r, g, b = (s + int((e - s) * (step / steps)) for s, e in zip(start, end))
+        colors.append(f"#{r:02x}{g:02x}{b:02x}")
+    return tuple(colors)
+
+@lru_cache(maxsize=256)
+def _scale_hex(color, factor):
+    """Return a hex color with each channel scaled by factor and clamped to 0-255"""
+    r, g, b = (min(255, max(0, int(c * factor))) for c in _hex_to_rgb(color))
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+# Spare thread for filters that can run two independent branches at once; it is only
+# started the first time such a filter runs
+_SIDE_POOL = ThreadPoolExecutor(max_workers=1)
+
+# Named filters used by the render pipeline and presets. Each takes the image, the
+# filter intensity and the render params (for filters that reuse the slider values).
+
+# Sepia tables for recently used intensities; the arrays are only ever read
+_sepia_luts = lru_cache(maxsize=8)(build_sepia_luts)
+
+def _filter_grayscale(img, intensity, params):
+    # Reuse the one luma band for all three channels instead of converting L back to RGB
+    gray = img.convert('L')
+    return Image.merge('RGB', (gray, gray, gray))
+
+def _filter_sepia(img, intensity, params):
+    if NUMPY_AVAILABLE:
+        return apply_sepia_luts(img, _sepia_luts(intensity))
+    return apply_sepia(img)
+
+def _filter_invert(img, intensity, params):
+    return ImageOps.invert(img)
+
+def _filter_brightness(img, intensity, params):
+    return adjust_brightness_contrast(img, 50 * intensity, params["contrast"])
+
+def _filter_contrast(img, intensity, params):
+    return adjust_brightness_contrast(img, params["brightness"], 1.0 + intensity)
+
+def _filter_saturation(img, intensity, params):
+    return adjust_saturation(img, 1.0 + intensity)
+
+def _filter_gaussian_blur(img, intensity, params):
+    # PIL's radius is the standard deviation
+    return apply_gaussian_blur(img, intensity * 5, fast=params.get("fast", False))
+
+def _rank_size(intensity):
+    """Odd window size for the rank filters, which reject even sizes"""
+    return int(intensity * 5) | 1
+
+# PIL fallbacks for the rank ops, each a sequence of rank filters
+_RANK_FALLBACK = {
+    "median": (ImageFilter.MedianFilter,),
+    "erode": (ImageFilter.MinFilter,),
+    "dilate": (ImageFilter.MaxFilter,),
+    "open": (ImageFilter.MinFilter, ImageFilter.MaxFilter),
+    "close": (ImageFilter.MaxFilter, ImageFilter.MinFilter),
+}
+
+def _rank_filter(img, op, size):
+    """Median/morphology op over a size x size window, through OpenCV when it can take the image"""
+    if size < 3:
+        # A one-pixel window is the identity (and PIL's rank filter crashes on it)
+        return img
+    if CV2_AVAILABLE and NUMPY_AVAILABLE and img.mode in ("L", "RGB", "RGBA"):
+        arr = np.asarray(img)
+        if op == "median":
+            out = cv2.medianBlur(arr, size)
+        else:
+            kernel = np.ones((size, size), np.uint8)
+            if op == "erode":
+                out = cv2.erode(arr, kernel)
+            elif op == "dilate":
+                out = cv2.dilate(arr, kernel)
+            else:
+                out = cv2.morphologyEx(arr, cv2.MORPH_OPEN if op == "open" else cv2.MORPH_CLOSE, kernel)
+        return Image.fromarray(out, img.mode)
+    for rank_filter in _RANK_FALLBACK[op]:
+        img = img.filter(rank_filter(size=size))
+    return img
+
+def _filter_median_blur(img, intensity, params):
+    return _rank_filter(img, "median", _rank_size(intensity))
+
+@lru_cache(maxsize=1)
+def _sharpen_kernel():
+    """Return PIL's SHARPEN kernel as a float32 array for cv2.filter2D"""
+    (size, _), scale, _, weights = ImageFilter.SHARPEN.filterargs
+    return np.array(weights, dtype=np.float32).reshape(size, size) / scale
+
+def _filter_sharpen(img, intensity, params):
+    passes = 1 + (int(intensity) if intensity > 1.0 else 0)
+    if CV2_AVAILABLE and NUMPY_AVAILABLE and img.mode in ("L", "RGB"):
+        # Same 3x3 kernel and the same clipping between passes, through OpenCV's SIMD
+        # convolution; one array conversion for the whole chain instead of one PIL pass each
+        arr = np.asarray(img)
+        for _ in range(passes):
+            out = cv2.filter2D(arr, -1, _sharpen_kernel())
+            # PIL leaves the outermost ring of pixels unfiltered
+            out[[0, -1]] = arr[[0, -1]]
+            out[:, [0, -1]] = arr[:, [0, -1]]
+            arr = out
+        return Image.fromarray(arr, img.mode)
+    for _ in range(passes):
+        img = img.filter(ImageFilter.SHARPEN)
+    return img
+
+def _filter_edge_detection(img, intensity, params):
+    return img.filter(ImageFilter.FIND_EDGES)
+
+def _filter_emboss(img, intensity, params):
+    return img.filter(ImageFilter.EMBOSS)
+
+@lru_cache(maxsize=8)
+def _threshold_lut(threshold):
+    """Return the 256-entry binary lookup table for a threshold level"""
+    return [255 if i > threshold else 0 for i in range(256)]
+
+def _filter_threshold(img, intensity, params):
+    # Convert to grayscale first
+    gray = img.convert('L')
+    # Apply threshold with a prebuilt table rather than a Python callback per level
+    threshold = int(128 * intensity)
+    return gray.point(_threshold_lut(threshold)).convert('RGB')
+
+def _filter_histogram_eq(img, intensity, params):
+    # Apply histogram equalization with intensity based on the slider
+    return apply_histogram_equalization(img, intensity)
+
+def _filter_color_balance(img, intensity, params):
+    # Simple color balance by stretching each RGB channel; autocontrast already builds a
+    # table per band from one histogram, so no split/merge is needed
+    return ImageOps.autocontrast(img, cutoff=intensity * 10)
+
+@lru_cache(maxsize=4)
+def _vignette_mask(width, height):
+    """Return the vignette mask for an image size; it depends on nothing else"""
+    radius = max(1, min(width, height) // 2)
+    # Radial falloff from 255 at the center to 0 at the radius and beyond
+    if NUMPY_AVAILABLE:
+        yy, xx = np.ogrid[:height, :width]
+        dist = np.sqrt(((xx - width // 2) / radius) ** 2 + ((yy - height // 2) / radius) ** 2)
+        mask = np.empty((height, width), dtype=np.uint8)
+        np.clip(255 * (1 - dist), 0, 255, out=mask, casting='unsafe')
+        mask = Image.fromarray(mask, 'L')
+    else:
+        # PIL's 256x256 radial gradient runs from 0 at the center to 181 at radius 128
+        falloff = Image.radial_gradient('L').point(lambda v: max(0, 255 - v * 255 // 181))
+        falloff = falloff.resize((2 * radius, 2 * radius))
+        mask = Image.new('L', (width, height), 0)
+        mask.paste(falloff, (width // 2 - radius, height // 2 - radius))
+    return mask
+
+def _filter_vignette(img, intensity, params):
+    # Create vignette effect; the mask is built once per image size
+    mask = _vignette_mask(*img.size)
+    # Apply the mask
+    return Image.composite(img, Image.new('RGB', img.size, (30, 20, 10)), mask)
+
+def _cartoon_edges(img):
+    """Inverted grayscale edge map of an image, as RGB"""
+    # 1. Apply edge detection
+    edges = img.filter(ImageFilter.FIND_EDGES)
+    # 2. Convert to grayscale and invert
+    return ImageOps.invert(edges.convert('L')).convert('RGB')
+
+def _filter_cartoonify(img, intensity, params):
+    # The edge branch and the posterize branch are independent and PIL releases the GIL
+    # in both, so the edges are found on the side thread while this one posterizes
+    edges = _SIDE_POOL.submit(_cartoon_edges, img)
+    # 3. Posterize the original image
+    color = ImageOps.posterize(img, 4)
+    # 4. Combine edges with color
+    return ImageChops.multiply(color, edges.result())
+
+def _filter_oil_painting(img, intensity, params):
+    # Oil painting effect (simplified)
+    size = int(intensity * 5)
+    if size < 2:
+        # A one-pixel window keeps every pixel as it is
+        pass
+    elif CV2_AVAILABLE and NUMPY_AVAILABLE and img.mode in ("L", "RGB"):
+        # Median of colors quantized to 32 levels per channel: the same flat brush
+        # patches as a mode filter, but through OpenCV's constant-time median
+        quantized = (np.asarray(img) & 0xF8) | 0x04
+        img = Image.fromarray(cv2.medianBlur(quantized, size | 1), img.mode)
+    else:
+        img = img.filter(ImageFilter.ModeFilter(size=size))
+    enhancer = ImageEnhance.Contrast(img)
+    return enhancer.enhance(1.5)
+
+def _filter_pencil_sketch(img, intensity, params):
+    # Use the enhanced pencil sketch function from image_utils
+    return apply_pencil_sketch(img, intensity)
+
+def _filter_erosion(img, intensity, params):
+    # Erosion (min filter over a square window)
+    return _rank_filter(img, "erode", _rank_size(intensity))
+
+def _filter_dilation(img, intensity, params):
+    # Dilation (max filter over a square window)
+    return _rank_filter(img, "dilate", _rank_size(intensity))
+
+def _filter_opening(img, intensity, params):
+    # Opening (erosion followed by dilation)
+    return _rank_filter(img, "open", _rank_size(intensity))
+
+def _filter_closing(img, intensity, params):
+    # Closing (dilation followed by erosion)
+    return _rank_filter(img, "close", _rank_size(intensity))
+
+_FILTER_FNS = {
+    "grayscale": _filter_grayscale,
+    "sepia": _filter_sepia,
+    "invert": _filter_invert,
+    "brightness": _filter_brightness,
+    "contrast": _filter_contrast,
+    "saturation": _filter_saturation,
+    "gaussian_blur": _filter_gaussian_blur,
+    "median_blur": _filter_median_blur,
+    "sharpen": _filter_sharpen,
+    "edge_detection": _filter_edge_detection,
+    "emboss": _filter_emboss,
+    "threshold": _filter_threshold,
+    "histogram_eq": _filter_histogram_eq,
+    "color_balance": _filter_color_balance,
+    "vignette": _filter_vignette,
+    "cartoonify": _filter_cartoonify,
+    "oil_painting": _filter_oil_painting,
+    "pencil_sketch": _filter_pencil_sketch,
+    "erosion": _filter_erosion,
+    "dilation": _filter_dilation,
+    "opening": _filter_opening,
+    "closing": _filter_closing,
+}
+
+# Filters whose look doesn't depend on the image resolution, so the canvas-sized proxy
+# previews them faithfully; the others work in source pixels (radii, windows, kernels)
+_SCALE_INVARIANT_FILTERS = frozenset({
+    "none", "grayscale", "sepia", "invert", "brightness", "contrast", "saturation",
+    "threshold", "histogram_eq", "color_balance", "vignette",
+})
+
 class ImageProcessorApp:
     def __init__(self, root):
         self.root = root
@@ -45,6 +324,22 @@ class ImageProcessorApp:
         self.subheader_font = tkFont.Font(family="Segoe UI", size=12, weight="bold")
         self.normal_font = tkFont.Font(family="Segoe UI", size=10)
         self.button_font = tkFont.Font(family="Segoe UI", size=10, weight="bold")
+        self.button_font_hover = tkFont.Font(family="Segoe UI", size=11, weight="bold")
+        # Shared by the many filter card labels so Tk doesn't parse a font spec per widget
+        self.bold_font = tkFont.Font(family="Segoe UI", size=10, weight="bold")
+        self.emoji_font = tkFont.Font(family="Segoe UI Emoji", size=16)
+        self.small_emoji_font = tkFont.Font(family="Segoe UI Emoji", size=4)
+        self.icon_font = tkFont.Font(family="Segoe UI Emoji", size=18)
+        self.tooltip_font = tkFont.Font(family="Arial", size=8)
+
+        # Default colors and font for plain Frames and Labels, so they are only passed where they differ
+        self.root.option_add("*Frame.background", self.bg_color)
+        self.root.option_add("*Label.background", self.bg_color)
+        self.root.option_add("*Label.foreground", self.text_color)
+        self.root.option_add("*Label.font", self.normal_font)
+
+        # Animated hover/pulse effects queue many after() callbacks; off by default for responsiveness
+        self._animations_enabled = False
 
         # Create custom styles for buttons
         self.create_button_styles()
@@ -57,16 +352,97 @@ class ImageProcessorApp:
         self.current_saturation = 1.0
         self.current_hue = 0
 
+        # Canvas-sized thumbnail and NumPy copies used by the live slider preview
+        self._preview_src = None
+        self._preview_arr = None
+        self._orig_arr = None
+        # The two arrays above keyed by id() of the image they were taken from
+        self._source_arrays = {}
+        # Last brightness/contrast lookup table and the (brightness, contrast) it was built for
+        self._bc_lut = None
+        self._bc_lut_key = None
+        # Reusable output buffer for the lookup table gather
+        self._preview_out = None
+        # Contiguous uint8 array of processed_image, rebuilt only when the image object changes
+        self._work_arr = None
+        self._work_src = None
+        # Output buffers reused by the JIT hue kernel on the Tk and worker threads; the
+        # thumbnail preview has its own so it doesn't reallocate the full-size one
+        self._hue_out = None
+        self._worker_hue_out = None
+        self._proxy_hue_out = None
+        # Bumped on every image load; identifies the source a render started from
+        self._image_generation = 0
+        # LRU of preset filter chain results keyed by (image generation, adjustments, steps so far),
+        # bounded by the bytes of pixels it holds; cleared when another image is loaded
+        self._filter_cache = OrderedDict()
+        self._filter_cache_bytes = 0
+        self._filter_cache_max_bytes = 256 * 1024 * 1024
+        self._filter_cache_lock = threading.Lock()
+        # LRU of full pipeline outputs keyed by the render parameters; each entry keeps
+        # its source image so a recycled id() can't match. Shared by the Tk and worker threads
+        self._render_cache = OrderedDict()
+        self._render_cache_size = 8
+        self._render_cache_lock = threading.Lock()
+        # Last adjusted intermediate as (source, adjustments, image), so a filter change skips the adjustments
+        self._adjusted_cache = None
+        # Label fonts by point size; None records that arial.ttf isn't available
+        self._font_cache = {}
+        # LRU of pre-rendered RGBA labels keyed by (text, font size, color)
+        self._label_cache = OrderedDict()
+        self._label_cache_size = 16
+        # Coverage arrays of the white labels, for blending into NumPy buffers
+        self._label_masks = {}
+        # Sub-filter cards not built yet, keyed by their category's sub-frame
+        self._pending_sub_filters = {}
+        # Click targets of the filter cards, keyed by widget path
+        self._filter_name_by_widget = {}
+        self._category_by_widget = {}
+        # Sub-filter frames per filter section, and the one currently shown in each
+        self._sub_filter_sections = {}
+        self._visible_sub = {}
+        # ttk widgets to restyle on hover, keyed by filter card path
+        self._card_widgets = {}
+        # Single background worker for full-resolution renders; the latest submission wins
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._render_future = None
+        # Called on the Tk thread with the in-flight future (a render, preset or effect)
+        self._render_apply = None
+        # Special effect buttons, disabled while an effect runs
+        self._effect_buttons = []
+        # Scrollable control panel canvas under the pointer, if any
+        self._scroll_target = None
+        # Pending after() id for the debounced slider preview
+        self._pending_update = None
+        # Pending after() id for the debounced filter intensity slider
+        self._intensity_after_id = None
+        # True while a slider is held, so the display can use a cheaper resample
+        self._is_dragging = False
+
         # Initialize filter variables
         self.current_filter = StringVar(value="none")
         self.filter_intensity = DoubleVar(value=1.0)
-        self.histogram_eq_var = BooleanVar(value=False)
-        self.compare_var = BooleanVar(value=False)
+        # Plain flags: no widget is bound to these, so they don't need Tk variables
+        self.histogram_eq_applied = False
+        self.compare_mode = False
+        self.current_filter_text = StringVar(value="No filter selected")
+
+        # Adjustment values live in variables so they work before the Adjust tab is built
+        self.brightness_var = IntVar(value=0)
+        self.contrast_var = DoubleVar(value=1.0)
+        self.saturation_var = DoubleVar(value=1.0)
+        self.hue_var = IntVar(value=0)
 
         # History for undo/redo
-        self.history = []
-        self.history_position = -1
         self.max_history = 10  # Maximum number of states to store
+        self.max_history_bytes = 512 * 1024 * 1024  # ...and the most compressed bytes they may take
+        # Compressed snapshots: the current state plus bounded undo/redo stacks
+        self._history_head = None
+        # Pending after() id for a debounced history entry, and the image it will record
+        self._history_after_id = None
+        self._history_pending = None
+        self.undo_stack = deque(maxlen=self.max_history)
+        self.redo_stack = deque(maxlen=self.max_history)
 
         # Crop mode variables
         self.crop_mode = False
@@ -92,15 +468,80 @@ class ImageProcessorApp:
         # Setup drag and drop after UI is created
         self.setup_drag_drop()
 
+        # One wheel handler for all scrollable panels instead of per-widget bindings
+        self.root.bind_all("<MouseWheel>", self._route_wheel)
+        self.root.bind_all("<Button-4>", self._route_wheel)
+        self.root.bind_all("<Button-5>", self._route_wheel)
+
+        # Load (or on first run, compile) the hue kernels on the worker so the window comes up
+        # without waiting and the first slider move doesn't stall. The Tk thread and the worker
+        # both launch them; image_utils serializes the launches with a lock
+        if NUMBA_AVAILABLE:
+            self._executor.submit(self._warm_up_kernels)
+
+        # Load the common compare-label fonts off the Tk thread
+        threading.Thread(target=lambda: [self._get_font(size) for size in (10, 16, 24)],
+                         daemon=True).start()
+
+    def _warm_up_kernels(self):
+        """Run the JIT kernels once on tiny images; makes no Tk calls"""
+        adjust_hue_numba(Image.new('RGB', (16, 16)), 0)
+        adjust_all_numba(Image.new('RGB', (16, 16)), 0, 1.0, 0.5, 30)
+
+    def _get_font(self, size):
+        """Return the label font at this size, loading it only once"""
+        if size not in self._font_cache:
+            try:
+                self._font_cache[size] = ImageFont.truetype("arial.ttf", size)
+            except IOError:
+                self._font_cache[size] = None
+        return self._font_cache[size]
+
+    def _get_label(self, text, size, color=(255, 255, 255)):
+        """Return a label pre-rendered as an RGBA image, rasterizing each (text, size, color) only once"""
+        key = (text, size, color)
+        label = self._label_cache.get(key)
+        if label is not None:
+            self._label_cache.move_to_end(key)
+            return label
+
+        font = self._get_font(size)
+        _, _, right, bottom = ImageDraw.Draw(Image.new('L', (1, 1))).textbbox((0, 0), text, font=font)
+        label = Image.new('RGBA', (max(1, right), max(1, bottom)), color + (0,))
+        ImageDraw.Draw(label).text((0, 0), text, fill=color + (255,), font=font)
+        self._label_cache[key] = label
+        if len(self._label_cache) > self._label_cache_size:
+            self._label_cache.popitem(last=False)
+        return label
+
+    def _label_mask(self, text, size):
+        """Return the anti-aliased coverage of a white label as a uint8 array"""
+        key = (text, size)
+        mask = self._label_masks.get(key)
+        if mask is None:
+            mask = np.asarray(self._get_label(text, size).getchannel('A'), dtype=np.uint8)
+            self._label_masks[key] = mask
+        return mask
+
+    def _blend_label(self, buf, text, size, x, y):
+        """Draw a white label into an RGB array at (x, y), clipped to its bounds"""
+        mask = self._label_mask(text, size)
+        h = min(mask.shape[0], buf.shape[0] - y)
+        w = min(mask.shape[1], buf.shape[1] - x)
+        if h <= 0 or w <= 0:
+            return
+        region = buf[y:y + h, x:x + w]
+        alpha = mask[:h, :w, None].astype(np.uint16)
+        region[:] = region + ((255 - region) * alpha + 127) // 255
+
     def setup_ui(self):
         # Main frames
         # Create a frame to hold the scrollbar and canvas with fixed dimensions
-        control_container = Frame(self.root, width=300, height=750, bg=self.bg_color)
+        control_container = Frame(self.root, width=300, height=750)
         control_container.pack(side=tk.LEFT, fill=tk.BOTH)
         control_container.pack_propagate(False)  # Prevent the frame from shrinking
 
         # Set minimum size to ensure scrolling works properly
-        self.root.update()
         self.root.minsize(width=1000, height=750)
 
         # Create a notebook (tabbed interface)
@@ -108,11 +549,11 @@ class ImageProcessorApp:
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
         # Create tab frames
-        self.file_tab = Frame(self.notebook, bg=self.bg_color)
-        self.adjust_tab = Frame(self.notebook, bg=self.bg_color)
-        self.filter_tab = Frame(self.notebook, bg=self.bg_color)  # New Filter tab
-        self.transform_tab = Frame(self.notebook, bg=self.bg_color)
-        self.advanced_tab = Frame(self.notebook, bg=self.bg_color)
+        self.file_tab = Frame(self.notebook)
+        self.adjust_tab = Frame(self.notebook)
+        self.filter_tab = Frame(self.notebook)  # New Filter tab
+        self.transform_tab = Frame(self.notebook)
+        self.advanced_tab = Frame(self.notebook)
 
         # Add tabs to notebook
         self.notebook.add(self.file_tab, text="File")
@@ -124,18 +565,23 @@ class ImageProcessorApp:
         # Configure tab style
         style = ttk.Style()
         style.configure("TNotebook", background=self.bg_color, borderwidth=0)
-        style.configure("TNotebook.Tab", background=self.bg_color, padding=[8, 3], font=("Segoe UI", 10))
+        style.configure("TNotebook.Tab", background=self.bg_color, padding=[8, 3], font=self.normal_font)
         style.map("TNotebook.Tab", background=[('selected', self.accent_color)], foreground=[('selected', 'white')])
 
-        # Add scrollable frame to each tab
+        # Filter cards recolor through their 'active' state instead of per-widget config calls
+        for card_style in ("FilterCard.TFrame", "FilterCard.TLabel"):
+            style.configure(card_style, background=self.card_bg)
+            style.map(card_style, background=[('active', self.highlight_color)])
+        style.configure("CardBorder.TFrame", background=self.accent_color)
+        style.map("CardBorder.TFrame", background=[('active', self.secondary_color)])
+        style.configure("CardBorderAlt.TFrame", background=self.secondary_color)
+        style.map("CardBorderAlt.TFrame", background=[('active', self.accent_color)])
+
+        # Add scrollable frame to the File tab; the other tabs get theirs when first shown
         self.setup_scrollable_frame(self.file_tab, "file_frame")
-        self.setup_scrollable_frame(self.adjust_tab, "adjust_frame")
-        self.setup_scrollable_frame(self.filter_tab, "filter_frame")  # Add scrollable frame for filter tab
-        self.setup_scrollable_frame(self.transform_tab, "transform_frame")
-        self.setup_scrollable_frame(self.advanced_tab, "advanced_frame")
 
         # Image frame
-        self.image_frame = Frame(self.root, width=900, height=750, bg=self.bg_color)
+        self.image_frame = Frame(self.root, width=900, height=750)
         self.image_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
 
         # Control elements - setup each tab's content
@@ -143,35 +589,43 @@ class ImageProcessorApp:
 
         # Image display areas with improved styling
         self.original_label = Label(self.image_frame, text="Original Image",
-                                   font=self.subheader_font, bg=self.bg_color, fg=self.text_color)
+                                   font=self.subheader_font)
         self.original_label.grid(row=0, column=0, padx=10, pady=5)
 
         self.processed_label = Label(self.image_frame, text="Processed Image",
-                                    font=self.subheader_font, bg=self.bg_color, fg=self.text_color)
+                                    font=self.subheader_font)
         self.processed_label.grid(row=0, column=1, padx=10, pady=5)
 
         # Image canvases with border and shadow effect
         self.original_frame = Frame(self.image_frame, bd=2, relief=tk.GROOVE, bg=self.accent_color)
         self.original_frame.grid(row=1, column=0, padx=10, pady=10)
 
-        self.original_canvas = Label(self.original_frame, bg="#222222", width=450, height=500)
+        # Each canvas holds a single persistent image item that is updated in place
+        self.original_canvas = Canvas(self.original_frame, bg="#222222", width=450, height=500,
+                                      highlightthickness=0)
         self.original_canvas.pack(padx=1, pady=1)
+        self._orig_img_id = self.original_canvas.create_image(225, 250, anchor=tk.CENTER)
 
         self.processed_frame = Frame(self.image_frame, bd=2, relief=tk.GROOVE, bg=self.accent_color)
         self.processed_frame.grid(row=1, column=1, padx=10, pady=10)
 
-        self.processed_canvas = Label(self.processed_frame, bg="#222222", width=450, height=500)
+        self.processed_canvas = Canvas(self.processed_frame, bg="#222222", width=450, height=500,
+                                       highlightthickness=0)
         self.processed_canvas.pack(padx=1, pady=1)
+        self._proc_img_id = self.processed_canvas.create_image(225, 250, anchor=tk.CENTER)
+        # Crop selection overlay; dragging only moves its corners, the image is never redrawn
+        self._crop_rect_id = self.processed_canvas.create_rectangle(0, 0, 0, 0, outline="white",
+                                                                    dash=(4, 2), state=tk.HIDDEN)
 
         # Add mouse events for crop functionality
         self.processed_canvas.bind("<ButtonPress-1>", self.on_mouse_down)
         self.processed_canvas.bind("<B1-Motion>", self.on_mouse_drag)
         self.processed_canvas.bind("<ButtonRelease-1>", self.on_mouse_up)
 
-        # Status bar with improved styling
-        self.status_bar = Label(self.root, text="Ready", bd=1, relief=tk.SUNKEN,
-                               anchor=tk.W, bg=self.accent_color, fg="white",
-                               font=self.normal_font, padx=10, pady=3)
+        # Status bar with improved styling; it also says when Pillow-SIMD is installed
+        self.status_bar = Label(self.root, text="Ready (Pillow-SIMD)" if PILLOW_SIMD else "Ready",
+                               bd=1, relief=tk.SUNKEN, anchor=tk.W, bg=self.accent_color, fg="white",
+                               padx=10, pady=3)
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
 
         # Add keyboard shortcuts
@@ -180,7 +634,7 @@ class ImageProcessorApp:
     def setup_scrollable_frame(self, parent, name):
         """Create a scrollable frame inside a parent widget"""
         # Create a container frame to hold the canvas and scrollbar
-        container = Frame(parent, bg=self.bg_color)
+        container = Frame(parent)
         container.pack(fill=tk.BOTH, expand=True)
 
         # Force the container to maintain its size and not shrink
@@ -211,7 +665,7 @@ class ImageProcessorApp:
         # No scroll indicator needed for a cleaner interface
 
         # Create a frame inside the canvas for the controls
-        frame = Frame(canvas, bg=self.bg_color, padx=10, pady=10)
+        frame = Frame(canvas, padx=10, pady=10)
         frame_window = canvas.create_window((0, 0), window=frame, anchor="nw")
 
         # Function to update the scroll region when the frame size changes
@@ -233,47 +687,61 @@ class ImageProcessorApp:
         setattr(self, f"{name}_canvas", canvas)
         setattr(self, f"{name}", frame)
 
-        # Add mousewheel scrolling to multiple widgets
-        def bind_mousewheel(widget):
-            widget.bind("<MouseWheel>", lambda event, c=canvas: self._on_mousewheel(event, c))
-            widget.bind("<Button-4>", lambda event, c=canvas: self._on_mousewheel_linux(event, c, -1))
-            widget.bind("<Button-5>", lambda event, c=canvas: self._on_mousewheel_linux(event, c, 1))
-
-        # Bind mousewheel to canvas and frame
-        bind_mousewheel(canvas)
-        bind_mousewheel(frame)
-
-        # Also bind to the parent and container for better coverage
-        bind_mousewheel(parent)
-        bind_mousewheel(container)
-
-        # Force an initial update of the scroll region
-        canvas.update_idletasks()
-        update_scrollregion()
-
-    def _on_mousewheel(self, event, canvas):
-        """Handle mousewheel scrolling on Windows with increased speed"""
-        # Scroll direction depends on delta value
-        # Increase scroll speed by multiplying the scroll units by 3
-        scroll_speed = 3
-        canvas.yview_scroll(int(-1 * (event.delta / 120) * scroll_speed), "units")
+        # Track the canvas under the pointer so the root-level wheel handler can route to it
+        canvas.bind("<Enter>", self._on_scroll_enter)
+        canvas.bind("<Leave>", self._on_scroll_leave)
+
+    def _on_scroll_enter(self, event):
+        """Remember the scrollable canvas the pointer moved into"""
+        self._scroll_target = event.widget
+
+    def _on_scroll_leave(self, event):
+        """Forget the scrollable canvas once the pointer is outside it"""
+        # Moving onto the controls inside the canvas also sends <Leave>
+        canvas = event.widget
+        if not (0 <= event.x < canvas.winfo_width() and 0 <= event.y < canvas.winfo_height()):
+            if self._scroll_target is canvas:
+                self._scroll_target = None
+
+    def _route_wheel(self, event):
+        """Scroll the control panel canvas under the pointer"""
+        widget = self._scroll_target
+        if widget is None:
+            return
 
-    def _on_mousewheel_linux(self, _, canvas, direction):
-        """Handle mousewheel scrolling on Linux/Mac with increased speed"""
         # Increase scroll speed by multiplying the scroll units by 3
         scroll_speed = 3
-        canvas.yview_scroll(direction * scroll_speed, "units")
+        if event.num == 4:
+            widget.yview_scroll(-scroll_speed, "units")
+        elif event.num == 5:
+            widget.yview_scroll(scroll_speed, "units")
+        elif event.delta:
+            widget.yview_scroll(int(-1 * (event.delta / 120) * scroll_speed), "units")
 
     def setup_keyboard_shortcuts(self):
         """Setup keyboard shortcuts for common operations"""
-        self.root.bind("<Control-o>", lambda _: self.load_image())
-        self.root.bind("<Control-s>", lambda _: self.save_image())
-        self.root.bind("<Control-z>", lambda _: self.undo())
-        self.root.bind("<Control-y>", lambda _: self.redo())
+        self.root.bind("<Control-o>", self.load_image)
+        self.root.bind("<Control-s>", self.save_image)
+        self.root.bind("<Control-z>", self.undo)
+        self.root.bind("<Control-y>", self.redo)
         self.root.bind("<Control-r>", lambda _: self.reset_adjustments())
 
     def create_button_styles(self):
         """Create custom button styles for a more modern look"""
+        # Precomputed pulse colors, keyed by base color; gradients are memoized by _interp_hex
+        self._pulse_cache = {}
+
+        def get_gradient(start_color, end_color):
+            return _interp_hex(start_color, end_color, 10)
+
+        def get_pulse_cycle(base_color):
+            if base_color not in self._pulse_cache:
+                # Brighten from 0.7 to 1.0, then dim back to 0.7
+                factors = [0.7 + 0.3 * (step / 10) for step in range(11)]
+                factors += [1.0 - 0.3 * (step / 10) for step in range(11)]
+                self._pulse_cache[base_color] = tuple(_scale_hex(base_color, f) for f in factors)
+            return self._pulse_cache[base_color]
+
         # Define a function to create modern-looking buttons with animations
         def create_modern_button(parent, text, command, width=15, bg=None, fg=None, icon=None, is_important=False, **kwargs):
             if bg is None:
@@ -297,13 +765,20 @@ class ImageProcessorApp:
             btn.highlight_bg = self.highlight_color
             btn.is_pulsing = False
 
+            # Hover gradients are computed once per color pair and shared between buttons
+            enter_gradient = get_gradient(btn.original_bg, btn.highlight_bg)
+            leave_gradient = get_gradient(btn.highlight_bg, btn.original_bg)
+
             # Add hover effect with smooth transition
             def on_enter(e):
-                # Start color transition animation
-                animate_color_transition(btn, btn.original_bg, btn.highlight_bg, steps=10)
+                # Start color transition animation, or jump straight to the end color
+                if self._animations_enabled:
+                    animate_color_transition(btn, enter_gradient)
+                else:
+                    btn.config(background=enter_gradient[-1])
 
                 # Scale effect (slight grow)
-                btn.config(font=(self.button_font['family'], self.button_font['size'] + 1, self.button_font['weight']))
+                btn.config(font=self.button_font_hover)
 
                 # If it's an important button, add a glow effect
                 if is_important:
@@ -311,7 +786,10 @@ class ImageProcessorApp:
 
             def on_leave(e):
                 # Reverse color transition animation
-                animate_color_transition(btn, btn.highlight_bg, btn.original_bg, steps=10)
+                if self._animations_enabled:
+                    animate_color_transition(btn, leave_gradient)
+                else:
+                    btn.config(background=leave_gradient[-1])
 
                 # Reset scale
                 btn.config(font=self.button_font)
@@ -319,71 +797,31 @@ class ImageProcessorApp:
                 # Reset frame
                 btn_frame.config(padx=1, pady=1, bg=self.border_color)
 
-            def animate_color_transition(widget, start_color, end_color, steps=10, current_step=0):
-                # Convert hex colors to RGB
-                start_r = int(start_color[1:3], 16)
-                start_g = int(start_color[3:5], 16)
-                start_b = int(start_color[5:7], 16)
-
-                end_r = int(end_color[1:3], 16)
-                end_g = int(end_color[3:5], 16)
-                end_b = int(end_color[5:7], 16)
-
-                # Calculate the color for the current step
-                if current_step <= steps:
-                    # Calculate the intermediate color
-                    r = start_r + int((end_r - start_r) * (current_step / steps))
-                    g = start_g + int((end_g - start_g) * (current_step / steps))
-                    b = start_b + int((end_b - start_b) * (current_step / steps))
+            def animate_color_transition(widget, gradient, step=0):
+                # Colors are precomputed, so each step is just an index into the table
+                widget.config(background=gradient[step])
 
-                    # Convert back to hex
-                    color = f"#{r:02x}{g:02x}{b:02x}"
-
-                    # Apply the color
-                    widget.config(background=color)
-
-                    # Schedule the next step
-                    if current_step < steps:
-                        widget.after(20, lambda: animate_color_transition(widget, start_color, end_color, steps, current_step + 1))
+                # Schedule the next step
+                if step < len(gradient) - 1:
+                    widget.after(20, lambda: animate_color_transition(widget, gradient, step + 1))
 
             # Add pulsing animation for important buttons
             def start_pulse_animation():
                 if is_important and not btn.is_pulsing:
                     btn.is_pulsing = True
-                    pulse_animation(btn)
+                    pulse_animation(btn, get_pulse_cycle(btn.original_bg))
 
-            def pulse_animation(widget, direction=1, step=0):
+            def pulse_animation(widget, cycle, step=0):
                 if not widget.is_pulsing:
                     return
 
-                # Pulse effect using opacity/brightness
-                if direction > 0:  # Getting brighter
-                    factor = 0.7 + (0.3 * (step / 10))  # 0.7 to 1.0
-                else:  # Getting dimmer
-                    factor = 1.0 - (0.3 * (step / 10))  # 1.0 to 0.7
-
-                # Adjust color brightness
-                r = int(int(widget.original_bg[1:3], 16) * factor)
-                g = int(int(widget.original_bg[3:5], 16) * factor)
-                b = int(int(widget.original_bg[5:7], 16) * factor)
-
-                # Ensure values are in valid range
-                r = min(255, max(0, r))
-                g = min(255, max(0, g))
-                b = min(255, max(0, b))
-
-                color = f"#{r:02x}{g:02x}{b:02x}"
-                widget.config(background=color)
-
-                # Continue animation
-                if step >= 10:
-                    # Reverse direction
-                    widget.after(50, lambda: pulse_animation(widget, -direction, 0))
-                else:
-                    widget.after(50, lambda: pulse_animation(widget, direction, step + 1))
+                widget.config(background=cycle[step])
+
+                # Continue animation, wrapping around the brighten/dim cycle
+                widget.after(50, lambda: pulse_animation(widget, cycle, (step + 1) % len(cycle)))
 
             # Start pulse for important buttons
-            if is_important:
+            if is_important and self._animations_enabled:
                 btn.after(1000, start_pulse_animation)
 
             # Bind events
@@ -394,6 +832,8 @@ class ImageProcessorApp:
             if icon:
                 btn.config(text=f"{icon} {text}")
 
+            # The frame is what callers lay out; expose the button for callers that change its state
+            btn_frame.button = btn
             return btn_frame
 
         # Store the function as an attribute for later use
@@ -417,7 +857,7 @@ class ImageProcessorApp:
                 # Add a label with the tooltip text
                 label = Label(self.tooltip, text=text, justify=tk.LEFT,
                              background="#ffffe0", relief=tk.SOLID, borderwidth=1,
-                             font=("Arial", "8", "normal"))
+                             font=self.tooltip_font)
                 label.pack(ipadx=3, ipady=2)
             except Exception:
                 # If we can't get the widget position, don't show the tooltip
@@ -439,110 +879,110 @@ class ImageProcessorApp:
     def setup_adjust_tab(self):
         """Setup the Adjust tab with brightness, contrast, saturation, and hue controls"""
         # Basic Adjustments Section
-        basic_section = Frame(self.adjust_frame, bg=self.bg_color)
+        basic_section = Frame(self.adjust_frame)
         basic_section.pack(fill=tk.X, padx=5, pady=5)
 
         # Section header
-        header = Label(basic_section, text="Basic Adjustments", font=self.header_font,
-                      bg=self.bg_color, fg=self.accent_color)
+        header = Label(basic_section, text="Basic Adjustments", font=self.header_font, fg=self.accent_color)
         header.pack(pady=10, anchor=tk.W)
 
         # Brightness control
-        brightness_frame = Frame(basic_section, bg=self.bg_color)
+        brightness_frame = Frame(basic_section)
         brightness_frame.pack(fill=tk.X, pady=5)
 
-        Label(brightness_frame, text="Brightness", font=self.normal_font,
-             bg=self.bg_color, fg=self.text_color).pack(anchor=tk.W)
+        Label(brightness_frame, text="Brightness").pack(anchor=tk.W)
 
         self.brightness_slider = Scale(
             brightness_frame, from_=-100, to=100, orient=tk.HORIZONTAL,
-            command=self.update_image, length=180, bg=self.bg_color,
+            variable=self.brightness_var, command=self._schedule_update, length=180, bg=self.bg_color,
             highlightthickness=0, troughcolor=self.highlight_color,
             activebackground=self.accent_color
         )
-        self.brightness_slider.set(0)
         self.brightness_slider.pack(fill=tk.X)
+        self.brightness_slider.bind("<ButtonPress-1>", self._start_drag)
+        self.brightness_slider.bind("<ButtonRelease-1>", self._commit_adjustments)
+        self.brightness_slider.bind("<KeyRelease>", self._commit_adjustments)
         self.create_tooltip(self.brightness_slider, "Adjust image brightness (-100 to +100)")
 
         # Contrast control
-        contrast_frame = Frame(basic_section, bg=self.bg_color)
+        contrast_frame = Frame(basic_section)
         contrast_frame.pack(fill=tk.X, pady=5)
 
-        Label(contrast_frame, text="Contrast", font=self.normal_font,
-             bg=self.bg_color, fg=self.text_color).pack(anchor=tk.W)
+        Label(contrast_frame, text="Contrast").pack(anchor=tk.W)
 
         self.contrast_slider = Scale(
-            contrast_frame, from_=0.1, to=3.0, orient=tk.HORIZONTAL,
-            command=self.update_image, resolution=0.1, length=180,
+            contrast_frame, from_=0.1, to=3.0, orient=tk.HORIZONTAL, variable=self.contrast_var,
+            command=self._schedule_update, resolution=0.1, length=180,
             bg=self.bg_color, highlightthickness=0,
             troughcolor=self.highlight_color, activebackground=self.accent_color
         )
-        self.contrast_slider.set(1.0)
         self.contrast_slider.pack(fill=tk.X)
+        self.contrast_slider.bind("<ButtonPress-1>", self._start_drag)
+        self.contrast_slider.bind("<ButtonRelease-1>", self._commit_adjustments)
+        self.contrast_slider.bind("<KeyRelease>", self._commit_adjustments)
         self.create_tooltip(self.contrast_slider, "Adjust image contrast (0.1 to 3.0)")
 
         # Color Adjustments Section
-        color_section = Frame(self.adjust_frame, bg=self.bg_color)
+        color_section = Frame(self.adjust_frame)
         color_section.pack(fill=tk.X, padx=5, pady=15)
 
         # Section header
-        color_header = Label(color_section, text="Color Adjustments", font=self.header_font,
-                           bg=self.bg_color, fg=self.accent_color)
+        color_header = Label(color_section, text="Color Adjustments", font=self.header_font, fg=self.accent_color)
         color_header.pack(pady=10, anchor=tk.W)
 
         # Saturation control
-        saturation_frame = Frame(color_section, bg=self.bg_color)
+        saturation_frame = Frame(color_section)
         saturation_frame.pack(fill=tk.X, pady=5)
 
-        Label(saturation_frame, text="Saturation", font=self.normal_font,
-             bg=self.bg_color, fg=self.text_color).pack(anchor=tk.W)
+        Label(saturation_frame, text="Saturation").pack(anchor=tk.W)
 
         self.saturation_slider = Scale(
-            saturation_frame, from_=0.0, to=2.0, orient=tk.HORIZONTAL,
-            command=self.update_image, resolution=0.1, length=180,
+            saturation_frame, from_=0.0, to=2.0, orient=tk.HORIZONTAL, variable=self.saturation_var,
+            command=self._schedule_update, resolution=0.1, length=180,
             bg=self.bg_color, highlightthickness=0,
             troughcolor=self.highlight_color, activebackground=self.accent_color
         )
-        self.saturation_slider.set(1.0)
         self.saturation_slider.pack(fill=tk.X)
+        self.saturation_slider.bind("<ButtonPress-1>", self._start_drag)
+        self.saturation_slider.bind("<ButtonRelease-1>", self._commit_adjustments)
+        self.saturation_slider.bind("<KeyRelease>", self._commit_adjustments)
         self.create_tooltip(self.saturation_slider, "Adjust color saturation (0.0 to 2.0)")
 
         # Hue control
-        hue_frame = Frame(color_section, bg=self.bg_color)
+        hue_frame = Frame(color_section)
         hue_frame.pack(fill=tk.X, pady=5)
 
-        Label(hue_frame, text="Hue Shift", font=self.normal_font,
-             bg=self.bg_color, fg=self.text_color).pack(anchor=tk.W)
+        Label(hue_frame, text="Hue Shift").pack(anchor=tk.W)
 
         self.hue_slider = Scale(
-            hue_frame, from_=0, to=360, orient=tk.HORIZONTAL,
-            command=self.update_image, length=180,
+            hue_frame, from_=0, to=360, orient=tk.HORIZONTAL, variable=self.hue_var,
+            command=self._schedule_update, length=180,
             bg=self.bg_color, highlightthickness=0,
             troughcolor=self.highlight_color, activebackground=self.accent_color
         )
-        self.hue_slider.set(0)
         self.hue_slider.pack(fill=tk.X)
+        self.hue_slider.bind("<ButtonPress-1>", self._start_drag)
+        self.hue_slider.bind("<ButtonRelease-1>", self._commit_adjustments)
+        self.hue_slider.bind("<KeyRelease>", self._commit_adjustments)
         self.create_tooltip(self.hue_slider, "Shift image hue (0° to 360°)")
 
     def setup_transform_tab(self):
         """Setup the Transform tab with rotation, flip, crop, and resize controls"""
         # Transformations Section
-        transform_section = Frame(self.transform_frame, bg=self.bg_color)
+        transform_section = Frame(self.transform_frame)
         transform_section.pack(fill=tk.X, padx=5, pady=5)
 
         # Section header
-        header = Label(transform_section, text="Transformations", font=self.header_font,
-                      bg=self.bg_color, fg=self.accent_color)
+        header = Label(transform_section, text="Transformations", font=self.header_font, fg=self.accent_color)
         header.pack(pady=10, anchor=tk.W)
 
         # Rotation buttons
-        rotation_frame = Frame(transform_section, bg=self.bg_color)
+        rotation_frame = Frame(transform_section)
         rotation_frame.pack(fill=tk.X, pady=10)
 
-        Label(rotation_frame, text="Rotation", font=self.subheader_font,
-             bg=self.bg_color, fg=self.text_color).pack(pady=5, anchor=tk.W)
+        Label(rotation_frame, text="Rotation", font=self.subheader_font).pack(pady=5, anchor=tk.W)
 
-        rotation_btns = Frame(rotation_frame, bg=self.bg_color)
+        rotation_btns = Frame(rotation_frame)
         rotation_btns.pack(fill=tk.X, pady=5)
 
         rotate_left = Button(rotation_btns, text="Rotate Left", command=lambda: self.rotate_image(-90),
@@ -558,13 +998,12 @@ class ImageProcessorApp:
         self.create_tooltip(rotate_right, "Rotate image 90° clockwise")
 
         # Flip buttons
-        flip_frame = Frame(transform_section, bg=self.bg_color)
+        flip_frame = Frame(transform_section)
         flip_frame.pack(fill=tk.X, pady=10)
 
-        Label(flip_frame, text="Flip", font=self.subheader_font,
-             bg=self.bg_color, fg=self.text_color).pack(pady=5, anchor=tk.W)
+        Label(flip_frame, text="Flip", font=self.subheader_font).pack(pady=5, anchor=tk.W)
 
-        flip_btns = Frame(flip_frame, bg=self.bg_color)
+        flip_btns = Frame(flip_frame)
         flip_btns.pack(fill=tk.X, pady=5)
 
         flip_h = Button(flip_btns, text="Flip Horiz", command=self.flip_horizontal,
@@ -580,11 +1019,10 @@ class ImageProcessorApp:
         self.create_tooltip(flip_v, "Flip image vertically")
 
         # Crop button
-        crop_frame = Frame(transform_section, bg=self.bg_color)
+        crop_frame = Frame(transform_section)
         crop_frame.pack(fill=tk.X, pady=10)
 
-        Label(crop_frame, text="Crop", font=self.subheader_font,
-             bg=self.bg_color, fg=self.text_color).pack(pady=5, anchor=tk.W)
+        Label(crop_frame, text="Crop", font=self.subheader_font).pack(pady=5, anchor=tk.W)
 
         crop_btn = Button(crop_frame, text="Toggle Crop Mode", command=self.toggle_crop_mode,
                          width=20, bg=self.bg_color, activebackground=self.highlight_color,
@@ -593,21 +1031,19 @@ class ImageProcessorApp:
         self.create_tooltip(crop_btn, "Click and drag on the image to select crop area")
 
         # Resize Section
-        resize_section = Frame(self.transform_frame, bg=self.bg_color)
+        resize_section = Frame(self.transform_frame)
         resize_section.pack(fill=tk.X, padx=5, pady=15)
 
         # Section header
-        resize_header = Label(resize_section, text="Resize", font=self.header_font,
-                            bg=self.bg_color, fg=self.accent_color)
+        resize_header = Label(resize_section, text="Resize", font=self.header_font, fg=self.accent_color)
         resize_header.pack(pady=10, anchor=tk.W)
 
         # Current size display
-        self.current_size_label = Label(resize_section, text="Current size: No image loaded",
-                                      font=self.normal_font, bg=self.bg_color, fg=self.text_color)
+        self.current_size_label = Label(resize_section, text="Current size: No image loaded")
         self.current_size_label.pack(pady=2, anchor=tk.W)
 
         # Resize method selection
-        method_frame = Frame(resize_section, bg=self.bg_color)
+        method_frame = Frame(resize_section)
         method_frame.pack(fill=tk.X, pady=5)
 
         self.resize_method = StringVar(value="pixels")
@@ -619,37 +1055,31 @@ class ImageProcessorApp:
                    bg=self.bg_color, font=self.normal_font).pack(side=tk.RIGHT, padx=10)
 
         # Pixel dimensions frame
-        self.pixel_frame = Frame(resize_section, bg=self.bg_color)
+        self.pixel_frame = Frame(resize_section)
         self.pixel_frame.pack(fill=tk.X, pady=5)
 
         # Width and height inputs
-        Label(self.pixel_frame, text="Width:", bg=self.bg_color,
-             fg=self.text_color, font=self.normal_font).pack(side=tk.LEFT, padx=2)
+        Label(self.pixel_frame, text="Width:").pack(side=tk.LEFT, padx=2)
         self.width_entry = Entry(self.pixel_frame, width=5, font=self.normal_font)
         self.width_entry.pack(side=tk.LEFT, padx=2)
-        Label(self.pixel_frame, text="px", bg=self.bg_color,
-             fg=self.text_color, font=self.normal_font).pack(side=tk.LEFT)
+        Label(self.pixel_frame, text="px").pack(side=tk.LEFT)
 
-        Label(self.pixel_frame, text="Height:", bg=self.bg_color,
-             fg=self.text_color, font=self.normal_font).pack(side=tk.LEFT, padx=2)
+        Label(self.pixel_frame, text="Height:").pack(side=tk.LEFT, padx=2)
         self.height_entry = Entry(self.pixel_frame, width=5, font=self.normal_font)
         self.height_entry.pack(side=tk.LEFT, padx=2)
-        Label(self.pixel_frame, text="px", bg=self.bg_color,
-             fg=self.text_color, font=self.normal_font).pack(side=tk.LEFT)
+        Label(self.pixel_frame, text="px").pack(side=tk.LEFT)
 
         # Percentage frame (hidden initially)
-        self.percentage_frame = Frame(resize_section, bg=self.bg_color)
+        self.percentage_frame = Frame(resize_section)
 
-        Label(self.percentage_frame, text="Scale:", bg=self.bg_color,
-             fg=self.text_color, font=self.normal_font).pack(side=tk.LEFT, padx=2)
+        Label(self.percentage_frame, text="Scale:").pack(side=tk.LEFT, padx=2)
         self.percentage_entry = Entry(self.percentage_frame, width=5, font=self.normal_font)
         self.percentage_entry.insert(0, "100")
         self.percentage_entry.pack(side=tk.LEFT, padx=2)
-        Label(self.percentage_frame, text="%", bg=self.bg_color,
-             fg=self.text_color, font=self.normal_font).pack(side=tk.LEFT)
+        Label(self.percentage_frame, text="%").pack(side=tk.LEFT)
 
         # Keep aspect ratio checkbox
-        aspect_frame = Frame(resize_section, bg=self.bg_color)
+        aspect_frame = Frame(resize_section)
         aspect_frame.pack(fill=tk.X, pady=5)
 
         self.keep_aspect_var = tk.BooleanVar(value=True)
@@ -661,19 +1091,17 @@ class ImageProcessorApp:
         self.create_tooltip(aspect_check, "Maintain original width-to-height ratio")
 
         # Preview info
-        info_frame = Frame(resize_section, bg=self.bg_color)
+        info_frame = Frame(resize_section)
         info_frame.pack(fill=tk.X, pady=5)
 
-        self.new_size_label = Label(info_frame, text="New size: -",
-                                  font=self.normal_font, bg=self.bg_color, fg=self.text_color)
+        self.new_size_label = Label(info_frame, text="New size: -")
         self.new_size_label.pack(pady=2, anchor=tk.W)
 
-        self.file_size_label = Label(info_frame, text="Estimated file size: -",
-                                   font=self.normal_font, bg=self.bg_color, fg=self.text_color)
+        self.file_size_label = Label(info_frame, text="Estimated file size: -")
         self.file_size_label.pack(pady=2, anchor=tk.W)
 
         # Buttons
-        button_frame = Frame(resize_section, bg=self.bg_color)
+        button_frame = Frame(resize_section)
         button_frame.pack(fill=tk.X, pady=10)
 
         preview_btn = Button(button_frame, text="Preview", command=self.preview_resize,
@@ -688,6 +1116,9 @@ class ImageProcessorApp:
         apply_btn.pack(side=tk.RIGHT, padx=5)
         self.create_tooltip(apply_btn, "Apply the resize to the image")
 
+        # Fill in the sizes if an image was loaded before this tab was built
+        self.update_resize_dimensions()
+
     # Filter tab has been removed
 
     # Filter-related methods have been removed
@@ -708,39 +1139,39 @@ class ImageProcessorApp:
             # Update the current filter
             self.current_filter.set(filter_name)
 
-            # Update the image with the new filter
-            self.update_image("force")
-
-            # Add to history for undo/redo
-            self.add_to_history()
-
-            # Update status bar
-            self.status_bar.config(text=f"Applied filter: {filter_name}")
+            # Render on the worker; a newer click supersedes this one, and history is added on completion
+            self.status_bar.config(text=f"Applying filter: {filter_name}...")
+            self._submit_render(
+                on_done=lambda: self.status_bar.config(text=f"Applied filter: {filter_name}"))
 
             # Update current filter label with a more user-friendly name
             filter_display_name = filter_name.replace("_", " ").title()
-            self.current_filter_label.config(text=f"Current Filter: {filter_display_name}")
+            self.current_filter_text.set(f"Current Filter: {filter_display_name}")
 
     def reset_filter(self):
         """Reset all filters"""
         if self.processed_image:
+            previous_filter = self.current_filter.get()
+
             # Reset filter to none
             self.current_filter.set("none")
 
             # Reset filter intensity
             self.filter_intensity.set(1.0)
 
-            # Update the image
-            self.update_image("force")
+            # Nothing to re-render or record when no filter was applied
+            if previous_filter != "none":
+                # Update the image
+                self.update_image("force", record=False)
 
-            # Add to history for undo/redo
-            self.add_to_history()
+                # Add to history for undo/redo
+                self.add_to_history()
 
             # Update status bar
             self.status_bar.config(text="Filters reset")
 
             # Update current filter label
-            self.current_filter_label.config(text="No filter selected")
+            self.current_filter_text.set("No filter selected")
 
     def toggle_compare_view(self):
         """Toggle between before and after view for filter comparison"""
@@ -748,49 +1179,84 @@ class ImageProcessorApp:
             return
 
         # Toggle the compare mode
-        self.compare_var.set(not self.compare_var.get())
+        self.compare_mode = not self.compare_mode
 
         # If compare mode is on, show split view
-        if self.compare_var.get():
+        if self.compare_mode:
             # Create a composite image with original on left, processed on right
             width, height = self.processed_image.size
+            original_src, processed_src = self.original_image, self.processed_image
+
+            # When the whole image fits the canvas, compose at the size display_image
+            # would shrink it to rather than at full resolution
+            ratio = 1.0
+            if self.zoom_factor <= 1.0:
+                ratio = min(1.0, 450 / max(width * self.zoom_factor, 1),
+                            500 / max(height * self.zoom_factor, 1))
+            if ratio < 1.0:
+                size = (max(1, int(width * ratio)), max(1, int(height * ratio)))
+                original_src = self._downscale(original_src, size)
+                processed_src = self._downscale(processed_src, size)
+                width, height = size
             split_point = width // 2
 
-            # Create a new image for the comparison
-            compare_img = Image.new('RGB', (width, height))
+            if NUMPY_AVAILABLE and ratio < 1.0:
+                # Both halves are already small and the same size
+                processed_arr = np.asarray(processed_src)
+                original_arr = np.asarray(original_src)
+            elif NUMPY_AVAILABLE and self._orig_arr is not None:
+                processed_arr = self._get_work_arr()
+                original_arr = self._orig_arr
+            else:
+                processed_arr = original_arr = None
 
-            # Paste original image on left half
-            left_half = self.original_image.crop((0, 0, split_point, height))
-            compare_img.paste(left_half, (0, 0))
+            font_size = max(10, height // 30)
+            if processed_arr is not None:
+                # Compose straight from the arrays: one uninitialized buffer and two slice copies
+                if original_arr.shape != processed_arr.shape:
+                    # Rotated, cropped or resized since loading; compare against a matching original
+                    original_arr = np.asarray(self.original_image.resize((width, height)), dtype=np.uint8)
+                buf = np.empty((height, width, 3), dtype=np.uint8)
+                buf[:, :split_point] = original_arr[:, :split_point]
+                buf[:, split_point:] = processed_arr[:, split_point:]
+
+                # Draw a dividing line
+                buf[:, max(0, split_point - 1):split_point + 1] = 255
+
+                # Blend the cached "Before" and "After" label masks straight into the buffer
+                self._blend_label(buf, "Before", font_size, 10, 10)
+                self._blend_label(buf, "After", font_size, split_point + 10, 10)
+                compare_img = Image.fromarray(buf)
+            else:
+                # Create a new image for the comparison
+                compare_img = Image.new('RGB', (width, height))
 
-            # Paste processed image on right half
-            right_half = self.processed_image.crop((split_point, 0, width, height))
-            compare_img.paste(right_half, (split_point, 0))
+                # Paste original image on left half
+                left_half = original_src.crop((0, 0, split_point, height))
+                compare_img.paste(left_half, (0, 0))
 
-            # Draw a dividing line
-            draw = ImageDraw.Draw(compare_img)
-            draw.line([(split_point, 0), (split_point, height)], fill=(255, 255, 255), width=2)
+                # Paste processed image on right half
+                right_half = processed_src.crop((split_point, 0, width, height))
+                compare_img.paste(right_half, (split_point, 0))
 
-            # Add labels
-            font_size = max(10, height // 30)
-            try:
-                from PIL import ImageFont
-                font = ImageFont.truetype("arial.ttf", font_size)
-            except IOError:
-                font = None
+                # Draw a dividing line
+                draw = ImageDraw.Draw(compare_img)
+                draw.line([(split_point, 0), (split_point, height)], fill=(255, 255, 255), width=2)
 
-            # Add "Before" and "After" labels
-            draw.text((10, 10), "Before", fill=(255, 255, 255), font=font)
-            draw.text((split_point + 10, 10), "After", fill=(255, 255, 255), font=font)
+                # Paste the pre-rendered "Before" and "After" labels through their alpha
+                before = self._get_label("Before", font_size)
+                after = self._get_label("After", font_size)
+                compare_img.paste(before, (10, 10), before)
+                compare_img.paste(after, (split_point + 10, 10), after)
 
             # Display the comparison image
-            self.display_image_object(compare_img)
+            self.display_image(compare_img, self.processed_canvas)
 
             # Update status bar
             self.status_bar.config(text="Compare mode: Before/After view")
         else:
             # Return to normal view
-            self.display_image()
+            self.display_image(self.processed_image, self.processed_canvas)
             self.status_bar.config(text="Normal view restored")
 
     def apply_filter_preset(self, preset):
@@ -798,33 +1264,85 @@ class ImageProcessorApp:
         if not self.processed_image:
             return
 
-        # Reset any current filter
+        # Start from the adjusted original without any single filter
         self.current_filter.set("none")
+        params = self._read_render_params()
+
+        # Run the chain on the worker so heavy presets don't freeze the window; like any
+        # background render, a newer render or preset supersedes it
+        future = self._executor.submit(self._run_preset, preset["filters"], params)
+        self._render_future = future
+        self._render_apply = lambda f: self._finish_preset(f, preset)
+        future.add_done_callback(lambda f: self.root.after(0, self._finish_render, f))
+
+        self.status_bar.config(text=f"Applying preset: {preset['name']}...")
+
+    def _run_preset(self, filters, params):
+        """Render the adjusted original and chain a preset's filters onto it; makes no Tk calls"""
+        img = self._render(params, "_worker_hue_out")
+
+        # Presets made only of local filters stream tiles through the whole chain
+        # at once; anything else is chained one filter at a time
+        fused = NUMPY_AVAILABLE and all(self._filter_halo(name, intensity, params) is not None
+                                        for name, intensity in filters)
+        # The input of each step is fully determined by the loaded image, the adjustments and
+        # the steps before it, so that is the key; no need to hash the pixels
+        done = (params["generation"], params["brightness"], params["contrast"],
+                params["saturation"], params["hue"])
+        for step in ([filters] if fused else [[f] for f in filters]):
+            done += tuple((name, round(intensity, 3)) for name, intensity in step)
+            # Every filter returns a new image and nothing draws into processed_image,
+            # so cached results can be shared by reference instead of copied
+            with self._filter_cache_lock:
+                cached = self._filter_cache.get(done)
+                if cached is not None:
+                    self._filter_cache.move_to_end(done)
+            if cached is not None:
+                img = cached
+                continue
+
+            if fused:
+                img = self._apply_preset_fused(img, step, params)
+            else:
+                img = self._apply_named_filter(img, step[0][0], step[0][1], params)
 
-        # Start with the original image
-        img = self.original_image.copy()
+            with self._filter_cache_lock:
+                if done not in self._filter_cache:
+                    self._filter_cache[done] = img
+                    self._filter_cache_bytes += self._image_bytes(img)
+                while self._filter_cache and self._filter_cache_bytes > self._filter_cache_max_bytes:
+                    _, evicted = self._filter_cache.popitem(last=False)
+                    self._filter_cache_bytes -= self._image_bytes(evicted)
 
-        # Apply each filter in the preset sequence
-        for filter_name, intensity in preset["filters"]:
-            # Set the current filter and intensity
-            self.current_filter.set(filter_name)
-            self.filter_intensity.set(intensity)
+        return img
 
-            # Apply this filter
-            self.update_image("force")
+    @staticmethod
+    def _image_bytes(img):
+        """Bytes of pixel data an image holds"""
+        return img.width * img.height * len(img.getbands())
+
+    def _finish_preset(self, future, preset):
+        """Show a finished preset and record it, or report why it failed"""
+        try:
+            img = future.result()
+        except Exception as e:
+            self._report_error(f"Failed to apply preset {preset['name']}: {str(e)}")
+            return
 
-            # Get the result for the next filter
-            img = self.processed_image.copy()
+        # Keep the controls showing the last step
+        filter_name, intensity = preset["filters"][-1]
+        self.current_filter.set(filter_name)
+        self.filter_intensity.set(intensity)
 
         # Update the display
         self.processed_image = img
-        self.display_image()
+        self.display_image(self.processed_image, self.processed_canvas)
 
         # Update status bar
         self.status_bar.config(text=f"Applied preset: {preset['name']}")
 
         # Update current filter label
-        self.current_filter_label.config(text=f"Preset: {preset['name']}")
+        self.current_filter_text.set(f"Preset: {preset['name']}")
 
         # Add to history
         self.add_to_history()
@@ -856,65 +1374,132 @@ class ImageProcessorApp:
     def update_filter_intensity(self, *_):
         """Update the filter intensity"""
         if self.processed_image and self.current_filter.get() != "none":
-            # Update the image with the new intensity
-            self.update_image("force")
+            if self._is_dragging:
+                if self.current_filter.get() in _SCALE_INVARIANT_FILTERS:
+                    # Filter the canvas-sized proxy while the slider is held; release renders full size
+                    self._filter_proxy_preview()
+                else:
+                    # Spatial filters would look several times stronger on the proxy, so render
+                    # them full size on the worker, letting them trade exactness for speed;
+                    # release renders exactly and records the history entry
+                    self._submit_render(add_history=False, fast=True)
+                return
 
-            # Add to history for undo/redo
-            self.add_to_history()
+            # Render the new intensity on the worker so heavy filters don't freeze the UI;
+            # a newer intensity supersedes it, and one history entry is recorded once it settles
+            self._submit_render(on_done=self._schedule_history, add_history=False)
+
+    def _schedule_intensity_update(self, *_):
+        """Coalesce filter intensity slider ticks into one update every 30 ms"""
+        if self._intensity_after_id is not None:
+            self.root.after_cancel(self._intensity_after_id)
+        self._intensity_after_id = self.root.after(30, self._do_intensity_update)
+
+    def _do_intensity_update(self):
+        """Run the debounced filter intensity update"""
+        self._intensity_after_id = None
+        self.update_filter_intensity()
+
+    def _filter_proxy_preview(self):
+        """Preview the current filter on the thumbnail without touching processed_image"""
+        params = self._read_render_params()
+        # Zoomed views show full-resolution detail, so only the fit-to-canvas view can use the proxy
+        if self.zoom_factor == 1.0:
+            params["source"] = self._preview_src
+            # Throwaway thumbnail renders stay out of the caches, which hold full-size results
+            img = self._render(params, "_proxy_hue_out", use_cache=False)
+        else:
+            img = self._render(params)
+        self.display_image(img, self.processed_canvas)
+
+    def _commit_filter_intensity(self, event=None):
+        """Render the filter at full resolution once the intensity slider is released"""
+        self._is_dragging = False
+        if self._intensity_after_id is not None:
+            self.root.after_cancel(self._intensity_after_id)
+            self._intensity_after_id = None
+        self.update_filter_intensity()
+
+    def _schedule_history(self):
+        """Add to history after a short pause, restarting the wait on every call"""
+        if self._history_after_id is not None:
+            self.root.after_cancel(self._history_after_id)
+        # Remember the image now; a later edit may replace processed_image before the wait ends
+        self._history_pending = self.processed_image
+        self._history_after_id = self.root.after(300, self._flush_history)
+
+    def _flush_history(self):
+        """Record a pending debounced history entry now"""
+        if self._history_after_id is not None:
+            self.root.after_cancel(self._history_after_id)
+            self._history_after_id = None
+            pending, self._history_pending = self._history_pending, None
+            self._record_history(pending)
 
     def apply_histogram_eq(self):
         """Apply histogram equalization to the image"""
         if self.processed_image:
-            try:
-                # Apply histogram equalization with default intensity
-                intensity = 1.0  # Full effect
-                self.processed_image = apply_histogram_equalization(self.processed_image, intensity)
-
-                # Update the display
-                self.update_display_image()
-
-                # Add to history
-                self.add_to_history()
-
-                # Update UI
-                self.histogram_eq_var.set(True)
-                self.status_bar.config(text="Applied histogram equalization")
-            except Exception as e:
-                # Show detailed error message
-                error_msg = f"Failed to apply histogram equalization: {str(e)}"
-                print(error_msg)  # Print to console for debugging
-                messagebox.showerror("Error", error_msg)
+            # Apply histogram equalization with default intensity (full effect)
+            self._submit_effect(lambda img: apply_histogram_equalization(img, 1.0),
+                                "Applied histogram equalization",
+                                "Failed to apply histogram equalization",
+                                on_done=lambda: setattr(self, "histogram_eq_applied", True))
 
     def apply_sepia(self):
         """Apply sepia tone effect to the image"""
         if self.processed_image:
-            try:
-                # Apply sepia tone
-                self.processed_image = apply_sepia(self.processed_image)
+            self._submit_effect(apply_sepia, "Applied sepia tone effect", "Failed to apply sepia tone")
+
+    def _submit_effect(self, effect, done_text, error_text, on_done=None):
+        """Run an effect on processed_image on the worker thread, keeping the window responsive"""
+        future = self._executor.submit(effect, self.processed_image)
+        self._render_future = future
+        self._render_apply = lambda f: self._finish_effect(f, done_text, error_text, on_done)
+        future.add_done_callback(lambda f: self.root.after(0, self._finish_render, f))
+
+        # Buttons come back whether the effect is applied or superseded by a newer render
+        self._set_effect_buttons(tk.DISABLED)
+        future.add_done_callback(lambda f: self.root.after(0, self._set_effect_buttons, tk.NORMAL))
+        self.status_bar.config(text="Applying effect...")
+
+    def _finish_effect(self, future, done_text, error_text, on_done):
+        """Show a finished effect and record it, or report why it failed"""
+        try:
+            self.processed_image = future.result()
+        except Exception as e:
+            self._report_error(f"{error_text}: {str(e)}")
+            return
 
-                # Update the display
-                self.update_display_image()
+        # Update the display
+        self.update_display_image()
 
-                # Add to history
-                self.add_to_history()
-                self.status_bar.config(text="Applied sepia tone effect")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to apply sepia tone: {str(e)}")
+        # Add to history
+        self.add_to_history()
+
+        # Update UI
+        if on_done is not None:
+            on_done()
+        self.status_bar.config(text=done_text)
+
+    def _set_effect_buttons(self, state):
+        """Enable or disable the special effect buttons"""
+        for button in self._effect_buttons:
+            button.config(state=state)
 
     def setup_special_effects(self):
         """Setup special effects section"""
         # Special effects section
-        effects_frame = Frame(self.filter_frame, bg=self.bg_color)
+        effects_frame = Frame(self.filter_frame)
         effects_frame.pack(fill=tk.X, pady=10, padx=5)
 
-        Label(effects_frame, text="Special Effects", font=self.subheader_font,
-             bg=self.bg_color, fg=self.text_color).pack(pady=5, anchor=tk.W)
+        Label(effects_frame, text="Special Effects", font=self.subheader_font).pack(pady=5, anchor=tk.W)
 
         # Histogram equalization button
         hist_btn = self.create_modern_button(effects_frame, text="Histogram Equalization",
                                           command=self.apply_histogram_eq, width=20,
                                           bg=self.secondary_color)
         hist_btn.pack(pady=5)
+        self._effect_buttons.append(hist_btn.button)
         self.create_tooltip(hist_btn, "Enhance contrast by equalizing the image histogram")
 
         # Sepia button
@@ -922,36 +1507,270 @@ class ImageProcessorApp:
                                           command=self.apply_sepia, width=20,
                                           bg=self.secondary_color)
         sepia_btn.pack(pady=5)
+        self._effect_buttons.append(sepia_btn.button)
         self.create_tooltip(sepia_btn, "Apply a vintage sepia tone effect")
 
+    def _card_state_widgets(self, widget, found=None):
+        """Collect the ttk widgets of a filter card, the card itself included"""
+        found = [] if found is None else found
+        if isinstance(widget, ttk.Widget):
+            found.append(widget)
+        for child in widget.winfo_children():
+            self._card_state_widgets(child, found)
+        return found
+
+    def _set_card_state(self, card, statespec):
+        """Set a ttk state on a filter card and everything inside it"""
+        # Cards are fully built before they can be hovered, so walk the tree once per card
+        widgets = self._card_widgets.get(str(card))
+        if widgets is None:
+            widgets = self._card_widgets[str(card)] = self._card_state_widgets(card)
+        for widget in widgets:
+            widget.state(statespec)
+
+    def _on_card_enter(self, event):
+        """Highlight the filter card under the pointer"""
+        self._set_card_state(event.widget, ["active"])
+
+    def _on_card_leave(self, event):
+        """Clear a filter card's highlight once the pointer is outside it"""
+        # Moving onto one of the card's own children also sends <Leave> to the card
+        card = str(event.widget)
+        hovered = str(event.widget.tk.call("winfo", "containing", event.x_root, event.y_root))
+        if hovered == card or hovered.startswith(card + "."):
+            return
+        self._set_card_state(event.widget, ["!active"])
+
+    def _build_pending_sub_filters(self, sub_frame):
+        """Create a category's sub-filter cards if they haven't been built yet"""
+        pending = self._pending_sub_filters.pop(str(sub_frame), None)
+        if pending is not None:
+            build, sub_filters = pending
+            build(sub_frame, sub_filters)
+
+    def _build_basic_sub_filters(self, sub_frame, sub_filters):
+        """Create the basic sub-filter cards inside a category's sub-frame"""
+        for i, filter_info in enumerate(sub_filters):
+            sub_col = i % 2
+            sub_row = i // 2
+
+            # Create a frame for the sub-filter with enhanced styling
+            filter_frame = ttk.Frame(sub_frame, class_="FilterCard", style="FilterCard.TFrame",
+                                     padding=3, borderwidth=1, relief=tk.RAISED)
+            filter_frame.grid(row=sub_row, column=sub_col, padx=2, pady=2, sticky="nsew", ipadx=2, ipady=2)
+
+            # Add a subtle colored indicator on the left side
+            indicator = Frame(filter_frame, width=3, bg=self.secondary_color)
+            indicator.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 3))
+
+            # Create a container for the filter content
+            content_container = ttk.Frame(filter_frame, style="FilterCard.TFrame")
+            content_container.pack(fill=tk.BOTH, expand=True)
+
+            # Filter icon (size 16)
+            sub_icon_label = ttk.Label(content_container, text=filter_info["icon"], font=self.emoji_font,
+                                       style="FilterCard.TLabel", foreground=self.accent_color)
+            sub_icon_label.pack(pady=(2, 0))
+
+            # Filter name
+            sub_name_label = ttk.Label(content_container, text=filter_info["display"], font=self.normal_font,
+                                       style="FilterCard.TLabel", foreground=self.text_color)
+            sub_name_label.pack(pady=(0, 2))
+
+            # Make the whole frame clickable to apply filter
+            self._bind_filter_click(filter_info["name"], filter_frame, sub_icon_label, sub_name_label)
+
+    def _build_advanced_sub_filters(self, sub_frame, sub_filters):
+        """Create the advanced sub-filter cards inside a category's sub-frame"""
+        for i, filter_info in enumerate(sub_filters):
+            sub_col = i % 2
+            sub_row = i // 2
+
+            # Create a frame for the sub-filter
+            filter_frame = ttk.Frame(sub_frame, class_="FilterCard", style="FilterCard.TFrame",
+                                     padding=3, borderwidth=1, relief=tk.RAISED)
+            filter_frame.grid(row=sub_row, column=sub_col, padx=1, pady=1, sticky="nsew", ipadx=1, ipady=1)
+
+            # Filter icon (size 16)
+            sub_icon_label = ttk.Label(filter_frame, text=filter_info["icon"], font=self.emoji_font,
+                                       style="FilterCard.TLabel", foreground=self.accent_color)
+            sub_icon_label.pack(pady=0)
+
+            # Filter name
+            sub_name_label = ttk.Label(filter_frame, text=filter_info["display"], font=self.normal_font,
+                                       style="FilterCard.TLabel", foreground=self.text_color)
+            sub_name_label.pack(pady=0)
+
+            # Make the whole frame clickable to apply filter
+            self._bind_filter_click(filter_info["name"], filter_frame, sub_icon_label, sub_name_label)
+
+    def _build_category_cards(self, section, grid, categories, accent, hover_accent, border_style):
+        """Create a section's collapsible category cards, each with a description card per sub-filter"""
+        row = 0
+        for category_key, category_info in categories.items():
+            # Create a frame for the category (ultra-compact size with shadow effect)
+            # Create shadow frame first (positioned slightly offset)
+            shadow_frame = Frame(grid, bg=self.shadow_color, padx=3, pady=3, bd=0)
+            shadow_frame.grid(row=row, column=0, columnspan=2, padx=1, pady=1, sticky="nsew")
+
+            # Create actual category frame on top of shadow
+            category_frame = ttk.Frame(grid, class_="FilterCard", style="FilterCard.TFrame",
+                                       padding=3, borderwidth=1, relief=tk.RAISED)
+            category_frame.grid(row=row, column=0, columnspan=2, padx=1, pady=1, sticky="nsew", ipadx=1, ipady=1)
+
+            # Add a colored border on the left side for visual interest (thinner)
+            left_border = ttk.Frame(category_frame, width=2, style=border_style)
+            left_border.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 5))
+
+            # Create content frame
+            content_frame = ttk.Frame(category_frame, style="FilterCard.TFrame")
+            content_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+            # Category icon (size 16)
+            icon_label = ttk.Label(content_frame, text=category_info["icon"], font=self.emoji_font,
+                                   style="FilterCard.TLabel", foreground=accent)
+            icon_label.pack(side=tk.LEFT, padx=(0, 5))
+
+            # Category name
+            name_label = ttk.Label(content_frame, text=category_info["display"], font=self.bold_font,
+                                   style="FilterCard.TLabel", foreground=self.text_color)
+            name_label.pack(side=tk.LEFT, pady=2)
+
+            # Create a frame for sub-filters (initially hidden)
+            sub_frame = Frame(grid)
+            sub_frame.grid(row=row+1, column=0, columnspan=2, sticky="nsew")
+            sub_frame.grid_remove()  # Hide initially
+            self._sub_filter_sections[section][category_key] = sub_frame
+
+            # Sub-filter cards are built the first time the category is opened
+            build = partial(self._build_described_sub_filters, accent=accent,
+                            hover_accent=hover_accent, border_style=border_style)
+            self._pending_sub_filters[str(sub_frame)] = (build, category_info["sub_filters"])
+
+            # Make the category frame clickable to toggle sub-filters
+            self._bind_category_click(section, category_key, category_frame, content_frame,
+                                      icon_label, name_label)
+
+            row += 2  # Increment row for next category (including space for sub-filters)
+
+    def _add_bindtag(self, widget, tag):
+        """Insert a shared binding tag right after the widget's own tag"""
+        tags = widget.bindtags()
+        widget.bindtags((tags[0], tag) + tags[1:])
+
+    def _bind_category_click(self, section, key, *widgets):
+        """Make widgets toggle a category's sub-filters through the shared click handler"""
+        for widget in widgets:
+            self._category_by_widget[str(widget)] = (section, key)
+            self._add_bindtag(widget, "CategoryClick")
+
+    def _on_category_click(self, event):
+        """Toggle the sub-filters of the category card that was clicked"""
+        section, key = self._category_by_widget[str(event.widget)]
+        self._toggle_sub_filters(section, key)
+
+    def _bind_filter_click(self, filter_name, *widgets):
+        """Make widgets apply a filter through the shared click handler"""
+        for widget in widgets:
+            self._filter_name_by_widget[str(widget)] = filter_name
+            self._add_bindtag(widget, "FilterClick")
+
+    def _on_filter_click(self, event):
+        """Apply the filter of the sub-filter card that was clicked"""
+        self.apply_filter(self._filter_name_by_widget[str(event.widget)])
+
+    def _toggle_sub_filters(self, section, key):
+        """Show one category's sub-filters and hide the rest of its section"""
+        sub_frame = self._sub_filter_sections[section][key]
+        # At most one sub-frame per section is open, so only that one needs hiding
+        visible = self._visible_sub.get(section)
+        if visible is not None:
+            visible.grid_remove()
+        if visible is sub_frame:
+            self._visible_sub[section] = None
+        else:
+            self._build_pending_sub_filters(sub_frame)
+            sub_frame.grid()
+            self._visible_sub[section] = sub_frame
+
+    def _build_described_sub_filters(self, sub_frame, sub_filters, accent, hover_accent, border_style):
+        """Create sub-filter cards with a description and an Apply button inside a category's sub-frame"""
+        for i, filter_info in enumerate(sub_filters):
+            sub_col = i % 2
+            sub_row = i // 2
+
+            # Create a frame for the sub-filter
+            filter_frame = ttk.Frame(sub_frame, class_="FilterCard", style="FilterCard.TFrame", padding=4)
+            filter_frame.grid(row=sub_row, column=sub_col, padx=2, pady=2, sticky="nsew")
+
+            # Add a colored border on the left side for visual interest (thinner)
+            sub_left_border = ttk.Frame(filter_frame, width=2, style=border_style)
+            sub_left_border.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 5))
+
+            # Create content frame
+            sub_content_frame = ttk.Frame(filter_frame, style="FilterCard.TFrame")
+            sub_content_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+            # Create top frame for icon and name
+            top_frame = ttk.Frame(sub_content_frame, style="FilterCard.TFrame")
+            top_frame.pack(fill=tk.X, anchor=tk.W)
+
+            # Filter icon (size 16)
+            sub_icon_label = ttk.Label(top_frame, text=filter_info["icon"], font=self.emoji_font,
+                                       style="FilterCard.TLabel", foreground=accent)
+            sub_icon_label.pack(side=tk.LEFT, padx=(0, 5))
+
+            # Filter name
+            sub_name_label = ttk.Label(top_frame, text=filter_info["display"], font=self.normal_font,
+                                       style="FilterCard.TLabel", foreground=self.text_color)
+            sub_name_label.pack(side=tk.LEFT)
+
+            # Filter description
+            desc_label = ttk.Label(sub_content_frame, text=filter_info["desc"], font=self.normal_font,
+                                   style="FilterCard.TLabel", foreground=self.text_color,
+                                   wraplength=120, justify=tk.LEFT)
+            desc_label.pack(fill=tk.X, pady=(2, 5), anchor=tk.W)
+
+            # Apply button
+            apply_btn = Button(sub_content_frame, text="Apply", font=self.button_font,
+                             bg=accent, fg="white", bd=0, padx=10, pady=2,
+                             activebackground=hover_accent, activeforeground="white",
+                             command=lambda name=filter_info["name"]: self.apply_filter(name))
+            apply_btn.pack(anchor=tk.W)
+
+            # Make the rest of the card clickable to apply filter
+            self._bind_filter_click(filter_info["name"], filter_frame, sub_icon_label,
+                                    sub_name_label, desc_label)
+
     def setup_filter_tab(self):
         """Setup the Filter tab with various image filters"""
-        # Create variables for selected filter
-        self.current_filter = StringVar(value="none")
-        self.filter_intensity = DoubleVar(value=1.0)
-
         # No scroll hint needed
 
+        # Every card is created with the FilterCard class, so one pair of handlers covers them all
+        self.root.bind_class("FilterCard", "<Enter>", self._on_card_enter)
+        self.root.bind_class("FilterCard", "<Leave>", self._on_card_leave)
+        # Card clicks are bound once on shared tags; the handlers look up the widget path
+        self.root.bind_class("CategoryClick", "<Button-1>", self._on_category_click)
+        self.root.bind_class("FilterClick", "<Button-1>", self._on_filter_click)
+
         # Basic Filters Section with enhanced styling
-        basic_section = Frame(self.filter_frame, bg=self.bg_color)
+        basic_section = Frame(self.filter_frame)
         basic_section.pack(fill=tk.X, padx=5, pady=5)
 
         # Create a decorative header with icon
-        basic_header_frame = Frame(basic_section, bg=self.bg_color)
+        basic_header_frame = Frame(basic_section)
         basic_header_frame.pack(fill=tk.X, pady=5)
 
         # Add decorative icon (size 16)
-        basic_icon = Label(basic_header_frame, text="🔍", font=("Segoe UI Emoji", 16),
-                          bg=self.bg_color, fg=self.accent_color)
+        basic_icon = Label(basic_header_frame, text="🔍", font=self.emoji_font, fg=self.accent_color)
         basic_icon.pack(side=tk.LEFT, padx=(0, 10))
 
         # Section header
-        basic_header = Label(basic_header_frame, text="Basic Filters", font=("Segoe UI", 10, "bold"),
-                           bg=self.bg_color, fg=self.accent_color)
+        basic_header = Label(basic_header_frame, text="Basic Filters", font=self.bold_font, fg=self.accent_color)
         basic_header.pack(side=tk.LEFT, pady=10)
 
         # Create a grid for basic filter buttons
-        basic_grid = Frame(basic_section, bg=self.bg_color)
+        basic_grid = Frame(basic_section)
         basic_grid.pack(fill=tk.X, pady=5)
 
         # Define main filter categories with their sub-filters
@@ -977,7 +1796,7 @@ class ImageProcessorApp:
         }
 
         # Create main category buttons in a grid
-        self.sub_filter_frames = {}
+        self.sub_filter_frames = self._sub_filter_sections["basic"] = {}
         row = 0
         for category_key, category_info in self.filter_categories.items():
             # Create a frame for the category with enhanced visual appeal
@@ -986,7 +1805,8 @@ class ImageProcessorApp:
             shadow_frame.grid(row=row, column=0, columnspan=2, padx=1, pady=1, sticky="nsew")
 
             # Create actual category frame on top of shadow with gradient-like effect
-            category_frame = Frame(basic_grid, bg=self.card_bg, padx=5, pady=5, bd=1, relief=tk.RAISED)
+            category_frame = ttk.Frame(basic_grid, class_="FilterCard", style="FilterCard.TFrame",
+                                       padding=5, borderwidth=1, relief=tk.RAISED)
             category_frame.grid(row=row, column=0, columnspan=2, padx=1, pady=1, sticky="nsew", ipadx=2, ipady=2)
 
             # Add a colored accent bar for visual interest
@@ -994,119 +1814,46 @@ class ImageProcessorApp:
             accent_bar.pack(fill=tk.X, pady=(0, 5))
 
             # Category icon (smaller size)
-            icon_label = Label(category_frame, text=category_info["icon"], font=("Segoe UI Emoji", 4),
-                             bg=self.card_bg, fg=self.accent_color)
+            icon_label = ttk.Label(category_frame, text=category_info["icon"], font=self.small_emoji_font,
+                                   style="FilterCard.TLabel", foreground=self.accent_color)
             icon_label.pack(side=tk.LEFT, padx=(5, 10))
 
             # Category name
-            name_label = Label(category_frame, text=category_info["display"], font=self.subheader_font,
-                             bg=self.card_bg, fg=self.text_color)
+            name_label = ttk.Label(category_frame, text=category_info["display"], font=self.subheader_font,
+                                   style="FilterCard.TLabel", foreground=self.text_color)
             name_label.pack(side=tk.LEFT, pady=2)
 
             # Create a frame for sub-filters (initially hidden)
-            sub_frame = Frame(basic_grid, bg=self.bg_color)
+            sub_frame = Frame(basic_grid)
             sub_frame.grid(row=row+1, column=0, columnspan=2, sticky="nsew")
             sub_frame.grid_remove()  # Hide initially
             self.sub_filter_frames[category_key] = sub_frame
 
-            # Create sub-filter buttons
-            for i, filter_info in enumerate(category_info["sub_filters"]):
-                sub_col = i % 2
-                sub_row = i // 2
-
-                # Create a frame for the sub-filter with enhanced styling
-                filter_frame = Frame(sub_frame, bg=self.card_bg, padx=3, pady=3, bd=1, relief=tk.RAISED)
-                filter_frame.grid(row=sub_row, column=sub_col, padx=2, pady=2, sticky="nsew", ipadx=2, ipady=2)
-
-                # Add a subtle colored indicator on the left side
-                indicator = Frame(filter_frame, width=3, bg=self.secondary_color)
-                indicator.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 3))
-
-                # Create a container for the filter content
-                content_container = Frame(filter_frame, bg=self.card_bg)
-                content_container.pack(fill=tk.BOTH, expand=True)
-
-                # Filter icon (size 16)
-                sub_icon_label = Label(content_container, text=filter_info["icon"], font=("Segoe UI Emoji", 16),
-                                 bg=self.card_bg, fg=self.accent_color)
-                sub_icon_label.pack(pady=(2, 0))
-
-                # Filter name
-                sub_name_label = Label(content_container, text=filter_info["display"], font=self.normal_font,
-                                 bg=self.card_bg, fg=self.text_color)
-                sub_name_label.pack(pady=(0, 2))
-
-                # Make the whole frame clickable to apply filter
-                filter_frame.bind("<Button-1>", lambda e, f=filter_info["name"]: self.apply_filter(f))
-                sub_icon_label.bind("<Button-1>", lambda e, f=filter_info["name"]: self.apply_filter(f))
-                sub_name_label.bind("<Button-1>", lambda e, f=filter_info["name"]: self.apply_filter(f))
-
-                # Hover effect for sub-filter
-                def on_enter_sub(e, frame=filter_frame):
-                    frame.config(bg=self.highlight_color)
-                    for widget in frame.winfo_children():
-                        widget.config(bg=self.highlight_color)
-
-                def on_leave_sub(e, frame=filter_frame):
-                    frame.config(bg=self.card_bg)
-                    for widget in frame.winfo_children():
-                        widget.config(bg=self.card_bg)
-
-                filter_frame.bind("<Enter>", on_enter_sub)
-                filter_frame.bind("<Leave>", on_leave_sub)
+            # Sub-filter cards are built the first time the category is opened
+            self._pending_sub_filters[str(sub_frame)] = (self._build_basic_sub_filters,
+                                                        category_info["sub_filters"])
 
             # Make the category frame clickable to toggle sub-filters
-            def toggle_sub_filters(e, key=category_key):
-                sub_frame = self.sub_filter_frames[key]
-                if sub_frame.winfo_ismapped():
-                    sub_frame.grid_remove()
-                else:
-                    # Hide all other sub-filter frames first
-                    for k, frame in self.sub_filter_frames.items():
-                        if k != key:
-                            frame.grid_remove()
-                    sub_frame.grid()
-
-            category_frame.bind("<Button-1>", toggle_sub_filters)
-            icon_label.bind("<Button-1>", toggle_sub_filters)
-            name_label.bind("<Button-1>", toggle_sub_filters)
-
-            # Hover effect for category
-            def on_enter(e, frame=category_frame):
-                frame.config(bg=self.highlight_color)
-                for widget in frame.winfo_children():
-                    widget.config(bg=self.highlight_color)
-
-            def on_leave(e, frame=category_frame):
-                frame.config(bg=self.card_bg)
-                for widget in frame.winfo_children():
-                    widget.config(bg=self.card_bg)
-
-            category_frame.bind("<Enter>", on_enter)
-            category_frame.bind("<Leave>", on_leave)
+            self._bind_category_click("basic", category_key, category_frame,
+                                      icon_label, name_label)
 
             row += 2  # Increment row for next category (including space for sub-filters)
-            icon_label.bind("<Enter>", on_enter)
-            icon_label.bind("<Leave>", on_leave)
-            name_label.bind("<Enter>", on_enter)
-            name_label.bind("<Leave>", on_leave)
 
         # Advanced Filters Section
-        advanced_section = Frame(self.filter_frame, bg=self.bg_color)
+        advanced_section = Frame(self.filter_frame)
         advanced_section.pack(fill=tk.X, padx=5, pady=15)
 
         # Create a decorative header with icon
-        advanced_header_frame = Frame(advanced_section, bg=self.bg_color)
+        advanced_header_frame = Frame(advanced_section)
         advanced_header_frame.pack(fill=tk.X, pady=5)
 
         # Add decorative icon (size 16)
-        advanced_icon = Label(advanced_header_frame, text="⚙️", font=("Segoe UI Emoji", 16),
-                          bg=self.bg_color, fg=self.accent_color)
+        advanced_icon = Label(advanced_header_frame, text="⚙️", font=self.emoji_font, fg=self.accent_color)
         advanced_icon.pack(side=tk.LEFT, padx=(0, 10))
 
         # Section header
-        advanced_header = Label(advanced_header_frame, text="Advanced Filters", font=("Segoe UI", 10, "bold"),
-                              bg=self.bg_color, fg=self.accent_color)
+        advanced_header = Label(advanced_header_frame, text="Advanced Filters",
+                                font=self.bold_font, fg=self.accent_color)
         advanced_header.pack(side=tk.LEFT, pady=10)
 
         # Define advanced filter categories with their sub-filters
@@ -1132,11 +1879,11 @@ class ImageProcessorApp:
         }
 
         # Create a grid for advanced filter buttons
-        advanced_grid = Frame(advanced_section, bg=self.bg_color)
+        advanced_grid = Frame(advanced_section)
         advanced_grid.pack(fill=tk.X, pady=5)
 
         # Create main category buttons in a grid
-        self.advanced_sub_filter_frames = {}
+        self.advanced_sub_filter_frames = self._sub_filter_sections["advanced"] = {}
         row = 0
         for category_key, category_info in self.advanced_filter_categories.items():
             # Create a frame for the category (ultra-compact size with shadow effect)
@@ -1145,119 +1892,51 @@ class ImageProcessorApp:
             shadow_frame.grid(row=row, column=0, columnspan=2, padx=1, pady=1, sticky="nsew")
 
             # Create actual category frame on top of shadow
-            category_frame = Frame(advanced_grid, bg=self.card_bg, padx=3, pady=3, bd=1, relief=tk.RAISED)
+            category_frame = ttk.Frame(advanced_grid, class_="FilterCard", style="FilterCard.TFrame",
+                                       padding=3, borderwidth=1, relief=tk.RAISED)
             category_frame.grid(row=row, column=0, columnspan=2, padx=1, pady=1, sticky="nsew", ipadx=1, ipady=1)
 
             # Category icon (size 16)
-            icon_label = Label(category_frame, text=category_info["icon"], font=("Segoe UI Emoji", 16),
-                             bg=self.card_bg, fg=self.accent_color)
+            icon_label = ttk.Label(category_frame, text=category_info["icon"], font=self.emoji_font,
+                                   style="FilterCard.TLabel", foreground=self.accent_color)
             icon_label.pack(side=tk.LEFT, padx=(5, 10))
 
             # Category name
-            name_label = Label(category_frame, text=category_info["display"], font=("Segoe UI", 10, "bold"),
-                             bg=self.card_bg, fg=self.text_color)
+            name_label = ttk.Label(category_frame, text=category_info["display"], font=self.bold_font,
+                                   style="FilterCard.TLabel", foreground=self.text_color)
             name_label.pack(side=tk.LEFT, pady=2)
 
             # Create a frame for sub-filters (initially hidden)
-            sub_frame = Frame(advanced_grid, bg=self.bg_color)
+            sub_frame = Frame(advanced_grid)
             sub_frame.grid(row=row+1, column=0, columnspan=2, sticky="nsew")
             sub_frame.grid_remove()  # Hide initially
             self.advanced_sub_filter_frames[category_key] = sub_frame
 
-            # Create sub-filter buttons
-            for i, filter_info in enumerate(category_info["sub_filters"]):
-                sub_col = i % 2
-                sub_row = i // 2
-
-                # Create a frame for the sub-filter
-                filter_frame = Frame(sub_frame, bg=self.card_bg, padx=3, pady=3, bd=1, relief=tk.RAISED)
-                filter_frame.grid(row=sub_row, column=sub_col, padx=1, pady=1, sticky="nsew", ipadx=1, ipady=1)
-
-                # Filter icon (size 16)
-                sub_icon_label = Label(filter_frame, text=filter_info["icon"], font=("Segoe UI Emoji", 16),
-                                 bg=self.card_bg, fg=self.accent_color)
-                sub_icon_label.pack(pady=0)
-
-                # Filter name
-                sub_name_label = Label(filter_frame, text=filter_info["display"], font=self.normal_font,
-                                 bg=self.card_bg, fg=self.text_color)
-                sub_name_label.pack(pady=0)
-
-                # Make the whole frame clickable to apply filter
-                filter_frame.bind("<Button-1>", lambda e, f=filter_info["name"]: self.apply_filter(f))
-                sub_icon_label.bind("<Button-1>", lambda e, f=filter_info["name"]: self.apply_filter(f))
-                sub_name_label.bind("<Button-1>", lambda e, f=filter_info["name"]: self.apply_filter(f))
-
-                # Hover effect for sub-filter
-                def on_enter_sub(e, frame=filter_frame):
-                    frame.config(bg=self.highlight_color)
-                    for widget in frame.winfo_children():
-                        widget.config(bg=self.highlight_color)
-
-                def on_leave_sub(e, frame=filter_frame):
-                    frame.config(bg=self.card_bg)
-                    for widget in frame.winfo_children():
-                        widget.config(bg=self.card_bg)
-
-                filter_frame.bind("<Enter>", on_enter_sub)
-                filter_frame.bind("<Leave>", on_leave_sub)
+            # Sub-filter cards are built the first time the category is opened
+            self._pending_sub_filters[str(sub_frame)] = (self._build_advanced_sub_filters,
+                                                        category_info["sub_filters"])
 
             # Make the category frame clickable to toggle sub-filters
-            def toggle_advanced_sub_filters(e, key=category_key):
-                sub_frame = self.advanced_sub_filter_frames[key]
-                if sub_frame.winfo_ismapped():
-                    sub_frame.grid_remove()
-                else:
-                    # Hide all other sub-filter frames first
-                    for k, frame in self.advanced_sub_filter_frames.items():
-                        if k != key:
-                            frame.grid_remove()
-                    sub_frame.grid()
-
-            category_frame.bind("<Button-1>", toggle_advanced_sub_filters)
-            icon_label.bind("<Button-1>", toggle_advanced_sub_filters)
-            name_label.bind("<Button-1>", toggle_advanced_sub_filters)
-
-            # Hover effect for category
-            def on_enter(e, frame=category_frame):
-                frame.config(bg=self.highlight_color)
-                for widget in frame.winfo_children():
-                    widget.config(bg=self.highlight_color)
-
-            def on_leave(e, frame=category_frame):
-                frame.config(bg=self.card_bg)
-                for widget in frame.winfo_children():
-                    widget.config(bg=self.card_bg)
-
-            category_frame.bind("<Enter>", on_enter)
-            category_frame.bind("<Leave>", on_leave)
-            icon_label.bind("<Enter>", on_enter)
-            icon_label.bind("<Leave>", on_leave)
-            name_label.bind("<Enter>", on_enter)
-            name_label.bind("<Leave>", on_leave)
+            self._bind_category_click("advanced", category_key, category_frame,
+                                      icon_label, name_label)
 
             row += 2  # Increment row for next category (including space for sub-filters)
-            icon_label.bind("<Enter>", on_enter)
-            icon_label.bind("<Leave>", on_leave)
-            name_label.bind("<Enter>", on_enter)
-            name_label.bind("<Leave>", on_leave)
 
         # Effects Section with decorative elements
-        effects_section = Frame(self.filter_frame, bg=self.bg_color)
+        effects_section = Frame(self.filter_frame)
         effects_section.pack(fill=tk.X, padx=5, pady=15)
 
         # Create a decorative header with icon
-        effects_header_frame = Frame(effects_section, bg=self.bg_color)
+        effects_header_frame = Frame(effects_section)
         effects_header_frame.pack(fill=tk.X, pady=5)
 
         # Add decorative icon (size 16)
-        effects_icon = Label(effects_header_frame, text="🎨", font=("Segoe UI Emoji", 16),
-                           bg=self.bg_color, fg=self.accent_color)
+        effects_icon = Label(effects_header_frame, text="🎨", font=self.emoji_font, fg=self.accent_color)
         effects_icon.pack(side=tk.LEFT, padx=(0, 10))
 
         # Section header with gradient effect
-        effects_header = Label(effects_header_frame, text="Effects & Transformations", font=("Segoe UI", 10, "bold"),
-                             bg=self.bg_color, fg=self.accent_color)
+        effects_header = Label(effects_header_frame, text="Effects & Transformations",
+                               font=self.bold_font, fg=self.accent_color)
         effects_header.pack(side=tk.LEFT, pady=10)
 
         # Add a decorative line under the header
@@ -1266,7 +1945,7 @@ class ImageProcessorApp:
 
         # Description text
         effects_desc = Label(effects_section, text="Apply artistic effects and transformations to your image",
-                           font=self.normal_font, bg=self.bg_color, fg=self.text_color, justify=tk.LEFT)
+                             justify=tk.LEFT)
         effects_desc.pack(anchor=tk.W, pady=(0, 10))
 
         # Define effects filter categories with their sub-filters
@@ -1298,147 +1977,29 @@ class ImageProcessorApp:
         }
 
         # Create a grid for effects filter cards
-        effects_grid = Frame(effects_section, bg=self.bg_color)
+        effects_grid = Frame(effects_section)
         effects_grid.pack(fill=tk.X, pady=5)
 
         # Create main category buttons in a grid
-        self.effects_sub_filter_frames = {}
-        row = 0
-        for category_key, category_info in self.effects_filter_categories.items():
-            # Create a frame for the category (ultra-compact size with shadow effect)
-            # Create shadow frame first (positioned slightly offset)
-            shadow_frame = Frame(effects_grid, bg=self.shadow_color, padx=3, pady=3, bd=0)
-            shadow_frame.grid(row=row, column=0, columnspan=2, padx=1, pady=1, sticky="nsew")
-
-            # Create actual category frame on top of shadow
-            category_frame = Frame(effects_grid, bg=self.card_bg, padx=3, pady=3, bd=1, relief=tk.RAISED)
-            category_frame.grid(row=row, column=0, columnspan=2, padx=1, pady=1, sticky="nsew", ipadx=1, ipady=1)
-
-            # Add a colored border on the left side for visual interest (thinner)
-            left_border = Frame(category_frame, width=2, bg=self.accent_color)
-            left_border.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 5))
-
-            # Create content frame
-            content_frame = Frame(category_frame, bg=self.card_bg)
-            content_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-            # Category icon (size 16)
-            icon_label = Label(content_frame, text=category_info["icon"], font=("Segoe UI Emoji", 16),
-                             bg=self.card_bg, fg=self.accent_color)
-            icon_label.pack(side=tk.LEFT, padx=(0, 5))
-
-            # Category name
-            name_label = Label(content_frame, text=category_info["display"], font=("Segoe UI", 10, "bold"),
-                             bg=self.card_bg, fg=self.text_color)
-            name_label.pack(side=tk.LEFT, pady=2)
-
-            # Create a frame for sub-filters (initially hidden)
-            sub_frame = Frame(effects_grid, bg=self.bg_color)
-            sub_frame.grid(row=row+1, column=0, columnspan=2, sticky="nsew")
-            sub_frame.grid_remove()  # Hide initially
-            self.effects_sub_filter_frames[category_key] = sub_frame
-
-            # Create sub-filter buttons
-            for i, filter_info in enumerate(category_info["sub_filters"]):
-                sub_col = i % 2
-                sub_row = i // 2
-
-                # Create a frame for the sub-filter
-                filter_frame = Frame(sub_frame, bg=self.card_bg, padx=4, pady=4, bd=0)
-                filter_frame.grid(row=sub_row, column=sub_col, padx=2, pady=2, sticky="nsew")
-
-                # Add a colored border on the left side for visual interest (thinner)
-                sub_left_border = Frame(filter_frame, width=2, bg=self.accent_color)
-                sub_left_border.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 5))
-
-                # Create content frame
-                sub_content_frame = Frame(filter_frame, bg=self.card_bg)
-                sub_content_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-                # Create top frame for icon and name
-                top_frame = Frame(sub_content_frame, bg=self.card_bg)
-                top_frame.pack(fill=tk.X, anchor=tk.W)
-
-                # Filter icon (size 16)
-                sub_icon_label = Label(top_frame, text=filter_info["icon"], font=("Segoe UI Emoji", 16),
-                                 bg=self.card_bg, fg=self.accent_color)
-                sub_icon_label.pack(side=tk.LEFT, padx=(0, 5))
-
-                # Filter name
-                sub_name_label = Label(top_frame, text=filter_info["display"], font=self.normal_font,
-                                 bg=self.card_bg, fg=self.text_color)
-                sub_name_label.pack(side=tk.LEFT)
-
-                # Filter description
-                desc_label = Label(sub_content_frame, text=filter_info["desc"], font=self.normal_font,
-                                 bg=self.card_bg, fg=self.text_color, wraplength=120, justify=tk.LEFT)
-                desc_label.pack(fill=tk.X, pady=(2, 5), anchor=tk.W)
-
-                # Apply button
-                apply_btn = Button(sub_content_frame, text="Apply", font=self.button_font,
-                                 bg=self.accent_color, fg="white", bd=0, padx=10, pady=2,
-                                 command=lambda f=filter_info["name"]: self.apply_filter(f))
-                apply_btn.pack(anchor=tk.W)
-
-            # Make the category frame clickable to toggle sub-filters
-            def toggle_effects_sub_filters(e, key=category_key):
-                sub_frame = self.effects_sub_filter_frames[key]
-                if sub_frame.winfo_ismapped():
-                    sub_frame.grid_remove()
-                else:
-                    # Hide all other sub-filter frames first
-                    for k, frame in self.effects_sub_filter_frames.items():
-                        if k != key:
-                            frame.grid_remove()
-                    sub_frame.grid()
-
-            category_frame.bind("<Button-1>", toggle_effects_sub_filters)
-            content_frame.bind("<Button-1>", toggle_effects_sub_filters)
-            icon_label.bind("<Button-1>", toggle_effects_sub_filters)
-            name_label.bind("<Button-1>", toggle_effects_sub_filters)
-
-            # Hover effect for category
-            def on_enter(e, frame=category_frame, border=left_border):
-                frame.config(bg=self.highlight_color)
-                border.config(bg=self.secondary_color)
-                for widget in frame.winfo_children():
-                    if widget != border:
-                        widget.config(bg=self.highlight_color)
-                content_frame.config(bg=self.highlight_color)
-                icon_label.config(bg=self.highlight_color)
-                name_label.config(bg=self.highlight_color)
-
-            def on_leave(e, frame=category_frame, border=left_border):
-                frame.config(bg=self.card_bg)
-                border.config(bg=self.accent_color)
-                for widget in frame.winfo_children():
-                    if widget != border:
-                        widget.config(bg=self.card_bg)
-                content_frame.config(bg=self.card_bg)
-                icon_label.config(bg=self.card_bg)
-                name_label.config(bg=self.card_bg)
-
-            # Bind hover events
-            for widget in [category_frame, content_frame, icon_label, name_label]:
-                widget.bind("<Enter>", on_enter)
-                widget.bind("<Leave>", on_leave)
+        self.effects_sub_filter_frames = self._sub_filter_sections["effects"] = {}
+        self._build_category_cards("effects", effects_grid, self.effects_filter_categories,
+                                   self.accent_color, self.secondary_color, "CardBorder.TFrame")
 
         # Morphological Section with decorative elements
-        morph_section = Frame(self.filter_frame, bg=self.bg_color)
+        morph_section = Frame(self.filter_frame)
         morph_section.pack(fill=tk.X, padx=5, pady=15)
 
         # Create a decorative header with icon
-        morph_header_frame = Frame(morph_section, bg=self.bg_color)
+        morph_header_frame = Frame(morph_section)
         morph_header_frame.pack(fill=tk.X, pady=5)
 
         # Add decorative icon (size 16)
-        morph_icon = Label(morph_header_frame, text="🔄", font=("Segoe UI Emoji", 16),
-                          bg=self.bg_color, fg=self.accent_color)
+        morph_icon = Label(morph_header_frame, text="🔄", font=self.emoji_font, fg=self.accent_color)
         morph_icon.pack(side=tk.LEFT, padx=(0, 10))
 
         # Section header with gradient effect
-        morph_header = Label(morph_header_frame, text="Morphological Transformations", font=("Segoe UI", 10, "bold"),
-                           bg=self.bg_color, fg=self.accent_color)
+        morph_header = Label(morph_header_frame, text="Morphological Transformations",
+                             font=self.bold_font, fg=self.accent_color)
         morph_header.pack(side=tk.LEFT, pady=10)
 
         # Add a decorative line under the header
@@ -1447,7 +2008,7 @@ class ImageProcessorApp:
 
         # Description text
         morph_desc = Label(morph_section, text="Apply mathematical morphology operations to your image",
-                          font=self.normal_font, bg=self.bg_color, fg=self.text_color, justify=tk.LEFT)
+                           justify=tk.LEFT)
         morph_desc.pack(anchor=tk.W, pady=(0, 10))
 
         # Define morphological filter categories with their sub-filters
@@ -1475,197 +2036,42 @@ class ImageProcessorApp:
         }
 
         # Create a grid for morphological filter cards
-        morph_grid = Frame(morph_section, bg=self.bg_color)
+        morph_grid = Frame(morph_section)
         morph_grid.pack(fill=tk.X, pady=5)
 
         # Create main category buttons in a grid
-        self.morph_sub_filter_frames = {}
-        row = 0
-        for category_key, category_info in self.morph_filter_categories.items():
-            # Create a frame for the category (ultra-compact size with shadow effect)
-            # Create shadow frame first (positioned slightly offset)
-            shadow_frame = Frame(morph_grid, bg=self.shadow_color, padx=3, pady=3, bd=0)
-            shadow_frame.grid(row=row, column=0, columnspan=2, padx=1, pady=1, sticky="nsew")
-
-            # Create actual category frame on top of shadow
-            category_frame = Frame(morph_grid, bg=self.card_bg, padx=3, pady=3, bd=1, relief=tk.RAISED)
-            category_frame.grid(row=row, column=0, columnspan=2, padx=1, pady=1, sticky="nsew", ipadx=1, ipady=1)
-
-            # Add a colored border on the left side for visual interest (thinner)
-            left_border = Frame(category_frame, width=2, bg=self.secondary_color)
-            left_border.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 5))
-
-            # Create content frame
-            content_frame = Frame(category_frame, bg=self.card_bg)
-            content_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-            # Category icon (size 16)
-            icon_label = Label(content_frame, text=category_info["icon"], font=("Segoe UI Emoji", 16),
-                             bg=self.card_bg, fg=self.secondary_color)
-            icon_label.pack(side=tk.LEFT, padx=(0, 5))
-
-            # Category name
-            name_label = Label(content_frame, text=category_info["display"], font=("Segoe UI", 10, "bold"),
-                             bg=self.card_bg, fg=self.text_color)
-            name_label.pack(side=tk.LEFT, pady=2)
-
-            # Create a frame for sub-filters (initially hidden)
-            sub_frame = Frame(morph_grid, bg=self.bg_color)
-            sub_frame.grid(row=row+1, column=0, columnspan=2, sticky="nsew")
-            sub_frame.grid_remove()  # Hide initially
-            self.morph_sub_filter_frames[category_key] = sub_frame
-
-            # Create sub-filter buttons
-            for i, filter_info in enumerate(category_info["sub_filters"]):
-                sub_col = i % 2
-                sub_row = i // 2
-
-                # Create a frame for the sub-filter
-                filter_frame = Frame(sub_frame, bg=self.card_bg, padx=4, pady=4, bd=0)
-                filter_frame.grid(row=sub_row, column=sub_col, padx=2, pady=2, sticky="nsew")
-
-                # Add a colored border on the left side for visual interest (thinner)
-                sub_left_border = Frame(filter_frame, width=2, bg=self.secondary_color)
-                sub_left_border.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 5))
-
-                # Create content frame
-                sub_content_frame = Frame(filter_frame, bg=self.card_bg)
-                sub_content_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-                # Create top frame for icon and name
-                top_frame = Frame(sub_content_frame, bg=self.card_bg)
-                top_frame.pack(fill=tk.X, anchor=tk.W)
-
-                # Filter icon (size 16)
-                sub_icon_label = Label(top_frame, text=filter_info["icon"], font=("Segoe UI Emoji", 16),
-                                 bg=self.card_bg, fg=self.secondary_color)
-                sub_icon_label.pack(side=tk.LEFT, padx=(0, 5))
-
-                # Filter name
-                sub_name_label = Label(top_frame, text=filter_info["display"], font=self.normal_font,
-                                 bg=self.card_bg, fg=self.text_color)
-                sub_name_label.pack(side=tk.LEFT)
-
-                # Filter description
-                desc_label = Label(sub_content_frame, text=filter_info["desc"], font=self.normal_font,
-                                 bg=self.card_bg, fg=self.text_color, wraplength=120, justify=tk.LEFT)
-                desc_label.pack(fill=tk.X, pady=(2, 5), anchor=tk.W)
-
-                # Apply button
-                apply_btn = Button(sub_content_frame, text="Apply", font=self.button_font,
-                                 bg=self.secondary_color, fg="white", bd=0, padx=10, pady=2,
-                                 command=lambda f=filter_info["name"]: self.apply_filter(f))
-                apply_btn.pack(anchor=tk.W)
-
-                # Make the whole frame clickable to apply filter
-                filter_frame.bind("<Button-1>", lambda e, f=filter_info["name"]: self.apply_filter(f))
-                sub_icon_label.bind("<Button-1>", lambda e, f=filter_info["name"]: self.apply_filter(f))
-                sub_name_label.bind("<Button-1>", lambda e, f=filter_info["name"]: self.apply_filter(f))
-                desc_label.bind("<Button-1>", lambda e, f=filter_info["name"]: self.apply_filter(f))
-
-                # Hover effect for sub-filter
-                def on_enter_sub(e, frame=filter_frame, border=sub_left_border, btn=apply_btn):
-                    frame.config(bg=self.highlight_color)
-                    border.config(bg=self.accent_color)
-                    for widget in frame.winfo_children():
-                        if widget != border:
-                            widget.config(bg=self.highlight_color)
-                    sub_content_frame.config(bg=self.highlight_color)
-                    top_frame.config(bg=self.highlight_color)
-                    sub_icon_label.config(bg=self.highlight_color)
-                    sub_name_label.config(bg=self.highlight_color)
-                    desc_label.config(bg=self.highlight_color)
-                    btn.config(bg=self.accent_color)
-
-                def on_leave_sub(e, frame=filter_frame, border=sub_left_border, btn=apply_btn):
-                    frame.config(bg=self.card_bg)
-                    border.config(bg=self.secondary_color)
-                    for widget in frame.winfo_children():
-                        if widget != border:
-                            widget.config(bg=self.card_bg)
-                    sub_content_frame.config(bg=self.card_bg)
-                    top_frame.config(bg=self.card_bg)
-                    sub_icon_label.config(bg=self.card_bg)
-                    sub_name_label.config(bg=self.card_bg)
-                    desc_label.config(bg=self.card_bg)
-                    btn.config(bg=self.secondary_color)
-
-                filter_frame.bind("<Enter>", on_enter_sub)
-                filter_frame.bind("<Leave>", on_leave_sub)
-
-            # Make the category frame clickable to toggle sub-filters
-            def toggle_morph_sub_filters(e, key=category_key):
-                sub_frame = self.morph_sub_filter_frames[key]
-                if sub_frame.winfo_ismapped():
-                    sub_frame.grid_remove()
-                else:
-                    # Hide all other sub-filter frames first
-                    for k, frame in self.morph_sub_filter_frames.items():
-                        if k != key:
-                            frame.grid_remove()
-                    sub_frame.grid()
-
-            category_frame.bind("<Button-1>", toggle_morph_sub_filters)
-            content_frame.bind("<Button-1>", toggle_morph_sub_filters)
-            icon_label.bind("<Button-1>", toggle_morph_sub_filters)
-            name_label.bind("<Button-1>", toggle_morph_sub_filters)
-
-            # Hover effect for category
-            def on_enter(e, frame=category_frame, border=left_border):
-                frame.config(bg=self.highlight_color)
-                border.config(bg=self.accent_color)
-                for widget in frame.winfo_children():
-                    if widget != border:
-                        widget.config(bg=self.highlight_color)
-                content_frame.config(bg=self.highlight_color)
-                icon_label.config(bg=self.highlight_color)
-                name_label.config(bg=self.highlight_color)
-
-            def on_leave(e, frame=category_frame, border=left_border):
-                frame.config(bg=self.card_bg)
-                border.config(bg=self.secondary_color)
-                for widget in frame.winfo_children():
-                    if widget != border:
-                        widget.config(bg=self.card_bg)
-                content_frame.config(bg=self.card_bg)
-                icon_label.config(bg=self.card_bg)
-                name_label.config(bg=self.card_bg)
-
-            # Bind hover events
-            for widget in [category_frame, content_frame, icon_label, name_label]:
-                widget.bind("<Enter>", on_enter)
-                widget.bind("<Leave>", on_leave)
-
-            row += 2  # Increment row for next category (including space for sub-filters)
+        self.morph_sub_filter_frames = self._sub_filter_sections["morph"] = {}
+        self._build_category_cards("morph", morph_grid, self.morph_filter_categories,
+                                   self.secondary_color, self.accent_color, "CardBorderAlt.TFrame")
 
         # Filter Controls Section
-        filter_controls_frame = Frame(self.filter_frame, bg=self.bg_color)
+        filter_controls_frame = Frame(self.filter_frame)
         filter_controls_frame.pack(fill=tk.X, padx=5, pady=15)
 
         # Filter Intensity Slider
-        intensity_frame = Frame(filter_controls_frame, bg=self.bg_color)
+        intensity_frame = Frame(filter_controls_frame)
         intensity_frame.pack(fill=tk.X, pady=5)
 
-        Label(intensity_frame, text="Filter Intensity", font=self.subheader_font,
-             bg=self.bg_color, fg=self.text_color).pack(anchor=tk.W)
+        Label(intensity_frame, text="Filter Intensity", font=self.subheader_font).pack(anchor=tk.W)
 
         intensity_slider = Scale(
             intensity_frame, from_=0.1, to=2.0, orient=tk.HORIZONTAL,
             variable=self.filter_intensity, resolution=0.1, length=250,
-            command=self.update_filter_intensity,
+            command=self._schedule_intensity_update,
             bg=self.bg_color, highlightthickness=0,
             troughcolor=self.highlight_color, activebackground=self.accent_color
         )
+        intensity_slider.bind("<ButtonPress-1>", self._start_drag)
+        intensity_slider.bind("<ButtonRelease-1>", self._commit_filter_intensity)
 
         # Filter Actions Frame
-        filter_actions_frame = Frame(filter_controls_frame, bg=self.bg_color)
+        filter_actions_frame = Frame(filter_controls_frame)
         filter_actions_frame.pack(fill=tk.X, pady=10)
 
         # Current Filter Display
         self.current_filter_label = Label(filter_actions_frame,
-                                        text="No filter selected",
-                                        font=self.subheader_font,
-                                        bg=self.bg_color, fg=self.accent_color)
+                                        textvariable=self.current_filter_text,
+                                        font=self.subheader_font, fg=self.accent_color)
         self.current_filter_label.pack(side=tk.LEFT, anchor=tk.W, padx=(0, 10))
 
         # Clear Filter Button
@@ -1676,7 +2082,6 @@ class ImageProcessorApp:
         clear_filter_btn.pack(side=tk.RIGHT)
 
         # Compare Button (Toggle Before/After View)
-        self.compare_var = BooleanVar(value=False)
         compare_btn = Button(filter_actions_frame, text="Compare (Before/After)",
                             command=self.toggle_compare_view,
                             bg=self.accent_color, fg="white",
@@ -1684,14 +2089,13 @@ class ImageProcessorApp:
         compare_btn.pack(side=tk.RIGHT, padx=10)
 
         # Filter Presets Section
-        presets_frame = Frame(filter_controls_frame, bg=self.bg_color)
+        presets_frame = Frame(filter_controls_frame)
         presets_frame.pack(fill=tk.X, pady=10)
 
-        Label(presets_frame, text="Filter Presets", font=self.subheader_font,
-             bg=self.bg_color, fg=self.text_color).pack(anchor=tk.W, pady=(0, 5))
+        Label(presets_frame, text="Filter Presets", font=self.subheader_font).pack(anchor=tk.W, pady=(0, 5))
 
         # Preset Buttons Frame
-        preset_buttons_frame = Frame(presets_frame, bg=self.bg_color)
+        preset_buttons_frame = Frame(presets_frame)
         preset_buttons_frame.pack(fill=tk.X)
 
         # Add some preset filter combinations
@@ -1709,7 +2113,9 @@ class ImageProcessorApp:
                               bg=self.card_bg, fg=self.text_color,
                               font=self.button_font, bd=1, padx=10, pady=5)
             preset_btn.grid(row=0, column=i, padx=5, pady=5, sticky="ew")
-            preset_buttons_frame.columnconfigure(i, weight=1)
+
+        # Grid accepts a list of column indices, so one call weights every preset column
+        preset_buttons_frame.columnconfigure(tuple(range(len(presets))), weight=1)
 
         # Save Preset Button
         save_preset_btn = Button(presets_frame, text="Save Current as Preset",
@@ -1717,7 +2123,6 @@ class ImageProcessorApp:
                                bg=self.bg_color, fg=self.accent_color,
                                font=self.button_font, bd=1, padx=10, pady=5)
         save_preset_btn.pack(anchor=tk.E, pady=5)
-        intensity_slider.set(1.0)
         intensity_slider.pack(fill=tk.X, pady=5)
         self.create_tooltip(intensity_slider, "Adjust the intensity of the selected filter (0.1 to 2.0)")
 
@@ -1731,19 +2136,18 @@ class ImageProcessorApp:
     def setup_advanced_tab(self):
         """Setup the Advanced tab with zoom/pan controls"""
         # Zoom and Pan Section
-        zoom_section = Frame(self.advanced_frame, bg=self.bg_color)
+        zoom_section = Frame(self.advanced_frame)
         zoom_section.pack(fill=tk.X, padx=5, pady=5)
 
         # Section header
-        header = Label(zoom_section, text="Zoom & Pan", font=self.header_font,
-                      bg=self.bg_color, fg=self.accent_color)
+        header = Label(zoom_section, text="Zoom & Pan", font=self.header_font, fg=self.accent_color)
         header.pack(pady=10, anchor=tk.W)
 
         # Zoom controls
-        zoom_frame = Frame(zoom_section, bg=self.bg_color)
+        zoom_frame = Frame(zoom_section)
         zoom_frame.pack(fill=tk.X, pady=10)
 
-        zoom_btns = Frame(zoom_frame, bg=self.bg_color)
+        zoom_btns = Frame(zoom_frame)
         zoom_btns.pack(fill=tk.X, pady=5)
 
         zoom_in = Button(zoom_btns, text="Zoom In", command=lambda: self.zoom(1.25),
@@ -1764,57 +2168,58 @@ class ImageProcessorApp:
         reset_view.pack(pady=5)
         self.create_tooltip(reset_view, "Reset zoom and pan to default")
 
-    def _on_mousewheel(self, event, canvas):
-        """Handle mousewheel scrolling on a canvas"""
-        # Only scroll if mouse is over the canvas
-        x, y = canvas.winfo_pointerxy()
-        widget_under_mouse = canvas.winfo_containing(x, y)
-        if widget_under_mouse and (widget_under_mouse == canvas or
-                                  canvas.winfo_ismapped() and
-                                  widget_under_mouse.winfo_toplevel() == canvas.winfo_toplevel()):
-            # Scroll direction depends on platform
-            if hasattr(event, 'delta'):
-                # Windows platform
-                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-            elif hasattr(event, 'num'):
-                # Unix platform
-                if event.num == 4:
-                    canvas.yview_scroll(-1, "units")
-                elif event.num == 5:
-                    canvas.yview_scroll(1, "units")
-
     def setup_control_panel(self):
-        # Setup each tab with its controls
+        # Setup the File tab now; the others are built the first time they are selected
         self.setup_file_tab()
-        self.setup_adjust_tab()
-        self.setup_filter_tab()  # Add filter tab setup
-        self.setup_transform_tab()
-        self.setup_advanced_tab()
+        self._tab_setup = {
+            str(self.adjust_tab): (self.adjust_tab, "adjust_frame", self.setup_adjust_tab),
+            str(self.filter_tab): (self.filter_tab, "filter_frame", self.setup_filter_tab),
+            str(self.transform_tab): (self.transform_tab, "transform_frame", self.setup_transform_tab),
+            str(self.advanced_tab): (self.advanced_tab, "advanced_frame", self.setup_advanced_tab),
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, _):
+        """Build a tab's contents the first time it is shown"""
+        selected = self.notebook.select()
+        # Only animate the file icon while it can be seen
+        if selected == str(self.file_tab):
+            if self._file_icon_after_id is None:
+                self.animate_file_icon()
+        else:
+            self._pause_file_icon()
+
+        entry = self._tab_setup.pop(selected, None)
+        if entry:
+            tab, name, setup = entry
+            self.setup_scrollable_frame(tab, name)
+            setup()
 
     def setup_file_tab(self):
         """Setup the File tab with file operations and history controls"""
         # File Operations Section
-        file_section = Frame(self.file_frame, bg=self.bg_color)
+        file_section = Frame(self.file_frame)
         file_section.pack(fill=tk.X, padx=5, pady=5)
 
         # Section header with animation
-        header_frame = Frame(file_section, bg=self.bg_color)
+        header_frame = Frame(file_section)
         header_frame.pack(fill=tk.X, pady=10)
 
-        header = Label(header_frame, text="File Operations", font=self.header_font,
-                      bg=self.bg_color, fg=self.accent_color)
+        header = Label(header_frame, text="File Operations", font=self.header_font, fg=self.accent_color)
         header.pack(side=tk.LEFT, anchor=tk.W)
 
         # Add a small animated icon next to the header
         self.file_icon_index = 0
         self.file_icons = ["📁", "📂", "📄", "📝"]
-        self.file_icon_label = Label(header_frame, text=self.file_icons[0], font=("Segoe UI Emoji", 18),
-                                    bg=self.bg_color, fg=self.accent_color)
+        self.file_icon_label = Label(header_frame, text=self.file_icons[0],
+                                     font=self.icon_font, fg=self.accent_color)
         self.file_icon_label.pack(side=tk.LEFT, padx=10)
-        self.animate_file_icon()
+        # Pending after() id of the icon animation; None while the File tab is hidden
+        # The first frame waits for the event loop so it stays off the construction path
+        self._file_icon_after_id = self.root.after_idle(self.animate_file_icon)
 
         # File operation buttons with modern styling and animations
-        file_btns = Frame(file_section, bg=self.bg_color)
+        file_btns = Frame(file_section)
         file_btns.pack(fill=tk.X, pady=10)
 
         # Open button with icon and animation
@@ -1839,17 +2244,14 @@ class ImageProcessorApp:
         gradient_canvas = Canvas(export_frame, height=5, bg=self.card_bg, highlightthickness=0)
         gradient_canvas.pack(fill=tk.X, side=tk.TOP)
 
-        # Create gradient
-        for i in range(100):
-            # Calculate gradient color
-            r = int(int(self.accent_color[1:3], 16) * (1 - i/100) + int(self.card_bg[1:3], 16) * (i/100))
-            g = int(int(self.accent_color[3:5], 16) * (1 - i/100) + int(self.card_bg[3:5], 16) * (i/100))
-            b = int(int(self.accent_color[5:7], 16) * (1 - i/100) + int(self.card_bg[5:7], 16) * (i/100))
-            color = f"#{r:02x}{g:02x}{b:02x}"
-            gradient_canvas.create_line(i*5, 0, i*5, 5, fill=color)
+        # Create gradient: one row of colors tiled down a 500x5 image in a single put
+        row = "{" + " ".join(_interp_hex(self.accent_color, self.card_bg, 499)) + "}"
+        self._export_gradient = tk.PhotoImage(master=gradient_canvas, width=500, height=5)
+        self._export_gradient.put(row, to=(0, 0, 500, 5))
+        gradient_canvas.create_image(0, 0, image=self._export_gradient, anchor=tk.NW)
 
         Label(export_frame, text="Export Options", font=self.subheader_font,
-             bg=self.card_bg, fg=self.text_color).pack(pady=5, anchor=tk.W)
+             bg=self.card_bg).pack(pady=5, anchor=tk.W)
 
         # Export buttons with icons and animations
         export_btn = self.create_modern_button(export_frame, text="Export As...", command=self.export_image,
@@ -1866,16 +2268,15 @@ class ImageProcessorApp:
         self.create_tooltip(social_btn, "Export image optimized for social media platforms")
 
         # History controls
-        history_frame = Frame(file_section, bg=self.bg_color)
+        history_frame = Frame(file_section)
         history_frame.pack(fill=tk.X, pady=10)
 
         # History section header
-        history_header = Label(history_frame, text="History", font=self.subheader_font,
-                             bg=self.bg_color, fg=self.text_color)
+        history_header = Label(history_frame, text="History", font=self.subheader_font)
         history_header.pack(pady=5, anchor=tk.W)
 
         # History buttons
-        history_btns = Frame(history_frame, bg=self.bg_color)
+        history_btns = Frame(history_frame)
         history_btns.pack(fill=tk.X, pady=5)
 
         undo_btn = Button(history_btns, text="Undo", command=self.undo, width=9,
@@ -1889,11 +2290,10 @@ class ImageProcessorApp:
         self.create_tooltip(redo_btn, "Redo last undone action (Ctrl+Y)")
 
         # Real-time preview toggle
-        preview_frame = Frame(file_section, bg=self.bg_color)
+        preview_frame = Frame(file_section)
         preview_frame.pack(fill=tk.X, pady=10)
 
-        preview_header = Label(preview_frame, text="Preview Options", font=self.subheader_font,
-                              bg=self.bg_color, fg=self.text_color)
+        preview_header = Label(preview_frame, text="Preview Options", font=self.subheader_font)
         preview_header.pack(pady=5, anchor=tk.W)
 
         self.preview_var = tk.BooleanVar(value=True)
@@ -1930,7 +2330,7 @@ class ImageProcessorApp:
 
         # Reset button has been moved to the file tab
 
-    def load_image(self):
+    def load_image(self, event=None):
         file_path = filedialog.askopenfilename(
             filetypes=[("Image files", "*.jpg *.jpeg *.png *.bmp *.gif *.tiff *.webp")]
         )
@@ -1948,6 +2348,26 @@ class ImageProcessorApp:
             if self.original_image.mode != 'RGB':
                 self.original_image = self.original_image.convert('RGB')
 
+            # Renders of the previous image can never be hit again
+            self._image_generation += 1
+            with self._render_cache_lock:
+                self._render_cache.clear()
+            with self._filter_cache_lock:
+                self._filter_cache.clear()
+                self._filter_cache_bytes = 0
+            self._adjusted_cache = None
+
+            # Cache the pixel buffers once so slider previews skip the PIL round-trip
+            self._preview_src = self.original_image.copy()
+            self._preview_src.thumbnail((450, 500), Image.BILINEAR)
+            if NUMPY_AVAILABLE:
+                # C-contiguous so the JIT kernels and cv2 never fall back to strided loops
+                self._orig_arr = np.ascontiguousarray(np.asarray(self.original_image, dtype=np.uint8))
+                self._preview_arr = np.ascontiguousarray(np.asarray(self._preview_src, dtype=np.uint8))
+                # Replaced in one assignment so a render on the worker sees either the old or new pair
+                self._source_arrays = {id(self.original_image): (self.original_image, self._orig_arr),
+                                       id(self._preview_src): (self._preview_src, self._preview_arr)}
+
             # Reset zoom and pan
             self.zoom_factor = 1.0
             self.pan_x = 0
@@ -1962,8 +2382,8 @@ class ImageProcessorApp:
             # Display the original image
             self.display_image(self.original_image, self.original_canvas)
 
-            # Create initial processed image
-            self.processed_image = self.original_image.copy()
+            # Create initial processed image; images are never modified in place, so share it
+            self.processed_image = self.original_image
 
             # Apply any default operations
             self.apply_default_operations()
@@ -1981,8 +2401,7 @@ class ImageProcessorApp:
             self.update_resize_dimensions()
 
             # Reset history and add initial state
-            self.history = []
-            self.history_position = -1
+            self._clear_history()
             self.add_to_history()
 
             # Update file info in status bar
@@ -2011,7 +2430,91 @@ class ImageProcessorApp:
             # Update status bar with image info
             self.status_bar.config(text=info_text)
 
-    def update_image(self, *args):
+    def _shift_hue(self, img, hue, buffer_name="_hue_out"):
+        """Shift hue with the Numba kernel when available, reusing its output buffer"""
+        if not NUMBA_AVAILABLE:
+            return adjust_hue(img, hue)
+
+        return adjust_hue_numba(img, hue, self._thread_buffer(buffer_name, img.size))
+
+    def _thread_buffer(self, buffer_name, size):
+        """Return the named uint8 RGB output buffer, reallocated only when the image size changes"""
+        # Each thread gets its own buffer so the worker and the live preview never share one
+        width, height = size
+        out = getattr(self, buffer_name)
+        if out is None or out.shape != (height, width, 3):
+            out = np.empty((height, width, 3), dtype=np.uint8)
+            setattr(self, buffer_name, out)
+        return out
+
+    def _schedule_update(self, *args):
+        """Coalesce rapid slider callbacks into a single preview every 40 ms"""
+        if self._pending_update:
+            self.root.after_cancel(self._pending_update)
+        self._pending_update = self.root.after(40, self._do_update)
+
+    def _do_update(self):
+        """Run the debounced slider preview"""
+        self._pending_update = None
+        self._fast_bc_preview()
+
+    def _start_drag(self, event=None):
+        """Mark a slider drag so previews are scaled with NEAREST"""
+        self._is_dragging = True
+
+    def _commit_adjustments(self, event=None):
+        """Drop any pending preview and run the full pipeline once the slider is released"""
+        self._is_dragging = False
+        if self._pending_update:
+            self.root.after_cancel(self._pending_update)
+            self._pending_update = None
+        if self.real_time_preview and self.original_image:
+            self._submit_render()
+
+    def _fast_bc_preview(self, *args):
+        """Preview slider adjustments while dragging using cached lookup tables"""
+        if not self.original_image or not self.real_time_preview:
+            return
+
+        brightness = self.brightness_var.get()
+        contrast = self.contrast_var.get()
+
+        # Drive the live preview off the canvas-sized thumbnail; zooming in needs full resolution
+        use_thumbnail = self.zoom_factor == 1.0
+
+        if self._orig_arr is not None:
+            # Brightness/contrast is a pure map of 256 values, rebuild it only when they change
+            if self._bc_lut_key != (brightness, contrast):
+                self._bc_lut = brightness_contrast_lut(brightness, contrast)
+                self._bc_lut_key = (brightness, contrast)
+            src = self._preview_arr if use_thumbnail else self._orig_arr
+            # Gather into a persistent buffer instead of allocating a new array per tick
+            if self._preview_out is None or self._preview_out.shape != src.shape:
+                self._preview_out = np.empty_like(src)
+            np.take(self._bc_lut, src, out=self._preview_out)
+        else:
+            # Without NumPy, Image.point applies the same table in C
+            src = self._preview_src if use_thumbnail else self.original_image
+            img = adjust_brightness_contrast_lut(src, brightness, contrast)
+
+        # Keep the color adjustments visible during the drag
+        saturation = self.saturation_var.get()
+        hue = self.hue_var.get()
+        if self._orig_arr is not None and CV2_AVAILABLE:
+            # OpenCV handles both in vectorized C on the array
+            img = Image.fromarray(adjust_saturation_hue_cv2(self._preview_out, saturation, hue))
+        else:
+            if self._orig_arr is not None:
+                img = Image.fromarray(self._preview_out)
+            if saturation != 1.0:
+                img = adjust_saturation(img, saturation)
+            if hue != 0:
+                img = self._shift_hue(img, hue)
+
+        # Only the display is updated here, the full-size pipeline runs on release
+        self.display_image(img, self.processed_canvas)
+
+    def update_image(self, *args, record=True):
         if not self.original_image:
             return
 
@@ -2020,10 +2523,10 @@ class ImageProcessorApp:
             return
 
         # Get current adjustment values
-        brightness = self.brightness_slider.get()
-        contrast = self.contrast_slider.get()
-        saturation = self.saturation_slider.get()
-        hue = self.hue_slider.get()
+        brightness = self.brightness_var.get()
+        contrast = self.contrast_var.get()
+        saturation = self.saturation_var.get()
+        hue = self.hue_var.get()
 
         # Check if any adjustments have changed to avoid unnecessary processing
         adjustments_changed = (
@@ -2037,158 +2540,246 @@ class ImageProcessorApp:
         if not adjustments_changed and not args:
             return
 
-        # Update current values
-        self.current_brightness = brightness
-        self.current_contrast = contrast
-        self.current_saturation = saturation
-        self.current_hue = hue
+        # A synchronous render supersedes any background one still in flight
+        self._render_future = None
+
+        params = self._read_render_params()
+        img = self._render(params)
+
+        # Add to history (but not during history navigation or initial load)
+        self._apply_render_result(img, params, add_history=record and bool(args and args[0] != "history"))
+
+    def _read_render_params(self):
+        """Update the current adjustment values from the sliders and snapshot everything _render needs"""
+        self.current_brightness = self.brightness_var.get()
+        self.current_contrast = self.contrast_var.get()
+        self.current_saturation = self.saturation_var.get()
+        self.current_hue = self.hue_var.get()
+        return {
+            "source": self.original_image,
+            "brightness": self.current_brightness,
+            "contrast": self.current_contrast,
+            "saturation": self.current_saturation,
+            "hue": self.current_hue,
+            "filter": self.current_filter.get(),
+            "intensity": self.filter_intensity.get(),
+            "generation": self._image_generation,
+        }
 
-        # Start with the original image - avoid copy if possible
-        img = self.original_image.copy()
+    def _render(self, params, hue_buffer="_hue_out", use_cache=True):
+        """Run the full adjustment and filter pipeline; makes no Tk calls so it can run on the worker"""
+        source = params["source"]
+        if (params["filter"] == "none" and params["brightness"] == 0 and params["contrast"] == 1.0
+                and params["saturation"] == 1.0 and params["hue"] == 0):
+            # Nothing to do: nothing draws into rendered images, so the source itself is the
+            # result, and it shouldn't take a cache slot from a render that cost something
+            return source
+        if not use_cache:
+            return self._render_pipeline(params, hue_buffer, use_cache=False)
+
+        # Dragging a slider back to a value seen recently reuses that render
+        key = (id(source), params["brightness"], params["contrast"], params["saturation"],
+               params["hue"], params["filter"], round(params["intensity"], 3), params.get("fast", False))
+        with self._render_cache_lock:
+            entry = self._render_cache.get(key)
+            if entry is not None and entry[0] is source:
+                self._render_cache.move_to_end(key)
+                return entry[1]
+
+        img = self._render_pipeline(params, hue_buffer)
+
+        with self._render_cache_lock:
+            self._render_cache[key] = (source, img)
+            self._render_cache.move_to_end(key)
+            if len(self._render_cache) > self._render_cache_size:
+                self._render_cache.popitem(last=False)
+        return img
+
+    def _render_pipeline(self, params, hue_buffer, use_cache=True):
+        """Apply the adjustments and then the filter to params["source"]"""
+        source = params["source"]
+        adjustments = (params["brightness"], params["contrast"], params["saturation"], params["hue"])
+        cached = self._adjusted_cache if use_cache else None
+        if cached is not None and cached[0] is source and cached[1] == adjustments:
+            img = cached[2]
+        else:
+            if NUMBA_AVAILABLE and (params["saturation"] != 1.0 or params["hue"] != 0):
+                # Every adjustment in one JIT pass instead of one pass over the pixels each
+                # Reuse the array cached at load time instead of converting the source again
+                entry = self._source_arrays.get(id(source))
+                pixels = entry[1] if entry is not None and entry[0] is source else source
+                img = adjust_all_numba(pixels, params["brightness"], params["contrast"],
+                                       params["saturation"], params["hue"],
+                                       self._thread_buffer(hue_buffer, source.size))
+            else:
+                # Apply adjustments in sequence
+                # 1. Brightness and contrast, fused into one point() pass (same formula as the
+                #    live preview). Nothing draws into rendered images, so at the defaults the
+                #    source is passed through untouched instead of copied
+                if params["brightness"] != 0 or params["contrast"] != 1.0:
+                    img = adjust_brightness_contrast_lut(source, params["brightness"], params["contrast"])
+                else:
+                    img = source
 
-        # Apply adjustments in sequence
-        # 1. Brightness and contrast
-        img = adjust_brightness_contrast(img, self.current_brightness, self.current_contrast)
+                # 2. Saturation - only apply if needed
+                if params["saturation"] != 1.0:
+                    img = adjust_saturation(img, params["saturation"])
 
-        # 2. Saturation - only apply if needed
-        if self.current_saturation != 1.0:
-            img = adjust_saturation(img, self.current_saturation)
+                # 3. Hue - only apply if needed
+                if params["hue"] != 0:
+                    img = self._shift_hue(img, params["hue"], hue_buffer)
 
-        # 3. Hue - only apply if needed
-        if self.current_hue != 0:
-            img = adjust_hue(img, self.current_hue)
+            # A single tuple assignment, so the other thread never sees a half-updated entry
+            if use_cache:
+                self._adjusted_cache = (source, adjustments, img)
 
         # Apply filter if selected
-        current_filter = self.current_filter.get()
-        intensity = self.filter_intensity.get()
-
-        if current_filter != "none":
-            # Apply the selected filter based on its name
-            if current_filter == "grayscale":
-                img = img.convert('L').convert('RGB')
-            elif current_filter == "sepia":
-                img = apply_sepia(img)
-            elif current_filter == "invert":
-                img = ImageOps.invert(img)
-            elif current_filter == "brightness":
-                img = adjust_brightness_contrast(img, 50 * intensity, self.current_contrast)
-            elif current_filter == "contrast":
-                img = adjust_brightness_contrast(img, self.current_brightness, 1.0 + intensity)
-            elif current_filter == "saturation":
-                img = adjust_saturation(img, 1.0 + intensity)
-            elif current_filter == "gaussian_blur":
-                img = img.filter(ImageFilter.GaussianBlur(radius=intensity * 5))
-            elif current_filter == "median_blur":
-                img = img.filter(ImageFilter.MedianFilter(size=int(intensity * 5)))
-            elif current_filter == "sharpen":
-                img = img.filter(ImageFilter.SHARPEN)
-                if intensity > 1.0:
-                    for _ in range(int(intensity)):
-                        img = img.filter(ImageFilter.SHARPEN)
-            elif current_filter == "edge_detection":
-                img = img.filter(ImageFilter.FIND_EDGES)
-            elif current_filter == "emboss":
-                img = img.filter(ImageFilter.EMBOSS)
-            elif current_filter == "threshold":
-                # Convert to grayscale first
-                gray = img.convert('L')
-                # Apply threshold
-                threshold = int(128 * intensity)
-                img = gray.point(lambda x: 255 if x > threshold else 0).convert('RGB')
-            elif current_filter == "histogram_eq":
-                # Apply histogram equalization with intensity based on the slider
-                img = apply_histogram_equalization(img, intensity)
-            elif current_filter == "color_balance":
-                # Simple color balance by adjusting RGB channels
-                r, g, b = img.split()
-                r = ImageOps.autocontrast(r, cutoff=intensity * 10)
-                g = ImageOps.autocontrast(g, cutoff=intensity * 10)
-                b = ImageOps.autocontrast(b, cutoff=intensity * 10)
-                img = Image.merge('RGB', (r, g, b))
-            elif current_filter == "vignette":
-                # Create vignette effect
-                width, height = img.size
-                mask = Image.new('L', (width, height), 0)
-                draw = ImageDraw.Draw(mask)
-                # Draw a gradient ellipse from center (255) to edges (0)
-                for i in range(min(width, height) // 2, 0, -1):
-                    # Calculate opacity based on distance from center
-                    opacity = int(255 * (i / (min(width, height) // 2)))
-                    draw.ellipse(
-                        [(width//2 - i, height//2 - i), (width//2 + i, height//2 + i)],
-                        fill=opacity
-                    )
-                # Apply the mask
-                img = Image.composite(img, Image.new('RGB', img.size, (30, 20, 10)), mask)
-            elif current_filter == "cartoonify":
-                # Cartoonify effect
-                # 1. Apply edge detection
-                edges = img.filter(ImageFilter.FIND_EDGES)
-                # 2. Convert to grayscale and invert
-                edges = ImageOps.invert(edges.convert('L'))
-                # 3. Posterize the original image
-                color = ImageOps.posterize(img, 4)
-                # 4. Combine edges with color
-                img = ImageChops.multiply(color, edges.convert('RGB'))
-            elif current_filter == "oil_painting":
-                # Oil painting effect (simplified)
-                img = img.filter(ImageFilter.ModeFilter(size=int(intensity * 5)))
-                enhancer = ImageEnhance.Contrast(img)
-                img = enhancer.enhance(1.5)
-            elif current_filter == "pencil_sketch":
-                # Use the enhanced pencil sketch function from image_utils
-                img = apply_pencil_sketch(img, intensity)
-            elif current_filter == "erosion":
-                # Erosion (simplified using min filter)
-                img = img.filter(ImageFilter.MinFilter(size=int(intensity * 5)))
-            elif current_filter == "dilation":
-                # Dilation (simplified using max filter)
-                img = img.filter(ImageFilter.MaxFilter(size=int(intensity * 5)))
-            elif current_filter == "opening":
-                # Opening (erosion followed by dilation)
-                img = img.filter(ImageFilter.MinFilter(size=int(intensity * 5)))
-                img = img.filter(ImageFilter.MaxFilter(size=int(intensity * 5)))
-            elif current_filter == "closing":
-                # Closing (dilation followed by erosion)
-                img = img.filter(ImageFilter.MaxFilter(size=int(intensity * 5)))
-                img = img.filter(ImageFilter.MinFilter(size=int(intensity * 5)))
-
-            # Update processed image
-            self.processed_image = img
-
-            # Update both original and processed image displays
-            self.update_display_image()
+        return self._apply_named_filter(img, params["filter"], params["intensity"], params)
+
+    def _apply_named_filter(self, img, current_filter, intensity, params):
+        """Apply one named filter at the given intensity; params supplies the slider values some filters reuse"""
+        # One dict lookup instead of walking the chain of filter names
+        filter_fn = _FILTER_FNS.get(current_filter)
+        if filter_fn is not None:
+            img = filter_fn(img, intensity, params)
+        return img
+
+    def _filter_halo(self, name, intensity, params):
+        """Pixels of neighbourhood a filter reads around each output pixel, or None if it needs the whole image"""
+        size = int(intensity * 5)
+        if name in ("none", "grayscale", "sepia", "invert", "saturation", "threshold"):
+            return 0
+        if name == "brightness":
+            # The contrast step averages the whole image
+            return 0 if params["contrast"] == 1.0 else None
+        if name == "gaussian_blur":
+            # Gaussian tails are negligible past three radii
+            return int(3 * intensity * 5) + 1
+        if name in ("edge_detection", "emboss"):
+            return 1
+        if name == "sharpen":
+            return 1 + (int(intensity) if intensity > 1.0 else 0)
+        if name in ("median_blur", "erosion", "dilation"):
+            return size // 2
+        if name in ("opening", "closing"):
+            return 2 * (size // 2)
+        return None
+
+    def _apply_preset_fused(self, img, filters, params, tile=512):
+        """Run every filter of a preset over one tile at a time instead of materializing each step over the whole image"""
+        halo = sum(self._filter_halo(name, intensity, params) for name, intensity in filters)
+        width, height = img.size
+        out = np.empty((height, width, 3), dtype=np.uint8)
+
+        for top in range(0, height, tile):
+            bottom = min(top + tile, height)
+            for left in range(0, width, tile):
+                right = min(left + tile, width)
+                # Grow the tile by the chain's halo so its edges see the same neighbours
+                # they would in the full image, then keep only the interior
+                box = (max(0, left - halo), max(0, top - halo),
+                       min(width, right + halo), min(height, bottom + halo))
+                piece = img.crop(box)
+                for name, intensity in filters:
+                    piece = self._apply_named_filter(piece, name, intensity, params)
+                out[top:bottom, left:right] = np.asarray(piece)[
+                    top - box[1]:bottom - box[1], left - box[0]:right - box[0]]
+
+        return Image.fromarray(out)
+
+    def _apply_render_result(self, img, params, add_history):
+        """Show a rendered image and record it"""
+        # Update processed image
+        self.processed_image = img
 
-            # Update status bar
-            self.status_bar.config(
-                text=f"Brightness: {self.current_brightness}, Contrast: {self.current_contrast}, "
-                     f"Saturation: {self.current_saturation}, Hue: {self.current_hue}, "
-                     f"Filter: {self.current_filter}, Zoom: {self.zoom_factor:.1f}x"
-            )
+        # Update both original and processed image displays
+        self.update_display_image()
 
-            # Add to history (but not during history navigation or initial load)
-            if args and args[0] != "history":
-                self.add_to_history()
+        # Update status bar
+        self.status_bar.config(
+            text=f"Brightness: {params['brightness']}, Contrast: {params['contrast']}, "
+                 f"Saturation: {params['saturation']}, Hue: {params['hue']}, "
+                 f"Filter: {params['filter']}, Zoom: {self.zoom_factor:.1f}x"
+        )
+
+        if add_history:
+            self.add_to_history()
+
+    def _submit_render(self, on_done=None, add_history=True, fast=False):
+        """Render at full resolution on the worker thread and apply the result when it's done"""
+        params = self._read_render_params()
+        if fast:
+            # Filters may trade exactness for speed, e.g. while a slider is held
+            params["fast"] = True
+        future = self._executor.submit(self._render, params, "_worker_hue_out")
+        self._render_future = future
+
+        def apply(f):
+            try:
+                img = f.result()
+            except Exception as e:
+                self._report_error(f"Failed to render image: {str(e)}")
+                return
+            self._apply_render_result(img, params, add_history=add_history)
+            if on_done:
+                on_done()
+
+        self._render_apply = apply
+        future.add_done_callback(lambda f: self.root.after(0, self._finish_render, f))
+
+    def _report_error(self, message):
+        """Show an error dialog and replace the in-progress status with the error"""
+        messagebox.showerror("Error", message)
+        self.status_bar.config(text=message)
+
+    def _finish_render(self, future):
+        """Apply a background render unless a newer render has replaced it"""
+        if future is not self._render_future:
+            return
+        self._render_future = None
+        self._render_apply(future)
+
+    def _downscale(self, image, target):
+        """Shrink an image to the target size, box-averaging the integer part of the scale first"""
+        if target == image.size:
+            return image
+        # reduce() is cheap in C; the remaining < 2x is finished with one small resize
+        factor = min(image.width // target[0], image.height // target[1])
+        if factor > 1:
+            image = image.reduce(factor)
+        return image.resize(target, Image.NEAREST if self._is_dragging else Image.BILINEAR)
 
     def display_image(self, image, canvas):
-        # Resize image to fit canvas while maintaining aspect ratio
-        display_image = image.copy()
+        # Nothing to redo if this canvas already shows this image at this view
+        # (the key holds the image itself so a recycled id() can't match)
+        view_key = (image, self.zoom_factor, self.pan_x, self.pan_y, self._is_dragging)
+        last_key = getattr(canvas, '_view_key', None)
+        if last_key is not None and last_key[0] is image and last_key[1:] == view_key[1:]:
+            return
+        canvas._view_key = view_key
 
-        # Calculate new dimensions
+        # Resize image to fit canvas while maintaining aspect ratio
         max_width = 450
         max_height = 500
-        width, height = display_image.size
+        width, height = image.size
+
+        # The screen view only needs BILINEAR (NEAREST while dragging); LANCZOS is kept for saved files
+        resample = Image.NEAREST if self._is_dragging else Image.BILINEAR
 
         # Apply zoom factor
         zoomed_width = int(width * self.zoom_factor)
         zoomed_height = int(height * self.zoom_factor)
 
-        # Resize with zoom factor
-        if zoomed_width > 0 and zoomed_height > 0:  # Prevent zero dimensions
-            display_image = display_image.resize((zoomed_width, zoomed_height), Image.LANCZOS)
+        if self.zoom_factor <= 1.0:
+            # Zooming out and fitting to the canvas collapse into a single target size
+            ratio = min(1.0, max_width / max(zoomed_width, 1), max_height / max(zoomed_height, 1))
+            target = (max(1, int(zoomed_width * ratio)), max(1, int(zoomed_height * ratio)))
 
-        # Apply pan (crop to visible area)
-        if self.zoom_factor > 1.0:
+            display_image = self._downscale(image, target)
+            # The whole image is shown
+            window = (0.0, 0.0, 1.0, 1.0)
+        else:
+            # Apply pan (crop to visible area)
             # Calculate visible area
             visible_width = min(zoomed_width, max_width)
             visible_height = min(zoomed_height, max_height)
@@ -2199,21 +2790,29 @@ class ImageProcessorApp:
             right = min(left + visible_width, zoomed_width)
             bottom = min(top + visible_height, zoomed_height)
 
-            # Crop to visible area
-            if right > left and bottom > top:  # Ensure valid crop area
-                display_image = display_image.crop((left, top, right, bottom))
-
-        # Final resize to fit canvas if needed
-        width, height = display_image.size
-        if width > max_width or height > max_height:
-            ratio = min(max_width/width, max_height/height)
-            new_width = int(width * ratio)
-            new_height = int(height * ratio)
-            display_image = display_image.resize((new_width, new_height), Image.LANCZOS)
+            # Resample only the visible window, straight from the source, in a single resize;
+            # the window never exceeds the canvas so no second fit-to-canvas pass is needed
+            zoom = self.zoom_factor
+            display_image = image.resize((right - left, bottom - top), resample,
+                                         box=(left / zoom, top / zoom, right / zoom, bottom / zoom))
+            window = (left / zoomed_width, top / zoomed_height, right / zoomed_width, bottom / zoomed_height)
+
+        # Where the image sits on the canvas (centered on its image item) and which part of it
+        # is shown there, as fractions, so crop selections map back without asking Tk for sizes
+        shown_width, shown_height = display_image.size
+        canvas._view_map = (225 - shown_width // 2, 250 - shown_height // 2,
+                            shown_width, shown_height) + window
+
+        # Reuse the canvas' PhotoImage when the size is unchanged (e.g. during a slider drag)
+        photo = getattr(canvas, 'image', None)
+        if photo is not None and (photo.width(), photo.height()) == display_image.size:
+            photo.paste(display_image)
+            return
 
-        # Convert to PhotoImage and display
+        # Otherwise convert to a new PhotoImage and swap it into the canvas image item
         photo = ImageTk.PhotoImage(display_image)
-        canvas.config(image=photo)
+        item_id = self._orig_img_id if canvas is self.original_canvas else self._proc_img_id
+        canvas.itemconfig(item_id, image=photo)
         canvas.image = photo  # Keep a reference to prevent garbage collection
 
     def setup_drag_drop(self):
@@ -2227,7 +2826,14 @@ class ImageProcessorApp:
         """Handle file drop event"""
         pass
 
-    def save_image(self):
+    def save_image(self, event=None):
+        # Make sure a pending slider preview is rendered at full resolution first
+        if self._pending_update:
+            self._commit_adjustments()
+        # Wait for an in-flight background render so the saved file is up to date
+        if self._render_future is not None:
+            self._finish_render(self._render_future)
+
         if self.processed_image:
             # Create a dialog with format options
             formats = [
@@ -2282,19 +2888,19 @@ class ImageProcessorApp:
         Label(header_frame, text="Export Image", font=self.header_font, bg=self.accent_color, fg="white").pack()
 
         # Content frame
-        content_frame = Frame(export_dialog, bg=self.bg_color, padx=20, pady=20)
+        content_frame = Frame(export_dialog, padx=20, pady=20)
         content_frame.pack(fill=tk.BOTH, expand=True)
 
         # File format selection
-        format_frame = Frame(content_frame, bg=self.bg_color)
+        format_frame = Frame(content_frame)
         format_frame.pack(fill=tk.X, pady=10)
 
-        Label(format_frame, text="File Format:", font=self.subheader_font, bg=self.bg_color, fg=self.text_color).pack(anchor=tk.W)
+        Label(format_frame, text="File Format:", font=self.subheader_font).pack(anchor=tk.W)
 
         format_var = StringVar(value="PNG")
         formats = ["PNG", "JPEG", "BMP", "TIFF", "WEBP"]
 
-        format_frame_inner = Frame(format_frame, bg=self.bg_color)
+        format_frame_inner = Frame(format_frame)
         format_frame_inner.pack(fill=tk.X, pady=5)
 
         for i, fmt in enumerate(formats):
@@ -2304,11 +2910,10 @@ class ImageProcessorApp:
             rb.grid(row=0, column=i, padx=10)
 
         # Quality setting (for JPEG and WEBP)
-        quality_frame = Frame(content_frame, bg=self.bg_color)
+        quality_frame = Frame(content_frame)
         quality_frame.pack(fill=tk.X, pady=10)
 
-        Label(quality_frame, text="Quality (for JPEG/WEBP):", font=self.subheader_font,
-             bg=self.bg_color, fg=self.text_color).pack(anchor=tk.W)
+        Label(quality_frame, text="Quality (for JPEG/WEBP):", font=self.subheader_font).pack(anchor=tk.W)
 
         quality_var = IntVar(value=90)
         quality_scale = Scale(quality_frame, from_=1, to=100, orient=tk.HORIZONTAL,
@@ -2318,17 +2923,16 @@ class ImageProcessorApp:
         quality_scale.pack(fill=tk.X, pady=5)
 
         # Size options
-        size_frame = Frame(content_frame, bg=self.bg_color)
+        size_frame = Frame(content_frame)
         size_frame.pack(fill=tk.X, pady=10)
 
-        Label(size_frame, text="Resize Options:", font=self.subheader_font,
-             bg=self.bg_color, fg=self.text_color).pack(anchor=tk.W)
+        Label(size_frame, text="Resize Options:", font=self.subheader_font).pack(anchor=tk.W)
 
         size_var = StringVar(value="original")
         Radiobutton(size_frame, text="Original Size", variable=size_var, value="original",
                    bg=self.bg_color, font=self.normal_font).pack(anchor=tk.W)
 
-        custom_size_frame = Frame(size_frame, bg=self.bg_color)
+        custom_size_frame = Frame(size_frame)
         custom_size_frame.pack(fill=tk.X, pady=5)
 
         Radiobutton(custom_size_frame, text="Custom Size:", variable=size_var, value="custom",
@@ -2346,15 +2950,15 @@ class ImageProcessorApp:
         width_entry = Entry(custom_size_frame, textvariable=width_var, width=5)
         width_entry.pack(side=tk.LEFT, padx=5)
 
-        Label(custom_size_frame, text="×", bg=self.bg_color).pack(side=tk.LEFT)
+        Label(custom_size_frame, text="×").pack(side=tk.LEFT)
 
         height_entry = Entry(custom_size_frame, textvariable=height_var, width=5)
         height_entry.pack(side=tk.LEFT, padx=5)
 
-        Label(custom_size_frame, text="pixels", bg=self.bg_color).pack(side=tk.LEFT, padx=5)
+        Label(custom_size_frame, text="pixels").pack(side=tk.LEFT, padx=5)
 
         # Buttons
-        button_frame = Frame(content_frame, bg=self.bg_color)
+        button_frame = Frame(content_frame)
         button_frame.pack(fill=tk.X, pady=20)
 
         def do_export():
@@ -2409,6 +3013,80 @@ class ImageProcessorApp:
                           width=10, bg=self.accent_color, fg="white", font=self.normal_font)
         export_btn.pack(side=tk.RIGHT, padx=10)
 
+    def _apply_crop_method(self, img, target_size, method, resample=Image.LANCZOS):
+        """Bring img to target_size by fitting, filling (center crop) or stretching; img itself is left untouched"""
+        if method == "fit":
+            # Shrink to fit within dimensions while preserving aspect ratio. Same as thumbnail()
+            # (never enlarges, same reducing gap), but it needs no full-size copy to work on
+            scale = min(target_size[0] / img.width, target_size[1] / img.height)
+            if scale < 1.0:
+                img = img.resize((max(1, round(img.width * scale)), max(1, round(img.height * scale))),
+                                 resample, reducing_gap=2.0)
+            if img.size == tuple(target_size):
+                # Nothing left to letterbox
+                return img
+            # Create a blank canvas of the target size
+            new_img = Image.new("RGB", target_size, (0, 0, 0))
+            # Paste the resized image in the center
+            paste_x = (target_size[0] - img.width) // 2
+            paste_y = (target_size[1] - img.height) // 2
+            new_img.paste(img, (paste_x, paste_y))
+            return new_img
+        if method == "fill":
+            # Calculate aspect ratios
+            img_ratio = img.width / img.height
+            target_ratio = target_size[0] / target_size[1]
+
+            if img_ratio > target_ratio:
+                # Image is wider than target, crop sides
+                new_width = int(img.height * target_ratio)
+                left = (img.width - new_width) // 2
+                img = img.crop((left, 0, left + new_width, img.height))
+            else:
+                # Image is taller than target, crop top/bottom
+                new_height = int(img.width / target_ratio)
+                top = (img.height - new_height) // 2
+                img = img.crop((0, top, img.width, top + new_height))
+
+        # Resize to exact dimensions (stretch ignores the aspect ratio)
+        return img.resize(target_size, resample)
+
+    def _platform_preview(self, base, source_size, target_size, method, max_size=(300, 200)):
+        """Render what _apply_crop_method(source, target_size, method) would export, scaled to fit
+        max_size, in one resize of base (a downscaled copy of the source of size source_size)"""
+        ratio = min(max_size[0] / target_size[0], max_size[1] / target_size[1])
+        out_size = (max(1, int(target_size[0] * ratio)), max(1, int(target_size[1] * ratio)))
+        width, height = source_size
+
+        if method == "fit":
+            # The export never enlarges, so size the fitted image against the real source
+            scale = min(1.0, target_size[0] / width, target_size[1] / height)
+            fitted = (max(1, round(width * scale * ratio)), max(1, round(height * scale * ratio)))
+            img = base.resize(fitted, Image.BILINEAR)
+            if fitted == out_size:
+                return img
+            new_img = Image.new("RGB", out_size, (0, 0, 0))
+            new_img.paste(img, ((out_size[0] - fitted[0]) // 2, (out_size[1] - fitted[1]) // 2))
+            return new_img
+
+        box = (0, 0, width, height)
+        if method == "fill":
+            # Same center crop as the export, mapped onto the base
+            target_ratio = target_size[0] / target_size[1]
+            if width / height > target_ratio:
+                new_width = int(height * target_ratio)
+                left = (width - new_width) // 2
+                box = (left, 0, left + new_width, height)
+            else:
+                new_height = int(width / target_ratio)
+                top = (height - new_height) // 2
+                box = (0, top, width, top + new_height)
+        # Per axis, since the base's size was rounded on each separately
+        scale_x, scale_y = base.width / width, base.height / height
+        box = (box[0] * scale_x, box[1] * scale_y,
+               min(base.width, box[2] * scale_x), min(base.height, box[3] * scale_y))
+        return base.resize(out_size, Image.BILINEAR, box=box)
+
     def social_media_export(self):
         """Export image optimized for social media platforms"""
         if not self.processed_image:
@@ -2426,11 +3104,11 @@ class ImageProcessorApp:
 
         # Button frame - this should be outside the scrollable area
         # Create a separate frame at the bottom of the dialog for buttons
-        button_frame = Frame(export_dialog, bg=self.bg_color, padx=20, pady=15)
+        button_frame = Frame(export_dialog, padx=20, pady=15)
         button_frame.pack(side=tk.BOTTOM, fill=tk.X)
 
         # Create a main frame that will contain everything else
-        main_container = Frame(export_dialog, bg=self.bg_color)
+        main_container = Frame(export_dialog)
         main_container.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=5, pady=5)
 
         # Create a canvas for scrolling
@@ -2445,7 +3123,7 @@ class ImageProcessorApp:
         canvas.configure(yscrollcommand=scrollbar.set)
 
         # Create a frame inside the canvas for all content
-        content_frame = Frame(canvas, bg=self.bg_color)
+        content_frame = Frame(canvas)
         canvas_window = canvas.create_window((0, 0), window=content_frame, anchor=tk.NW, tags="content_frame")
 
         # Configure the canvas to update its scroll region when the content frame changes size
@@ -2460,18 +3138,18 @@ class ImageProcessorApp:
         export_dialog.grid_columnconfigure(0, weight=1)
 
         # Add a header
-        header_frame = Frame(content_frame, bg=self.bg_color, pady=10)
+        header_frame = Frame(content_frame, pady=10)
         header_frame.pack(fill=tk.X)
 
         Label(header_frame, text="Export Image for Social Media",
-              font=self.header_font, bg=self.bg_color, fg=self.accent_color).pack()
+              font=self.header_font, fg=self.accent_color).pack()
 
         # Create a frame for the platform selection
-        platform_frame = Frame(content_frame, bg=self.bg_color, padx=20, pady=10)
+        platform_frame = Frame(content_frame, padx=20, pady=10)
         platform_frame.pack(fill=tk.X)
 
         Label(platform_frame, text="Select Platform:",
-              font=self.subheader_font, bg=self.bg_color, fg=self.text_color).pack(anchor=tk.W)
+              font=self.subheader_font).pack(anchor=tk.W)
 
         # Define social media platforms and their optimal image sizes
         platforms = {
@@ -2493,7 +3171,7 @@ class ImageProcessorApp:
         self.selected_platform.set(list(platforms.keys())[0])  # Default to first platform
 
         # Create a listbox with scrollbar for platform selection
-        platform_list_frame = Frame(platform_frame, bg=self.bg_color)
+        platform_list_frame = Frame(platform_frame)
         platform_list_frame.pack(fill=tk.BOTH, expand=True, pady=10)
 
         scrollbar = Scrollbar(platform_list_frame)
@@ -2515,66 +3193,57 @@ class ImageProcessorApp:
         platform_listbox.selection_set(0)
 
         # Create a frame for displaying platform details
-        details_frame = Frame(content_frame, bg=self.bg_color, padx=20, pady=10)
+        details_frame = Frame(content_frame, padx=20, pady=10)
         details_frame.pack(fill=tk.X)
 
         # Labels for displaying platform details
         Label(details_frame, text="Platform Details:",
-              font=self.subheader_font, bg=self.bg_color, fg=self.text_color).pack(anchor=tk.W)
+              font=self.subheader_font).pack(anchor=tk.W)
 
-        details_content = Frame(details_frame, bg=self.bg_color, pady=5)
+        details_content = Frame(details_frame, pady=5)
         details_content.pack(fill=tk.X)
 
         # Create labels for each detail
-        size_label = Label(details_content, text="Size: ",
-                          font=self.normal_font, bg=self.bg_color, fg=self.text_color)
+        size_label = Label(details_content, text="Size: ")
         size_label.grid(row=0, column=0, sticky=tk.W, pady=2)
 
-        self.size_value = Label(details_content, text="",
-                               font=self.normal_font, bg=self.bg_color, fg=self.text_color)
+        self.size_value = Label(details_content, text="")
         self.size_value.grid(row=0, column=1, sticky=tk.W, pady=2)
 
-        format_label = Label(details_content, text="Format: ",
-                            font=self.normal_font, bg=self.bg_color, fg=self.text_color)
+        format_label = Label(details_content, text="Format: ")
         format_label.grid(row=1, column=0, sticky=tk.W, pady=2)
 
-        self.format_value = Label(details_content, text="",
-                                 font=self.normal_font, bg=self.bg_color, fg=self.text_color)
+        self.format_value = Label(details_content, text="")
         self.format_value.grid(row=1, column=1, sticky=tk.W, pady=2)
 
-        quality_label = Label(details_content, text="Quality: ",
-                             font=self.normal_font, bg=self.bg_color, fg=self.text_color)
+        quality_label = Label(details_content, text="Quality: ")
         quality_label.grid(row=2, column=0, sticky=tk.W, pady=2)
 
-        self.quality_value = Label(details_content, text="",
-                                  font=self.normal_font, bg=self.bg_color, fg=self.text_color)
+        self.quality_value = Label(details_content, text="")
         self.quality_value.grid(row=2, column=1, sticky=tk.W, pady=2)
 
-        desc_label = Label(details_content, text="Description: ",
-                          font=self.normal_font, bg=self.bg_color, fg=self.text_color)
+        desc_label = Label(details_content, text="Description: ")
         desc_label.grid(row=3, column=0, sticky=tk.W, pady=2)
 
-        self.desc_value = Label(details_content, text="",
-                               font=self.normal_font, bg=self.bg_color, fg=self.text_color)
+        self.desc_value = Label(details_content, text="")
         self.desc_value.grid(row=3, column=1, sticky=tk.W, pady=2)
 
         # Create a frame for export options
-        options_frame = Frame(content_frame, bg=self.bg_color, padx=20, pady=10)
+        options_frame = Frame(content_frame, padx=20, pady=10)
         options_frame.pack(fill=tk.X)
 
         Label(options_frame, text="Export Options:",
-              font=self.subheader_font, bg=self.bg_color, fg=self.text_color).pack(anchor=tk.W)
+              font=self.subheader_font).pack(anchor=tk.W)
 
         # Crop method options
-        crop_frame = Frame(options_frame, bg=self.bg_color, pady=5)
+        crop_frame = Frame(options_frame, pady=5)
         crop_frame.pack(fill=tk.X)
 
-        Label(crop_frame, text="Crop Method:",
-              font=self.normal_font, bg=self.bg_color, fg=self.text_color).pack(anchor=tk.W)
+        Label(crop_frame, text="Crop Method:").pack(anchor=tk.W)
 
         crop_method = StringVar(export_dialog, value="fit")
 
-        crop_options = Frame(crop_frame, bg=self.bg_color)
+        crop_options = Frame(crop_frame)
         crop_options.pack(fill=tk.X, pady=5)
 
         Radiobutton(crop_options, text="Fit (preserve aspect ratio)", variable=crop_method, value="fit",
@@ -2585,13 +3254,12 @@ class ImageProcessorApp:
                    bg=self.bg_color, font=self.normal_font).pack(anchor=tk.W)
 
         # Custom quality option
-        quality_frame = Frame(options_frame, bg=self.bg_color, pady=5)
+        quality_frame = Frame(options_frame, pady=5)
         quality_frame.pack(fill=tk.X)
 
-        Label(quality_frame, text="Custom Quality:",
-              font=self.normal_font, bg=self.bg_color, fg=self.text_color).pack(anchor=tk.W)
+        Label(quality_frame, text="Custom Quality:").pack(anchor=tk.W)
 
-        quality_slider_frame = Frame(quality_frame, bg=self.bg_color)
+        quality_slider_frame = Frame(quality_frame)
         quality_slider_frame.pack(fill=tk.X, pady=5)
 
         custom_quality = IntVar(export_dialog, value=85)
@@ -2602,17 +3270,38 @@ class ImageProcessorApp:
         quality_slider.pack(side=tk.LEFT)
 
         # Preview frame
-        preview_frame = Frame(content_frame, bg=self.bg_color, padx=20, pady=10)
+        preview_frame = Frame(content_frame, padx=20, pady=10)
         preview_frame.pack(fill=tk.X)
 
         Label(preview_frame, text="Preview:",
-              font=self.subheader_font, bg=self.bg_color, fg=self.text_color).pack(anchor=tk.W)
+              font=self.subheader_font).pack(anchor=tk.W)
 
         # Preview canvas
         preview_canvas = Label(preview_frame, bg="#222222", width=30, height=10)
         preview_canvas.pack(pady=10)
 
         # Function to update platform details and preview
+        # (platform, crop method) -> (source image, preview image); toggling back to a
+        # combination seen before skips both resizes
+        preview_cache = {}
+        # (source image, downscaled copy) the platform previews are cut from
+        preview_base = [None, None]
+        # Pending after() id of the next preview render
+        preview_after_id = [None]
+
+        def get_preview_base():
+            """Return processed_image shrunk to at most 1024 px on its longest side, rebuilt only after an edit"""
+            source = self.processed_image
+            if preview_base[0] is not source:
+                ratio = 1024 / max(source.size)
+                if ratio < 1.0:
+                    size = (max(1, int(source.width * ratio)), max(1, int(source.height * ratio)))
+                    preview_base[1] = self._downscale(source, size)
+                else:
+                    preview_base[1] = source
+                preview_base[0] = source
+            return preview_base[1]
+
         def update_platform_details(event=None):
             selected_idx = platform_listbox.curselection()
             if not selected_idx:
@@ -2630,65 +3319,63 @@ class ImageProcessorApp:
             # Set quality slider to platform default
             custom_quality.set(platform_data['quality'])
 
+            schedule_platform_preview()
+
+        def schedule_platform_preview():
+            selected_idx = platform_listbox.curselection()
+            if not selected_idx:
+                return
+            # Render the preview once the selection settles, so holding an arrow key or clicking
+            # through the crop methods doesn't resize for every step on the way
+            if preview_after_id[0] is not None:
+                export_dialog.after_cancel(preview_after_id[0])
+            preview_after_id[0] = export_dialog.after(120, render_platform_preview,
+                                                      platform_listbox.get(selected_idx[0]))
+
+        def render_platform_preview(selected):
+            preview_after_id[0] = None
+            platform_data = platforms[selected]
+
             # Update preview
             if self.processed_image:
-                # Create a preview of how the image will look
-                preview_img = self.processed_image.copy()
-                target_size = platform_data['size']
-
-                # Apply selected crop method
                 method = crop_method.get()
-                if method == "fit":
-                    # Resize to fit within dimensions while preserving aspect ratio
-                    preview_img.thumbnail(target_size, Image.LANCZOS)
-                    # Create a blank canvas of the target size
-                    new_img = Image.new("RGB", target_size, (0, 0, 0))
-                    # Paste the resized image in the center
-                    paste_x = (target_size[0] - preview_img.width) // 2
-                    paste_y = (target_size[1] - preview_img.height) // 2
-                    new_img.paste(preview_img, (paste_x, paste_y))
-                    preview_img = new_img
-                elif method == "fill":
-                    # Calculate aspect ratios
-                    img_ratio = preview_img.width / preview_img.height
-                    target_ratio = target_size[0] / target_size[1]
-
-                    if img_ratio > target_ratio:
-                        # Image is wider than target, crop sides
-                        new_width = int(preview_img.height * target_ratio)
-                        left = (preview_img.width - new_width) // 2
-                        preview_img = preview_img.crop((left, 0, left + new_width, preview_img.height))
-                    else:
-                        # Image is taller than target, crop top/bottom
-                        new_height = int(preview_img.width / target_ratio)
-                        top = (preview_img.height - new_height) // 2
-                        preview_img = preview_img.crop((0, top, preview_img.width, top + new_height))
-
-                    # Resize to exact dimensions
-                    preview_img = preview_img.resize(target_size, Image.LANCZOS)
-                else:  # stretch
-                    # Just resize to the exact dimensions, ignoring aspect ratio
-                    preview_img = preview_img.resize(target_size, Image.LANCZOS)
-
-                # Convert to PhotoImage for display
-                # Resize for preview (smaller)
-                preview_display_size = (300, 200)
-                ratio = min(preview_display_size[0] / preview_img.width,
-                           preview_display_size[1] / preview_img.height)
-                display_size = (int(preview_img.width * ratio), int(preview_img.height * ratio))
-                preview_display = preview_img.resize(display_size, Image.LANCZOS)
-
-                # Convert to PhotoImage
-                preview_photo = ImageTk.PhotoImage(preview_display)
-                preview_canvas.config(image=preview_photo, width=display_size[0], height=display_size[1])
-                preview_canvas.image = preview_photo  # Keep a reference
+                cached = preview_cache.get((selected, method))
+                if cached is not None and cached[0] is self.processed_image:
+                    preview_display = cached[1]
+                else:
+                    # Create a preview of how the image will look; it ends up at most 300x200,
+                    # so render it at that size from the small base in a single resize
+                    preview_display = self._platform_preview(get_preview_base(), self.processed_image.size,
+                                                             platform_data['size'], method)
+                    preview_cache[(selected, method)] = (self.processed_image, preview_display)
+
+                # Reuse the shown PhotoImage when the size is unchanged instead of allocating
+                # a new Tk image for every preview
+                preview_photo = getattr(preview_canvas, 'image', None)
+                if preview_photo is not None and (preview_photo.width(), preview_photo.height()) == preview_display.size:
+                    preview_photo.paste(preview_display)
+                else:
+                    # Convert to PhotoImage
+                    preview_photo = ImageTk.PhotoImage(preview_display)
+                    preview_canvas.config(image=preview_photo, width=preview_display.width,
+                                          height=preview_display.height)
+                    preview_canvas.image = preview_photo  # Keep a reference
 
         # Bind the listbox selection event
         platform_listbox.bind('<<ListboxSelect>>', update_platform_details)
 
-        # Also update when crop method changes
-        for rb in crop_options.winfo_children():
-            rb.config(command=update_platform_details)
+        # A crop method change only affects the preview; the platform's details and the
+        # user's quality setting stay as they are. One trace on the shared variable covers
+        # every radio button
+        crop_method.trace_add('write', lambda *_: schedule_platform_preview())
+
+        def cancel_platform_preview(event):
+            # The callback would outlive the dialog's widgets
+            if event.widget is export_dialog and preview_after_id[0] is not None:
+                export_dialog.after_cancel(preview_after_id[0])
+                preview_after_id[0] = None
+
+        export_dialog.bind('<Destroy>', cancel_platform_preview, add='+')
 
 
 
@@ -2712,63 +3399,48 @@ class ImageProcessorApp:
             if not file_path:
                 return
 
-            # Process the image according to selected options
-            export_img = self.processed_image.copy()
-            target_size = platform_data['size']
-
-            # Apply selected crop method
+            # Snapshot the options; the worker must not touch Tk
+            source = self.processed_image
             method = crop_method.get()
-            if method == "fit":
-                # Resize to fit within dimensions while preserving aspect ratio
-                export_img.thumbnail(target_size, Image.LANCZOS)
-                # Create a blank canvas of the target size
-                new_img = Image.new("RGB", target_size, (0, 0, 0))
-                # Paste the resized image in the center
-                paste_x = (target_size[0] - export_img.width) // 2
-                paste_y = (target_size[1] - export_img.height) // 2
-                new_img.paste(export_img, (paste_x, paste_y))
-                export_img = new_img
-            elif method == "fill":
-                # Calculate aspect ratios
-                img_ratio = export_img.width / export_img.height
-                target_ratio = target_size[0] / target_size[1]
-
-                if img_ratio > target_ratio:
-                    # Image is wider than target, crop sides
-                    new_width = int(export_img.height * target_ratio)
-                    left = (export_img.width - new_width) // 2
-                    export_img = export_img.crop((left, 0, left + new_width, export_img.height))
-                else:
-                    # Image is taller than target, crop top/bottom
-                    new_height = int(export_img.width / target_ratio)
-                    top = (export_img.height - new_height) // 2
-                    export_img = export_img.crop((0, top, export_img.width, top + new_height))
-
-                # Resize to exact dimensions
-                export_img = export_img.resize(target_size, Image.LANCZOS)
-            else:  # stretch
-                # Just resize to the exact dimensions, ignoring aspect ratio
-                export_img = export_img.resize(target_size, Image.LANCZOS)
-
-            # Save with selected quality
             quality_val = custom_quality.get()
-            try:
-                if platform_data['format'].lower() == 'jpg':
+            image_format = platform_data['format'].lower()
+
+            def export():
+                # Process the image according to selected options
+                export_img = self._apply_crop_method(source, platform_data['size'], method)
+
+                # Save with selected quality
+                if image_format == 'jpg':
                     export_img.save(file_path, format='JPEG', quality=quality_val)
-                elif platform_data['format'].lower() == 'png':
+                elif image_format == 'png':
                     export_img.save(file_path, format='PNG')
                 else:
                     export_img.save(file_path, quality=quality_val)
 
+            def finish(future):
+                dialog_open = export_dialog.winfo_exists()
+                try:
+                    future.result()
+                except Exception as e:
+                    if dialog_open:
+                        export_btn.config(state=tk.NORMAL)
+                    messagebox.showerror("Export Error", f"Error exporting image: {str(e)}")
+                    return
                 self.status_bar.config(text=f"Image exported for {selected} to {file_path}")
-                export_dialog.destroy()
-            except Exception as e:
-                messagebox.showerror("Export Error", f"Error exporting image: {str(e)}")
+                if dialog_open:
+                    export_dialog.destroy()
+
+            # Resize and encode on the worker so the UI stays responsive meanwhile
+            export_btn.config(state=tk.DISABLED)
+            self.status_bar.config(text=f"Exporting for {selected}...")
+            future = self._executor.submit(export)
+            future.add_done_callback(lambda f: self.root.after(0, finish, f))
 
         # Export and Cancel buttons
-        Button(button_frame, text="Export", command=do_export,
-               width=10, bg=self.accent_color, fg="white",
-               activebackground=self.highlight_color, font=self.normal_font).pack(side=tk.RIGHT, padx=5)
+        export_btn = Button(button_frame, text="Export", command=do_export,
+                            width=10, bg=self.accent_color, fg="white",
+                            activebackground=self.highlight_color, font=self.normal_font)
+        export_btn.pack(side=tk.RIGHT, padx=5)
 
         Button(button_frame, text="Cancel", command=export_dialog.destroy,
                width=10, bg=self.bg_color,
@@ -2783,18 +3455,26 @@ class ImageProcessorApp:
         Args:
             update_image (bool): Whether to update the image after resetting adjustments
         """
+        # Drop debounced slider and intensity previews; the single render below supersedes them
+        if self._pending_update:
+            self.root.after_cancel(self._pending_update)
+            self._pending_update = None
+        if self._intensity_after_id is not None:
+            self.root.after_cancel(self._intensity_after_id)
+            self._intensity_after_id = None
+
         # Reset all sliders to default values
-        self.brightness_slider.set(0)
-        self.contrast_slider.set(1.0)
-        self.saturation_slider.set(1.0)
-        self.hue_slider.set(0)
+        self.brightness_var.set(0)
+        self.contrast_var.set(1.0)
+        self.saturation_var.set(1.0)
+        self.hue_var.set(0)
 
         # Reset filter settings
         self.filter_intensity.set(1.0)
         self.current_filter.set("none")
 
         # Reset histogram equalization
-        self.histogram_eq_var.set(False)
+        self.histogram_eq_applied = False
 
         # Turn off crop mode
         self.crop_mode = False
@@ -2804,8 +3484,7 @@ class ImageProcessorApp:
             self.update_image("force")
 
             # Clear history
-            self.history = []
-            self.history_position = -1
+            self._clear_history()
 
             # Add current state to history
             self.add_to_history()
@@ -2814,10 +3493,27 @@ class ImageProcessorApp:
             self.status_bar.config(text="All adjustments reset to default")
 
     # New methods for additional features
+    def _get_work_arr(self):
+        """Return processed_image as a C-contiguous uint8 array, converting only when it changed"""
+        if self._work_src is not self.processed_image:
+            self._work_arr = np.ascontiguousarray(np.asarray(self.processed_image, dtype=np.uint8))
+            self._work_src = self.processed_image
+        return self._work_arr
+
+    def _set_work_arr(self, arr):
+        """Store a new working array and materialize processed_image from it"""
+        self._work_arr = np.ascontiguousarray(arr)
+        self.processed_image = Image.fromarray(self._work_arr)
+        self._work_src = self.processed_image
+
     def rotate_image(self, degrees):
         """Rotate the processed image by the specified degrees"""
         if self.processed_image:
-            self.processed_image = rotate_image(self.processed_image, degrees)
+            if NUMPY_AVAILABLE and degrees % 90 == 0:
+                # Quarter turns are exact, so just reorder the pixels
+                self._set_work_arr(np.rot90(self._get_work_arr(), k=-degrees // 90))
+            else:
+                self.processed_image = rotate_image(self.processed_image, degrees)
             self.display_image(self.processed_image, self.processed_canvas)
             self.add_to_history()
             self.status_bar.config(text=f"Image rotated by {degrees} degrees")
@@ -2825,7 +3521,10 @@ class ImageProcessorApp:
     def flip_horizontal(self):
         """Flip the processed image horizontally"""
         if self.processed_image:
-            self.processed_image = flip_image_horizontal(self.processed_image)
+            if NUMPY_AVAILABLE:
+                self._set_work_arr(self._get_work_arr()[:, ::-1])
+            else:
+                self.processed_image = flip_image_horizontal(self.processed_image)
             self.display_image(self.processed_image, self.processed_canvas)
             self.add_to_history()
             self.status_bar.config(text="Image flipped horizontally")
@@ -2833,7 +3532,10 @@ class ImageProcessorApp:
     def flip_vertical(self):
         """Flip the processed image vertically"""
         if self.processed_image:
-            self.processed_image = flip_image_vertical(self.processed_image)
+            if NUMPY_AVAILABLE:
+                self._set_work_arr(self._get_work_arr()[::-1])
+            else:
+                self.processed_image = flip_image_vertical(self.processed_image)
             self.display_image(self.processed_image, self.processed_canvas)
             self.add_to_history()
             self.status_bar.config(text="Image flipped vertically")
@@ -2844,8 +3546,9 @@ class ImageProcessorApp:
         """Toggle real-time preview on/off"""
         self.real_time_preview = self.preview_var.get()
         if self.real_time_preview:
-            # Force update when turning preview back on
-            self.update_image("force")
+            # Catch up on the changes made while preview was off, on the worker
+            if self.original_image:
+                self._submit_render()
             self.status_bar.config(text="Real-time preview enabled")
         else:
             self.status_bar.config(text="Real-time preview disabled - use sliders and click Apply to see changes")
@@ -2876,7 +3579,8 @@ class ImageProcessorApp:
 
     def update_resize_dimensions(self):
         """Update resize input fields with current image dimensions"""
-        if self.original_image:
+        # The Transform tab may not have been built yet; it calls this when it is
+        if self.original_image and hasattr(self, "width_entry"):
             width, height = self.original_image.size
 
             # Update current size label
@@ -2951,7 +3655,13 @@ class ImageProcessorApp:
         """Animate the file icon in the file tab header"""
         self.file_icon_index = (self.file_icon_index + 1) % len(self.file_icons)
         self.file_icon_label.config(text=self.file_icons[self.file_icon_index])
-        self.root.after(1000, self.animate_file_icon)  # Change icon every second
+        self._file_icon_after_id = self.root.after(1000, self.animate_file_icon)  # Change icon every second
+
+    def _pause_file_icon(self):
+        """Stop the file icon animation while the File tab is hidden"""
+        if self._file_icon_after_id is not None:
+            self.root.after_cancel(self._file_icon_after_id)
+            self._file_icon_after_id = None
 
     def update_file_size_estimate(self, width, height):
         """Estimate file size based on dimensions and color depth"""
@@ -2960,9 +3670,7 @@ class ImageProcessorApp:
 
         # Simple estimation based on dimensions and color depth
         # Actual file size will vary based on format and compression
-        color_depth = 3  # RGB (3 bytes per pixel)
-        if self.original_image.mode == 'RGBA':
-            color_depth = 4  # RGBA (4 bytes per pixel)
+        color_depth = len(self.original_image.getbands())  # One byte per band
 
         # Calculate raw size in bytes
         raw_size = width * height * color_depth
@@ -3029,8 +3737,7 @@ class ImageProcessorApp:
                     self.status_bar.config(text="Invalid dimensions: Width and height must be positive")
                     return
 
-                # Create preview
-                preview_image = resize_image(self.processed_image, width, height, keep_aspect)
+                new_width, new_height = get_resize_dimensions(self.processed_image, width, height, keep_aspect)
 
             else:  # percentage
                 # Get percentage
@@ -3041,14 +3748,25 @@ class ImageProcessorApp:
                     self.status_bar.config(text="Invalid percentage: Must be positive")
                     return
 
-                # Create preview
-                preview_image = resize_by_percentage(self.processed_image, percentage)
+                new_width, new_height = get_percentage_dimensions(self.processed_image, percentage)
+
+            # Create preview
+            if (new_width, new_height) == self.processed_image.size:
+                preview_image = self.processed_image
+            elif self.zoom_factor <= 1.0:
+                # Unzoomed, the canvas shows at most 450x500 of it: build the preview at that size in
+                # one pass instead of resizing to the full new size and shrinking that again
+                ratio = min(1.0, 450 / new_width, 500 / new_height)
+                preview_image = self._downscale(self.processed_image,
+                                                (max(1, int(new_width * ratio)), max(1, int(new_height * ratio))))
+            else:
+                # Zoomed in, the view needs the full-resolution result to pan over
+                preview_image = self.processed_image.resize((new_width, new_height), Image.LANCZOS)
 
             # Display preview
             self.display_image(preview_image, self.processed_canvas)
 
             # Update status
-            new_width, new_height = preview_image.size
             self.status_bar.config(text=f"Preview: {new_width}×{new_height} pixels (click Apply to save changes)")
 
             # Update new size label
@@ -3057,7 +3775,7 @@ class ImageProcessorApp:
             # Update file size estimate
             self.update_file_size_estimate(new_width, new_height)
 
-        except ValueError:
+        except (ValueError, ZeroDivisionError):
             self.status_bar.config(text="Invalid dimensions: Please enter numeric values")
 
     def apply_resize(self):
@@ -3081,7 +3799,7 @@ class ImageProcessorApp:
                     return
 
                 # Resize the image
-                self.processed_image = resize_image(self.processed_image, width, height, keep_aspect)
+                resized = resize_image(self.processed_image, width, height, keep_aspect)
 
             else:  # percentage
                 # Get percentage
@@ -3093,7 +3811,13 @@ class ImageProcessorApp:
                     return
 
                 # Resize the image
-                self.processed_image = resize_by_percentage(self.processed_image, percentage)
+                resized = resize_by_percentage(self.processed_image, percentage)
+
+            # Same size: no new pixels, so no redraw and no history entry
+            if resized is self.processed_image:
+                self.status_bar.config(text="No resize needed: the image is already that size")
+                return
+            self.processed_image = resized
 
             # Update display
             self.display_image(self.processed_image, self.processed_canvas)
@@ -3131,6 +3855,8 @@ class ImageProcessorApp:
             # Get the canvas coordinates
             self.crop_start_x = event.x
             self.crop_start_y = event.y
+            self.processed_canvas.coords(self._crop_rect_id, event.x, event.y, event.x, event.y)
+            self.processed_canvas.itemconfig(self._crop_rect_id, state=tk.NORMAL)
 
     def on_mouse_drag(self, event):
         """Handle mouse drag"""
@@ -3139,10 +3865,9 @@ class ImageProcessorApp:
             self.crop_end_x = event.x
             self.crop_end_y = event.y
 
-            # Show crop rectangle (this would be better with a proper canvas)
-            self.status_bar.config(
-                text=f"Crop selection: ({self.crop_start_x}, {self.crop_start_y}) to ({self.crop_end_x}, {self.crop_end_y})"
-            )
+            # Show crop rectangle
+            self.processed_canvas.coords(self._crop_rect_id, self.crop_start_x, self.crop_start_y,
+                                         self.crop_end_x, self.crop_end_y)
 
     def on_mouse_up(self, event):
         """Handle mouse button release"""
@@ -3150,28 +3875,32 @@ class ImageProcessorApp:
             # Finalize end coordinates
             self.crop_end_x = event.x
             self.crop_end_y = event.y
+            self.processed_canvas.itemconfig(self._crop_rect_id, state=tk.HIDDEN)
+
+            # Too small to be a deliberate selection (e.g. a plain click)
+            if abs(self.crop_end_x - self.crop_start_x) < 4 or abs(self.crop_end_y - self.crop_start_y) < 4:
+                self.status_bar.config(text="Crop selection too small; drag to select an area")
+                return
 
-            # Convert canvas coordinates to image coordinates
-            # This is a simplified approach - in a real app, you'd need to account for scaling
+            # Convert canvas coordinates to image coordinates through the view the last
+            # display_image() recorded (position and size of the shown image, visible window)
             img_width, img_height = self.processed_image.size
-            canvas_width = self.processed_canvas.winfo_width()
-            canvas_height = self.processed_canvas.winfo_height()
-
-            # Scale factors
-            scale_x = img_width / canvas_width
-            scale_y = img_height / canvas_height
-
-            # Convert to image coordinates
-            img_start_x = int(self.crop_start_x * scale_x)
-            img_start_y = int(self.crop_start_y * scale_y)
-            img_end_x = int(self.crop_end_x * scale_x)
-            img_end_y = int(self.crop_end_y * scale_y)
-
-            # Ensure start < end
-            if img_start_x > img_end_x:
-                img_start_x, img_end_x = img_end_x, img_start_x
-            if img_start_y > img_end_y:
-                img_start_y, img_end_y = img_end_y, img_start_y
+            x0, y0, shown_width, shown_height, left, top, right, bottom = self.processed_canvas._view_map
+
+            def to_image(x, y):
+                fx = left + (right - left) * min(max((x - x0) / shown_width, 0.0), 1.0)
+                fy = top + (bottom - top) * min(max((y - y0) / shown_height, 0.0), 1.0)
+                return int(fx * img_width), int(fy * img_height)
+
+            img_start_x, img_start_y = to_image(min(self.crop_start_x, self.crop_end_x),
+                                                min(self.crop_start_y, self.crop_end_y))
+            img_end_x, img_end_y = to_image(max(self.crop_start_x, self.crop_end_x),
+                                            max(self.crop_start_y, self.crop_end_y))
+            if img_end_x == img_start_x or img_end_y == img_start_y:
+                # Selection lies entirely outside the shown image
+                self.status_bar.config(text="Crop selection is outside the image")
+                return
+
             # Apply crop
             self.processed_image = crop_image(
                 self.processed_image, img_start_x, img_start_y, img_end_x, img_end_y
@@ -3193,9 +3922,8 @@ class ImageProcessorApp:
         # Display the original image
         self.display_image(self.original_image, self.original_canvas)
 
-        # Display the processed image
-        display_img = self.processed_image.copy()
-        self.display_image(display_img, self.processed_canvas)
+        # Display the processed image; display_image never modifies it, so no copy is needed
+        self.display_image(self.processed_image, self.processed_canvas)
 
     def apply_default_operations(self):
         """Apply any default operations to a newly loaded image"""
@@ -3216,15 +3944,15 @@ class ImageProcessorApp:
         current_filter = self.current_filter.get()
         if current_filter and current_filter != "none":
             filter_display_name = current_filter.replace("_", " ").title()
-            self.current_filter_label.config(text=f"Current Filter: {filter_display_name}")
+            self.current_filter_text.set(f"Current Filter: {filter_display_name}")
         else:
-            self.current_filter_label.config(text="No filter selected")
+            self.current_filter_text.set("No filter selected")
 
         # Update adjustment displays
-        brightness_value = self.brightness_slider.get()
-        contrast_value = self.contrast_slider.get()
-        saturation_value = self.saturation_slider.get()
-        hue_value = self.hue_slider.get()
+        brightness_value = self.brightness_var.get()
+        contrast_value = self.contrast_var.get()
+        saturation_value = self.saturation_var.get()
+        hue_value = self.hue_var.get()
 
         # Update status bar with current values
         self.status_bar.config(
@@ -3234,37 +3962,67 @@ class ImageProcessorApp:
         )
 
     # History management for undo/redo
+    def _snapshot(self, image):
+        """Compress an image into a (mode, size, bytes) history entry"""
+        return (image.mode, image.size, zlib.compress(image.tobytes(), 1))
+
+    def _restore(self, snapshot):
+        """Rebuild an image from a history entry"""
+        mode, size, data = snapshot
+        return Image.frombytes(mode, size, zlib.decompress(data))
+
+    def _clear_history(self):
+        """Drop all undo/redo states"""
+        self._history_head = None
+        if self._history_after_id is not None:
+            self.root.after_cancel(self._history_after_id)
+            self._history_after_id = None
+        self._history_pending = None
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+
     def add_to_history(self):
         """Add current state to history"""
-        if self.processed_image:
-            # If we're not at the end of history, truncate it
-            if self.history_position < len(self.history) - 1:
-                self.history = self.history[:self.history_position + 1]
-
-            # Add current state to history
-            self.history.append(self.processed_image.copy())
-            self.history_position = len(self.history) - 1
-
-            # Limit history size
-            if len(self.history) > self.max_history:
-                self.history = self.history[1:]
-                self.history_position -= 1
-
-    def undo(self):
+        # A slider edit still waiting to be recorded comes before this one
+        self._flush_history()
+        self._record_history(self.processed_image)
+
+    def _record_history(self, image):
+        """Make image the current history state"""
+        if image:
+            # The previous state becomes undoable; the deque drops the oldest one when full
+            if self._history_head is not None:
+                self.undo_stack.append(self._history_head)
+            self._history_head = self._snapshot(image)
+
+            # A new edit invalidates anything that was undone
+            self.redo_stack.clear()
+
+            # Large images that compress poorly can outgrow the byte budget before the count
+            # limit; drop the oldest undo states until they fit
+            used = len(self._history_head[2]) + sum(len(entry[2]) for entry in self.undo_stack)
+            while self.undo_stack and used > self.max_history_bytes:
+                used -= len(self.undo_stack.popleft()[2])
+
+    def undo(self, event=None):
         """Undo the last operation"""
-        if self.history_position > 0:
-            self.history_position -= 1
-            self.processed_image = self.history[self.history_position].copy()
+        self._flush_history()
+        if self.undo_stack:
+            self.redo_stack.append(self._history_head)
+            self._history_head = self.undo_stack.pop()
+            self.processed_image = self._restore(self._history_head)
             self.display_image(self.processed_image, self.processed_canvas)
             self.status_bar.config(text="Undo: Reverted to previous state")
         else:
             self.status_bar.config(text="Nothing to undo")
 
-    def redo(self):
+    def redo(self, event=None):
         """Redo the last undone operation"""
-        if self.history_position < len(self.history) - 1:
-            self.history_position += 1
-            self.processed_image = self.history[self.history_position].copy()
+        self._flush_history()
+        if self.redo_stack:
+            self.undo_stack.append(self._history_head)
+            self._history_head = self.redo_stack.pop()
+            self.processed_image = self._restore(self._history_head)
             self.display_image(self.processed_image, self.processed_canvas)
             self.status_bar.config(text="Redo: Applied next state")
         else:
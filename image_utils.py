@@ -1,12 +1,24 @@
 """
 Image Processing Utilities
 Contains functions for image manipulation including brightness and contrast adjustment
+
+Everything here runs through Pillow, so installing the Pillow-SIMD fork in its place
+(pip install pillow-simd, built with CC="cc -mavx2") speeds up the resize, blur,
+filter and conversion paths with no code changes; PILLOW_SIMD reports whether it is in use
 """
 
 from PIL import Image, ImageEnhance, ImageFilter, ImageOps, ImageChops, ImageDraw, ImageFont
+import PIL
 from math import sin, cos, radians
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+
+# Pillow-SIMD is a drop-in Pillow fork with SIMD resampling and convolution kernels;
+# its releases carry a ".postN" version suffix
+PILLOW_SIMD = ".post" in PIL.__version__
 
 # Try to import numpy, but make it optional
 try:
@@ -15,6 +27,41 @@ try:
 except ImportError:
     NUMPY_AVAILABLE = False
 
+# Every possible uint8 value, shared by the lookup table builders
+if NUMPY_AVAILABLE:
+    _ARANGE_256 = np.arange(256, dtype=np.float32)
+
+    # Signed paper-texture noise for the pencil sketch, tiled over the image
+    _PAPER_NOISE = np.round(np.random.default_rng(0).normal(0, 5, (256, 256))).astype(np.int16)
+    # The same noise offset by 128, as a column index into the pencil sketch's lookup table
+    _PAPER_NOISE_INDEX = (np.clip(_PAPER_NOISE, -128, 127) + 128).astype(np.uint8)
+
+    # Sepia color matrix, rows are the output R, G, B channels
+    _SEPIA_MATRIX = np.array([
+        [0.393, 0.769, 0.189],
+        [0.349, 0.686, 0.168],
+        [0.272, 0.534, 0.131]
+    ], dtype=np.float32)
+
+# Try to import OpenCV for vectorized color conversions, also optional
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
+# Try to import numba for JIT-compiled pixel kernels, also optional
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Numba's default workqueue threading layer aborts the process when two threads launch
+# parallel kernels at the same time, and the editor runs them from both the Tk thread
+# and its render worker; every parallel kernel launch holds this lock
+_NUMBA_LOCK = threading.Lock()
+
 def adjust_brightness_contrast(image, brightness=0, contrast=1.0):
     """
     Adjust the brightness and contrast of an image
@@ -35,10 +82,9 @@ def adjust_brightness_contrast(image, brightness=0, contrast=1.0):
     PIL.Image
         The processed image with adjusted brightness and contrast
     """
-    # Create a copy of the image to avoid modifying the original
-    img = image.copy()
-
-    # Ensure image is in RGB mode before processing
+    # Ensure image is in RGB mode before processing; enhance() returns new images,
+    # so the input is never modified and needs no copy
+    img = image
     if img.mode != 'RGB':
         img = img.convert('RGB')
 
@@ -68,23 +114,51 @@ def adjust_brightness_contrast_numpy(image, brightness=0, contrast=1.0):
         # Fall back to PIL implementation if NumPy is not available
         return adjust_brightness_contrast(image, brightness, contrast)
 
-    # Convert PIL image to numpy array
-    img_array = np.array(image).astype(float)
+    # Brightness adds brightness * 2.55 to every pixel (scaling -100..100 to 0-255), then
+    # contrast applies new_pixel = (old_pixel - 128) * contrast + 128, clipped to 0-255.
+    # Pixels are uint8, so evaluate that for the 256 possible values once and let
+    # Image.point apply the table in C, with no float or integer copy of the image
+    lut = brightness_contrast_lut(brightness, contrast).tolist()
+    return image.point(lut * len(image.getbands()))
 
-    # Adjust brightness by adding a value to all pixels
-    # Scale brightness from -100 to 100 to actual pixel values
-    brightness_value = brightness * 2.55  # Scale factor to convert percentage to 0-255 range
-    img_array = img_array + brightness_value
+def brightness_contrast_lut(brightness=0, contrast=1.0):
+    """
+    Build a 256-entry lookup table for brightness and contrast (requires NumPy)
 
-    # Adjust contrast
-    # Formula: new_pixel = (old_pixel - 128) * contrast + 128
-    img_array = (img_array - 128) * contrast + 128
+    Since the input is uint8, the adjustment is a pure map of 256 values, so
+    applying it becomes a single lookup per channel: ``lut[img_array]``.
 
-    # Clip values to valid range
-    img_array = np.clip(img_array, 0, 255).astype(np.uint8)
+    Parameters:
+    -----------
+    brightness : int
+        Brightness adjustment value (-100 to 100)
+    contrast : float
+        Contrast adjustment value (0.1 to 3.0)
+
+    Returns:
+    --------
+    numpy.ndarray
+        uint8 array of length 256 using the adjust_brightness_contrast_numpy formula
+    """
+    # float64 like the other implementations, so values on a rounding edge truncate the same way
+    values = (_ARANGE_256.astype(np.float64) + brightness * 2.55 - 128) * contrast + 128
+    np.clip(values, 0, 255, out=values)
+    return values.astype(np.uint8)
 
-    # Convert back to PIL image
-    return Image.fromarray(img_array)
+def adjust_brightness_contrast_lut(image, brightness=0, contrast=1.0):
+    """
+    Adjust brightness and contrast in a single Image.point pass
+    Uses the same formula as adjust_brightness_contrast_numpy without needing NumPy
+
+    Parameters and returns are the same as adjust_brightness_contrast
+    """
+    if image.mode not in ('RGB', 'L'):
+        image = image.convert('RGB')
+
+    # One fused table instead of chained ImageEnhance passes
+    offset = brightness * 2.55 - 128
+    lut = [int(min(255, max(0, (i + offset) * contrast + 128))) for i in range(256)]
+    return image.point(lut * len(image.getbands()))
 
 # Image Rotation and Flipping Functions
 def rotate_image(image, degrees):
@@ -103,6 +177,18 @@ def rotate_image(image, degrees):
     PIL.Image
         The rotated image
     """
+    # Quarter turns are exact pixel permutations, so transpose instead of resampling
+    quarter_turns = {
+        90: Image.Transpose.ROTATE_270,
+        180: Image.Transpose.ROTATE_180,
+        270: Image.Transpose.ROTATE_90,
+    }
+    angle = degrees % 360
+    if angle == 0:
+        return image
+    if angle in quarter_turns:
+        return image.transpose(quarter_turns[angle])
+
     # Use PIL's rotate method with resample to maintain quality
     # expand=True ensures the entire rotated image is visible
     return image.rotate(-degrees, resample=Image.BICUBIC, expand=True)
@@ -155,11 +241,31 @@ def apply_filter(image, filter_name):
         # Return original image if filter not found
         return image
 
+# Above this radius the separable kernel costs more than PIL's extended box blur
+_CV2_BLUR_MAX_RADIUS = 10
+
 # Custom Gaussian Blur with adjustable radius
-def apply_gaussian_blur(image, radius=2):
+def apply_gaussian_blur(image, radius=2, fast=False):
     """
     Apply Gaussian blur with adjustable radius
+
+    Uses OpenCV's separable SIMD Gaussian for small radii when available, otherwise
+    PIL's box-blur approximation, whose cost doesn't grow with the radius. The radius
+    is the standard deviation in both cases. With fast=True, OpenCV's single-pass stack
+    blur approximates it instead, for previews where a level or two of error is fine.
     """
+    if fast and CV2_AVAILABLE and NUMPY_AVAILABLE and radius > 0 and image.mode in ('L', 'RGB', 'RGBA'):
+        # A stack blur of half-width 2.25 * sigma tracks PIL's blur most closely
+        size = 2 * max(1, round(radius * 2.25)) + 1
+        return Image.fromarray(cv2.stackBlur(np.asarray(image), (size, size)), image.mode)
+
+    if (CV2_AVAILABLE and NUMPY_AVAILABLE and 0 < radius <= _CV2_BLUR_MAX_RADIUS
+            and image.mode in ('L', 'RGB', 'RGBA')):
+        # Kernel cut off at three sigma, edges extended like PIL's
+        size = 2 * round(3 * radius) + 1
+        blurred = cv2.GaussianBlur(np.asarray(image), (size, size), radius,
+                                   borderType=cv2.BORDER_REPLICATE)
+        return Image.fromarray(blurred, image.mode)
     return image.filter(ImageFilter.GaussianBlur(radius=radius))
 
 # Color Adjustment Functions
@@ -198,30 +304,215 @@ def adjust_hue(image, shift):
     PIL.Image
         The processed image with shifted hue
     """
-    # Convert to HSV, adjust hue, convert back to RGB
-    # This is a simplified implementation that works for basic hue shifts
     if image.mode != 'RGB':
         image = image.convert('RGB')
 
-    # Split the image into bands
-    r, g, b = image.split()
-
-    # Normalize shift to 0-1 range
-    normalized_shift = (shift % 360) / 360.0
-
-    # Apply a simple RGB rotation for hue shift
-    # This is a simplified approach - for more accurate hue shifting,
-    # a full HSV conversion would be better
-    if normalized_shift < 1/3:
-        # Shift towards red->green->blue
-        return Image.merge('RGB', (b, r, g))
-    elif normalized_shift < 2/3:
-        # Shift towards green->blue->red
-        return Image.merge('RGB', (g, b, r))
-    else:
-        # No major shift
+    # PIL stores hue as 0-255, so rotate it with a wrapping LUT on the H band
+    offset = round((shift % 360) * 256 / 360) & 0xFF
+    if offset == 0:
         return image
 
+    h, s, v = image.convert('HSV').split()
+    h = h.point([(p + offset) & 0xFF for p in range(256)])
+    return Image.merge('HSV', (h, s, v)).convert('RGB')
+
+if NUMBA_AVAILABLE:
+    @njit(inline='always', fastmath=True)
+    def _rotate_hue_pixel(ri, gi, bi, shift_deg):
+        """Rotate the hue of one uint8 RGB pixel, keeping saturation and value"""
+        r = ri / 255.0
+        g = gi / 255.0
+        b = bi / 255.0
+        mx = max(r, g, b)
+        mn = min(r, g, b)
+        delta = mx - mn
+
+        # Gray pixels have no hue to rotate
+        if delta == 0.0:
+            return ri, gi, bi
+
+        # RGB -> hue sector (0-6)
+        if mx == r:
+            h = (g - b) / delta
+            if h < 0.0:
+                h += 6.0
+        elif mx == g:
+            h = (b - r) / delta + 2.0
+        else:
+            h = (r - g) / delta + 4.0
+
+        # Rotate and convert back to RGB, saturation and value are unchanged
+        h = (h + shift_deg / 60.0) % 6.0
+        sector = int(h)
+        f = h - sector
+        m = mn
+        p = mx - delta * f
+        q = mn + delta * f
+        if sector == 0:
+            r, g, b = mx, q, m
+        elif sector == 1:
+            r, g, b = p, mx, m
+        elif sector == 2:
+            r, g, b = m, mx, q
+        elif sector == 3:
+            r, g, b = m, p, mx
+        elif sector == 4:
+            r, g, b = q, m, mx
+        else:
+            r, g, b = mx, m, p
+        return int(r * 255.0 + 0.5), int(g * 255.0 + 0.5), int(b * 255.0 + 0.5)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _hue_shift_kernel(rgb_u8, shift_deg, out):
+        """Rotate the hue of every pixel of an RGB uint8 array into out"""
+        height, width = rgb_u8.shape[0], rgb_u8.shape[1]
+        for y in prange(height):
+            for x in range(width):
+                r, g, b = _rotate_hue_pixel(rgb_u8[y, x, 0], rgb_u8[y, x, 1], rgb_u8[y, x, 2], shift_deg)
+                out[y, x, 0] = r
+                out[y, x, 1] = g
+                out[y, x, 2] = b
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _adjust_fused_kernel(rgb_u8, offset, contrast, saturation, shift_deg, out):
+        """Brightness/contrast, saturation and hue of every pixel in one pass into out"""
+        height, width = rgb_u8.shape[0], rgb_u8.shape[1]
+        for y in prange(height):
+            for x in range(width):
+                # Brightness and contrast, the same truncated formula as the lookup table
+                r = int(min(255.0, max(0.0, (rgb_u8[y, x, 0] + offset) * contrast + 128.0)))
+                g = int(min(255.0, max(0.0, (rgb_u8[y, x, 1] + offset) * contrast + 128.0)))
+                b = int(min(255.0, max(0.0, (rgb_u8[y, x, 2] + offset) * contrast + 128.0)))
+
+                # Saturation blends with PIL's "L" luma, like ImageEnhance.Color
+                if saturation != 1.0:
+                    luma = (r * 19595 + g * 38470 + b * 7471 + 0x8000) >> 16
+                    r = int(min(255.0, max(0.0, luma + saturation * (r - luma))))
+                    g = int(min(255.0, max(0.0, luma + saturation * (g - luma))))
+                    b = int(min(255.0, max(0.0, luma + saturation * (b - luma))))
+
+                if shift_deg != 0.0:
+                    r, g, b = _rotate_hue_pixel(r, g, b, shift_deg)
+                out[y, x, 0] = r
+                out[y, x, 1] = g
+                out[y, x, 2] = b
+
+def adjust_hue_numba(image, shift, out=None):
+    """
+    Shift the hue of an image with a JIT-compiled HSV rotation (requires Numba)
+
+    Parameters:
+    -----------
+    image : PIL.Image
+        The input image to be processed
+    shift : int
+        Hue shift in degrees (0-360)
+    out : numpy.ndarray, optional
+        Preallocated (height, width, 3) uint8 buffer reused between calls
+
+    Returns:
+    --------
+    PIL.Image
+        The processed image with shifted hue
+    """
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+
+    rgb = np.ascontiguousarray(np.asarray(image, dtype=np.uint8))
+    if out is None or out.shape != rgb.shape:
+        out = np.empty_like(rgb)
+
+    with _NUMBA_LOCK:
+        _hue_shift_kernel(rgb, float(shift % 360), out)
+    return Image.fromarray(out)
+
+def adjust_all_numba(image, brightness=0, contrast=1.0, saturation=1.0, hue=0, out=None):
+    """
+    Apply brightness, contrast, saturation and hue in a single JIT-compiled pass (requires Numba)
+
+    Gives the same result as adjust_brightness_contrast_lut, adjust_saturation and
+    adjust_hue_numba chained, to within rounding, while reading and writing the pixels once.
+
+    Parameters:
+    -----------
+    image : PIL.Image or numpy.ndarray
+        The input image, or its C-contiguous (height, width, 3) uint8 array
+    brightness : int
+        Brightness adjustment (-100 to 100)
+    contrast : float
+        Contrast factor (1.0 = unchanged)
+    saturation : float
+        Saturation factor (0.0 = grayscale, 1.0 = unchanged)
+    hue : int
+        Hue shift in degrees (0-360)
+    out : numpy.ndarray, optional
+        Preallocated (height, width, 3) uint8 buffer reused between calls
+
+    Returns:
+    --------
+    PIL.Image
+        The adjusted image
+    """
+    if isinstance(image, np.ndarray):
+        rgb = image
+    else:
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        rgb = np.ascontiguousarray(np.asarray(image, dtype=np.uint8))
+    if out is None or out.shape != rgb.shape:
+        out = np.empty_like(rgb)
+
+    with _NUMBA_LOCK:
+        _adjust_fused_kernel(rgb, brightness * 2.55 - 128, float(contrast), float(saturation),
+                             float(hue % 360), out)
+    return Image.fromarray(out)
+
+def adjust_saturation_hue_cv2(img_array, saturation=1.0, hue=0):
+    """
+    Adjust saturation and hue of an RGB array with OpenCV (requires cv2)
+
+    Saturation blends with the grayscale image exactly like ImageEnhance.Color,
+    hue is rotated in OpenCV's full-range HSV space (0-255 per turn).
+
+    Parameters:
+    -----------
+    img_array : numpy.ndarray
+        RGB uint8 array of shape (height, width, 3)
+    saturation : float
+        Saturation factor (0.0 = grayscale, 1.0 = unchanged)
+    hue : int
+        Hue shift in degrees (0-360)
+
+    Returns:
+    --------
+    numpy.ndarray
+        The adjusted RGB uint8 array
+    """
+    if saturation != 1.0:
+        gray = cv2.cvtColor(cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY), cv2.COLOR_GRAY2RGB)
+        img_array = cv2.addWeighted(img_array, saturation, gray, 1.0 - saturation, 0)
+
+    if hue % 360:
+        hsv = cv2.cvtColor(img_array, cv2.COLOR_RGB2HSV_FULL)
+        # uint8 addition wraps around, which is exactly the hue rotation
+        hsv[:, :, 0] += np.uint8(round((hue % 360) * 256 / 360) % 256)
+        img_array = cv2.cvtColor(hsv, cv2.COLOR_HSV2RGB_FULL)
+
+    return img_array
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _sketch_texture_kernel(edges, table, noise_index, out):
+        """Map each sketch pixel and its tiled noise offset through table in one pass"""
+        height, width = edges.shape
+        tile_h, tile_w = noise_index.shape
+        for y in prange(height):
+            noise_row = noise_index[y % tile_h]
+            # Walk the row one tile width at a time so the noise index needs no modulo
+            for x0 in range(0, width, tile_w):
+                for k in range(min(tile_w, width - x0)):
+                    out[y, x0 + k] = table[edges[y, x0 + k], noise_row[k]]
+
 # Histogram Equalization
 def apply_histogram_equalization(image, intensity=1.0):
     """
@@ -240,62 +531,17 @@ def apply_histogram_equalization(image, intensity=1.0):
     PIL.Image
         The processed image with equalized histogram
     """
-    # Make a copy to avoid modifying the original
-    img = image.copy()
-
-    # Ensure image is in RGB mode
-    if img.mode != 'RGB':
-        img = img.convert('RGB')
-
-    # For better results, convert to LAB color space
-    if NUMPY_AVAILABLE:
-        # Convert to numpy array
-        img_array = np.array(img)
-
-        # Convert RGB to LAB color space
-        # This is a simplified conversion - a proper color space library would be better
-        # Extract L channel (luminance)
-        r, g, b = img.split()
-        l_channel = ImageOps.equalize(ImageOps.grayscale(img))
-
-        # Apply equalization only to luminance channel
-        equalized = l_channel
-
-        # If intensity is less than 1, blend with original luminance
-        if intensity < 1.0:
-            # Get original luminance
-            original_l = ImageOps.grayscale(img)
-            # Blend based on intensity
-            equalized = Image.blend(original_l, l_channel, intensity)
-
-        # Create a new RGB image with equalized luminance but original colors
-        result = img.copy()
-        # Adjust the brightness of the original image based on the equalized luminance
-        enhancer = ImageEnhance.Brightness(result)
-        # Use the ratio of equalized to original luminance to adjust brightness
-        # This preserves colors better than direct channel equalization
-        return enhancer.enhance(1.2)  # Slightly boost brightness for better effect
-    else:
-        # Fallback method if numpy is not available
-        # Split into channels
-        r, g, b = img.split()
-
-        # Convert to grayscale for luminance
-        gray = ImageOps.grayscale(img)
-        # Equalize the grayscale image
-        equalized_gray = ImageOps.equalize(gray)
-
-        # Create an enhancement mask from the difference
-        # between original and equalized grayscale
-        enhancer = ImageEnhance.Contrast(img)
-
-        # Apply contrast enhancement based on intensity
-        enhanced = enhancer.enhance(1.0 + intensity * 0.5)
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
 
-        # If intensity is less than 1, blend with original
-        if intensity < 1.0:
-            return Image.blend(img, enhanced, intensity)
-        return enhanced
+    # Equalize only the luma so the colours don't shift, then blend the equalized
+    # band with the original by intensity
+    y, cb, cr = image.convert('YCbCr').split()
+    y_equalized = ImageOps.equalize(y)
+    intensity = min(max(intensity, 0.0), 1.0)
+    if intensity < 1.0:
+        y_equalized = Image.blend(y, y_equalized, intensity)
+    return Image.merge('YCbCr', (y_equalized, cb, cr)).convert('RGB')
 
 # Advanced Filters
 def apply_pencil_sketch(image, intensity=1.0):
@@ -319,15 +565,12 @@ def apply_pencil_sketch(image, intensity=1.0):
     if image.mode != 'RGB':
         image = image.convert('RGB')
 
-    # Create a copy to avoid modifying the original
-    img = image.copy()
-
     # Step 1: Create grayscale version
-    gray = img.convert('L')
+    gray = image.convert('L')
 
     # Step 2: Apply Gaussian blur to create smooth gradients
     blur_radius = max(1, int(intensity * 3))
-    blurred = gray.filter(ImageFilter.GaussianBlur(radius=blur_radius))
+    blurred = apply_gaussian_blur(gray, blur_radius)
 
     # Step 3: Apply edge detection for sketch lines
     edges = blurred.filter(ImageFilter.FIND_EDGES)
@@ -339,21 +582,38 @@ def apply_pencil_sketch(image, intensity=1.0):
     enhancer = ImageEnhance.Contrast(inverted_edges)
     enhanced_edges = enhancer.enhance(1.0 + intensity)
 
-    # Step 6: Create a white background
-    white_bg = Image.new('L', img.size, 255)
-
-    # Step 7: Blend the edges with the white background
+    # Steps 6 and 7: Blend the edges with a white background
     # Use intensity to control the blending
     blend_factor = min(1.0, intensity * 0.8)
+
+    if NUMBA_AVAILABLE:
+        # Blending with a constant white is a per-value mapping, so read PIL's exact
+        # result off a 0-255 ramp. With the noise offset that gives a 256x256 table of
+        # clipped results, and steps 7 and 8 become one branch-free lookup per pixel
+        ramp = Image.frombytes('L', (256, 1), bytes(range(256)))
+        blend_lut = np.asarray(Image.blend(Image.new('L', (256, 1), 255), ramp, blend_factor),
+                               dtype=np.int16)[0]
+        table = np.clip(blend_lut[:, None] + np.arange(-128, 128, dtype=np.int16), 0, 255).astype(np.uint8)
+        edges = np.asarray(enhanced_edges)
+        out = np.empty(edges.shape, dtype=np.uint8)
+        with _NUMBA_LOCK:
+            _sketch_texture_kernel(edges, table, _PAPER_NOISE_INDEX, out)
+        return Image.fromarray(out).convert('RGB')
+
+    white_bg = Image.new('L', image.size, 255)
     sketch = Image.blend(white_bg, enhanced_edges, blend_factor)
 
     # Step 8: Add some texture (optional)
     if NUMPY_AVAILABLE:
-        # Add some noise for paper texture
-        sketch_array = np.array(sketch)
-        noise = np.random.normal(0, 5, sketch_array.shape).astype(np.uint8)
-        sketch_array = np.clip(sketch_array + noise, 0, 255).astype(np.uint8)
-        sketch = Image.fromarray(sketch_array)
+        # Add some noise for paper texture; signed, so it can darken as well as lighten
+        sketch_array = np.asarray(sketch)
+        height, width = sketch_array.shape
+        tile = _PAPER_NOISE
+        noise = np.tile(tile, (-(-height // tile.shape[0]), -(-width // tile.shape[1])))[:height, :width]
+        # Add in int16 so nothing wraps, then clip and narrow to uint8 in one pass
+        textured = np.empty(sketch_array.shape, dtype=np.uint8)
+        np.clip(sketch_array + noise, 0, 255, out=textured, casting='unsafe')
+        sketch = Image.fromarray(textured)
 
     # Step 9: Convert back to RGB
     return sketch.convert('RGB')
@@ -366,39 +626,76 @@ def apply_sepia(image):
     if image.mode != 'RGB':
         image = image.convert('RGB')
 
-    # Define sepia matrix
+    # Define sepia matrix, with a zero offset per output channel as convert() expects
     sepia_matrix = (
-        0.393, 0.769, 0.189,
-        0.349, 0.686, 0.168,
-        0.272, 0.534, 0.131
+        0.393, 0.769, 0.189, 0,
+        0.349, 0.686, 0.168, 0,
+        0.272, 0.534, 0.131, 0
     )
 
-    # Apply color matrix
-    if NUMPY_AVAILABLE:
-        # Use NumPy for faster processing if available
-        img_array = np.array(image)
-        sepia_array = np.zeros_like(img_array)
-
-        # Apply the sepia matrix
-        sepia_array[:,:,0] = (img_array[:,:,0] * sepia_matrix[0] +
-                              img_array[:,:,1] * sepia_matrix[1] +
-                              img_array[:,:,2] * sepia_matrix[2])
-        sepia_array[:,:,1] = (img_array[:,:,0] * sepia_matrix[3] +
-                              img_array[:,:,1] * sepia_matrix[4] +
-                              img_array[:,:,2] * sepia_matrix[5])
-        sepia_array[:,:,2] = (img_array[:,:,0] * sepia_matrix[6] +
-                              img_array[:,:,1] * sepia_matrix[7] +
-                              img_array[:,:,2] * sepia_matrix[8])
-
-        # Clip values
-        sepia_array = np.clip(sepia_array, 0, 255).astype(np.uint8)
-        return Image.fromarray(sepia_array)
-    else:
-        # Fallback to a simpler approach without NumPy
-        # Convert to sepia by adjusting colors and saturation
-        sepia_image = adjust_saturation(image, 0.3)  # Reduce saturation
-        sepia_image = adjust_brightness_contrast(sepia_image, 10, 1.1)  # Slight brightness and contrast adjustment
-        return sepia_image
+    # Apply color matrix: PIL streams it through the image in one C pass, clipping to 0-255,
+    # which beats copying the pixels out to NumPy and back even for a compiled kernel
+    return image.convert('RGB', sepia_matrix)
+
+def build_sepia_luts(intensity=1.0):
+    """
+    Precompute lookup tables for a sepia tone blended with the original (requires NumPy)
+
+    Parameters:
+    -----------
+    intensity : float
+        Blend factor between the original (0.0) and full sepia (1.0)
+
+    Returns:
+    --------
+    tuple
+        (mix, keep, limit) where mix[c, k] is a 256-entry float32 table giving
+        the contribution of input channel k to output channel c, keep is the
+        256-entry table of the original value that is preserved and limit is
+        the clipping ceiling for the sepia part
+    """
+    intensity = min(max(intensity, 0.0), 1.0)
+    mix = (intensity * _SEPIA_MATRIX)[:, :, None] * _ARANGE_256
+    keep = (1.0 - intensity) * _ARANGE_256
+    return mix, keep, 255.0 * intensity
+
+def apply_sepia_luts(image, luts):
+    """
+    Apply a sepia tone using tables from build_sepia_luts
+
+    Parameters:
+    -----------
+    image : PIL.Image
+        The input image to be processed
+    luts : tuple
+        The (mix, keep, limit) tables returned by build_sepia_luts
+
+    Returns:
+    --------
+    PIL.Image
+        The sepia toned image
+    """
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+
+    mix, keep, limit = luts
+    # Work on planar bands rather than the interleaved (height, width, 3) array, so every
+    # gather and add walks contiguous memory instead of striding over the other channels
+    channels = [np.asarray(band) for band in image.split()]
+    out = np.empty(channels[0].shape, dtype=np.float32)
+    bands = []
+
+    # Clip the sepia part before blending so it matches clip(sepia) * intensity
+    for c in range(3):
+        np.add(mix[c, 0][channels[0]], mix[c, 1][channels[1]], out=out)
+        out += mix[c, 2][channels[2]]
+        np.minimum(out, limit, out=out)
+        # Add the kept original straight into a fresh uint8 band, no separate cast pass
+        band = np.empty(out.shape, dtype=np.uint8)
+        np.add(out, keep[channels[c]], out=band, casting='unsafe')
+        bands.append(Image.fromarray(band, 'L'))
+
+    return Image.merge('RGB', bands)
 
 # Crop function
 def crop_image(image, left, top, right, bottom):
@@ -431,14 +728,14 @@ def crop_image(image, left, top, right, bottom):
     return image.crop((left, top, right, bottom))
 
 # Resize functions
-def resize_image(image, width, height, keep_aspect_ratio=True):
+def get_resize_dimensions(image, width, height, keep_aspect_ratio=True):
     """
-    Resize an image to the specified dimensions
+    Compute the size resize_image would produce, without resizing
 
     Parameters:
     -----------
     image : PIL.Image
-        The input image to be processed
+        The input image
     width : int
         Target width in pixels
     height : int
@@ -448,22 +745,66 @@ def resize_image(image, width, height, keep_aspect_ratio=True):
 
     Returns:
     --------
-    PIL.Image
-        The resized image
+    tuple
+        (width, height) of the result; the current size if the dimensions are invalid
     """
     if width <= 0 or height <= 0:
-        return image  # Return original if invalid dimensions
+        return image.size
 
     if keep_aspect_ratio:
         # Calculate new dimensions while maintaining aspect ratio
         original_width, original_height = image.size
         ratio = min(width / original_width, height / original_height)
-        new_width = int(original_width * ratio)
-        new_height = int(original_height * ratio)
-    else:
-        new_width, new_height = width, height
+        return int(original_width * ratio), int(original_height * ratio)
+    return width, height
+
+def get_percentage_dimensions(image, percentage):
+    """
+    Compute the size resize_by_percentage would produce, without resizing
 
-    return image.resize((new_width, new_height), Image.LANCZOS)
+    Parameters:
+    -----------
+    image : PIL.Image
+        The input image
+    percentage : float
+        Percentage to resize (e.g., 50.0 for half size, 200.0 for double size)
+
+    Returns:
+    --------
+    tuple
+        (width, height) of the result; the current size if the percentage is invalid
+    """
+    if percentage <= 0:
+        return image.size
+
+    original_width, original_height = image.size
+    return int(original_width * percentage / 100), int(original_height * percentage / 100)
+
+def resize_image(image, width, height, keep_aspect_ratio=True):
+    """
+    Resize an image to the specified dimensions
+
+    Parameters:
+    -----------
+    image : PIL.Image
+        The input image to be processed
+    width : int
+        Target width in pixels
+    height : int
+        Target height in pixels
+    keep_aspect_ratio : bool
+        Whether to maintain the original aspect ratio
+
+    Returns:
+    --------
+    PIL.Image
+        The resized image, or the input image itself if its size would not change
+    """
+    new_size = get_resize_dimensions(image, width, height, keep_aspect_ratio)
+    if new_size == image.size:
+        return image  # Nothing to resize (or invalid dimensions); callers can detect this by identity
+
+    return image.resize(new_size, Image.LANCZOS)
 
 def resize_by_percentage(image, percentage):
     """
@@ -479,19 +820,33 @@ def resize_by_percentage(image, percentage):
     Returns:
     --------
     PIL.Image
-        The resized image
+        The resized image, or the input image itself if its size would not change
     """
-    if percentage <= 0:
-        return image  # Return original if invalid percentage
+    new_size = get_percentage_dimensions(image, percentage)
+    if new_size == image.size:
+        return image  # Nothing to resize (or invalid percentage); callers can detect this by identity
 
-    # Calculate new dimensions
-    original_width, original_height = image.size
-    new_width = int(original_width * percentage / 100)
-    new_height = int(original_height * percentage / 100)
-
-    return image.resize((new_width, new_height), Image.LANCZOS)
+    return image.resize(new_size, Image.LANCZOS)
 
 # Text annotation functions
+def _drawable_copy(image):
+    """Return an RGB or RGBA copy of image to draw on; convert() already returns a new image"""
+    if image.mode in ('RGB', 'RGBA'):
+        return image.copy()
+    return image.convert('RGB')
+
+@lru_cache(maxsize=32)
+def _load_font(font_path, font_size):
+    """Load a TrueType font once per path and size, falling back to PIL's default font"""
+    try:
+        if font_path and os.path.exists(font_path):
+            return ImageFont.truetype(font_path, font_size)
+        # Use default font
+        return ImageFont.load_default()
+    except Exception:
+        # Fallback to default font if there's any issue
+        return ImageFont.load_default()
+
 def add_text(image, text, position, font_size=20, font_color=(255, 255, 255),
             font_path=None, background=None):
     """
@@ -519,26 +874,14 @@ def add_text(image, text, position, font_size=20, font_color=(255, 255, 255),
     PIL.Image
         The image with text added
     """
-    # Create a copy of the image to avoid modifying the original
-    img = image.copy()
-
-    # Ensure image is in RGB or RGBA mode
-    if img.mode not in ('RGB', 'RGBA'):
-        img = img.convert('RGB')
+    # Draw on a copy so the original is left untouched
+    img = _drawable_copy(image)
 
     # Create a drawing context
     draw = ImageDraw.Draw(img)
 
     # Load font
-    try:
-        if font_path and os.path.exists(font_path):
-            font = ImageFont.truetype(font_path, font_size)
-        else:
-            # Use default font
-            font = ImageFont.load_default()
-    except Exception:
-        # Fallback to default font if there's any issue
-        font = ImageFont.load_default()
+    font = _load_font(font_path, font_size)
 
     # Draw text background if specified
     if background:
@@ -560,6 +903,30 @@ def add_text(image, text, position, font_size=20, font_color=(255, 255, 255),
     return img
 
 # Drawing functions
+def _draw_line(draw, start_point, end_point, color=(255, 0, 0), width=1):
+    """Draw a line with an existing ImageDraw context"""
+    draw.line([start_point, end_point], fill=color, width=width)
+
+def _draw_rectangle(draw, top_left, bottom_right, color=(255, 0, 0), width=1, fill=None):
+    """Draw a rectangle with an existing ImageDraw context"""
+    draw.rectangle([top_left, bottom_right], outline=color, width=width, fill=fill)
+
+def _draw_circle(draw, center, radius, color=(255, 0, 0), width=1, fill=None):
+    """Draw a circle with an existing ImageDraw context"""
+    # Calculate bounding box for circle
+    top_left = (center[0] - radius, center[1] - radius)
+    bottom_right = (center[0] + radius, center[1] + radius)
+
+    # Draw circle (ellipse with equal width and height)
+    draw.ellipse([top_left, bottom_right], outline=color, width=width, fill=fill)
+
+# Shape names accepted by draw_many
+_SHAPE_DRAWERS = {
+    'line': _draw_line,
+    'rectangle': _draw_rectangle,
+    'circle': _draw_circle,
+}
+
 def draw_line(image, start_point, end_point, color=(255, 0, 0), width=1):
     """
     Draw a line on an image
@@ -582,18 +949,14 @@ def draw_line(image, start_point, end_point, color=(255, 0, 0), width=1):
     PIL.Image
         The image with the line drawn
     """
-    # Create a copy of the image to avoid modifying the original
-    img = image.copy()
-
-    # Ensure image is in RGB or RGBA mode
-    if img.mode not in ('RGB', 'RGBA'):
-        img = img.convert('RGB')
+    # Draw on a copy so the original is left untouched
+    img = _drawable_copy(image)
 
     # Create a drawing context
     draw = ImageDraw.Draw(img)
 
     # Draw line
-    draw.line([start_point, end_point], fill=color, width=width)
+    _draw_line(draw, start_point, end_point, color, width)
 
     return img
 
@@ -621,18 +984,14 @@ def draw_rectangle(image, top_left, bottom_right, color=(255, 0, 0), width=1, fi
     PIL.Image
         The image with the rectangle drawn
     """
-    # Create a copy of the image to avoid modifying the original
-    img = image.copy()
-
-    # Ensure image is in RGB or RGBA mode
-    if img.mode not in ('RGB', 'RGBA'):
-        img = img.convert('RGB')
+    # Draw on a copy so the original is left untouched
+    img = _drawable_copy(image)
 
     # Create a drawing context
     draw = ImageDraw.Draw(img)
 
     # Draw rectangle
-    draw.rectangle([top_left, bottom_right], outline=color, width=width, fill=fill)
+    _draw_rectangle(draw, top_left, bottom_right, color, width, fill)
 
     return img
 
@@ -660,26 +1019,127 @@ def draw_circle(image, center, radius, color=(255, 0, 0), width=1, fill=None):
     PIL.Image
         The image with the circle drawn
     """
-    # Create a copy of the image to avoid modifying the original
-    img = image.copy()
-
-    # Ensure image is in RGB or RGBA mode
-    if img.mode not in ('RGB', 'RGBA'):
-        img = img.convert('RGB')
+    # Draw on a copy so the original is left untouched
+    img = _drawable_copy(image)
 
     # Create a drawing context
     draw = ImageDraw.Draw(img)
 
-    # Calculate bounding box for circle
-    top_left = (center[0] - radius, center[1] - radius)
-    bottom_right = (center[0] + radius, center[1] + radius)
+    # Draw circle
+    _draw_circle(draw, center, radius, color, width, fill)
 
-    # Draw circle (ellipse with equal width and height)
-    draw.ellipse([top_left, bottom_right], outline=color, width=width, fill=fill)
+    return img
+
+def draw_many(image, ops):
+    """
+    Draw several shapes on one copy of an image
+
+    Parameters:
+    -----------
+    image : PIL.Image
+        The input image to be processed
+    ops : list
+        (kind, params) pairs drawn in order, where kind is 'line', 'rectangle' or
+        'circle' and params holds the matching draw_* keyword arguments, e.g.
+        [('line', {'start_point': (0, 0), 'end_point': (50, 50)}),
+         ('circle', {'center': (25, 25), 'radius': 10, 'fill': (0, 0, 255)})]
+        Unknown kinds are skipped
+
+    Returns:
+    --------
+    PIL.Image
+        The image with all the shapes drawn
+    """
+    # One copy and one drawing context for every shape, instead of one per draw_* call
+    img = _drawable_copy(image)
+    draw = ImageDraw.Draw(img)
+
+    for kind, params in ops:
+        draw_shape = _SHAPE_DRAWERS.get(kind)
+        if draw_shape is not None:
+            draw_shape(draw, **params)
 
     return img
 
 # Batch processing function
+def _apply_ops_fused(img, operations):
+    """Apply the batch colour adjustments in as few passes over the pixels as possible"""
+    brightness = operations.get('brightness', 0)
+    contrast = operations.get('contrast', 1.0)
+    saturation = operations.get('saturation', 1.0)
+    hue = operations.get('hue', 0)
+
+    # No JIT kernels here: every worker process would pay for loading (or compiling) them,
+    # and their thread pools would compete with the other workers for the same cores.
+    # Brightness and contrast share one point() table, the same formula as the editor
+    if brightness != 0 or contrast != 1.0:
+        img = adjust_brightness_contrast_lut(img, brightness, contrast)
+
+    if saturation == 1.0 and hue % 360 == 0:
+        return img
+    if CV2_AVAILABLE and NUMPY_AVAILABLE and img.mode == 'RGB':
+        # Saturation and hue in OpenCV's vectorized conversions, as in the editor's live preview.
+        # Other modes take the PIL path below, which keeps their alpha and grayscale bands
+        return Image.fromarray(adjust_saturation_hue_cv2(np.asarray(img), saturation, hue))
+    if saturation != 1.0:
+        img = adjust_saturation(img, saturation)
+    if hue % 360 != 0:
+        img = adjust_hue(img, hue)
+    return img
+
+def _process_one(img_path, output_dir, operations):
+    """Apply the batch operations to one image and save it, returning the output path or None"""
+    try:
+        # Load image
+        img = Image.open(img_path)
+
+        # Work out the final size from the full-resolution header before decoding
+        target_size = None
+        if 'resize' in operations:
+            resize_params = operations.get('resize', {})
+            if 'percentage' in resize_params:
+                target_size = get_percentage_dimensions(img, resize_params['percentage'])
+            elif 'width' in resize_params and 'height' in resize_params:
+                keep_ratio = resize_params.get('keep_aspect_ratio', True)
+                target_size = get_resize_dimensions(img, resize_params['width'],
+                                                    resize_params['height'], keep_ratio)
+
+        # When shrinking, let libjpeg decode at the smallest 1/2, 1/4 or 1/8 scale that is still
+        # at least the target size (a no-op for other formats). Filters are left at full
+        # resolution, since their radii are in source pixels
+        if (target_size is not None and 'filter' not in operations
+                and target_size[0] < img.width and target_size[1] < img.height):
+            img.draft(img.mode, target_size)
+
+        # Apply operations
+        img = _apply_ops_fused(img, operations)
+
+        if 'filter' in operations:
+            filter_name = operations.get('filter')
+            if filter_name == 'sepia':
+                img = apply_sepia(img)
+            elif filter_name in ['blur', 'sharpen', 'contour', 'detail', 'edge_enhance',
+                                'edge_enhance_more', 'emboss', 'find_edges', 'smooth', 'smooth_more']:
+                img = apply_filter(img, filter_name)
+
+        # Resize to the size computed from the original, which a draft decode may already be close to
+        if target_size is not None and target_size != img.size:
+            img = img.resize(target_size, Image.LANCZOS)
+
+        # Generate output filename
+        filename = os.path.basename(img_path)
+        name, ext = os.path.splitext(filename)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        output_path = os.path.join(output_dir, f"{name}_processed_{timestamp}{ext}")
+
+        # Save processed image
+        img.save(output_path)
+        return output_path
+
+    except Exception as e:
+        print(f"Error processing {img_path}: {str(e)}")
+        return None
+
 def batch_process(image_paths, output_dir, operations=None):
     """
     Process multiple images with the same operations
@@ -712,58 +1172,17 @@ def batch_process(image_paths, output_dir, operations=None):
     if operations is None:
         operations = {}
 
-    processed_paths = []
+    # Images are independent, so spread them over worker processes; a single image
+    # or a single core isn't worth the process start-up cost
+    workers = min(len(image_paths), os.cpu_count() or 1)
+    process = partial(_process_one, output_dir=output_dir, operations=operations)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(process, image_paths))
+    else:
+        results = [process(img_path) for img_path in image_paths]
 
-    # Process each image
-    for img_path in image_paths:
-        try:
-            # Load image
-            img = Image.open(img_path)
-
-            # Apply operations
-            if 'brightness' in operations or 'contrast' in operations:
-                brightness = operations.get('brightness', 0)
-                contrast = operations.get('contrast', 1.0)
-                img = adjust_brightness_contrast(img, brightness, contrast)
-
-            if 'saturation' in operations:
-                saturation = operations.get('saturation', 1.0)
-                img = adjust_saturation(img, saturation)
-
-            if 'hue' in operations:
-                hue = operations.get('hue', 0)
-                img = adjust_hue(img, hue)
-
-            if 'filter' in operations:
-                filter_name = operations.get('filter')
-                if filter_name == 'sepia':
-                    img = apply_sepia(img)
-                elif filter_name in ['blur', 'sharpen', 'contour', 'detail', 'edge_enhance',
-                                    'edge_enhance_more', 'emboss', 'find_edges', 'smooth', 'smooth_more']:
-                    img = apply_filter(img, filter_name)
-
-            if 'resize' in operations:
-                resize_params = operations.get('resize', {})
-                if 'percentage' in resize_params:
-                    img = resize_by_percentage(img, resize_params['percentage'])
-                elif 'width' in resize_params and 'height' in resize_params:
-                    keep_ratio = resize_params.get('keep_aspect_ratio', True)
-                    img = resize_image(img, resize_params['width'], resize_params['height'], keep_ratio)
-
-            # Generate output filename
-            filename = os.path.basename(img_path)
-            name, ext = os.path.splitext(filename)
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            output_path = os.path.join(output_dir, f"{name}_processed_{timestamp}{ext}")
-
-            # Save processed image
-            img.save(output_path)
-            processed_paths.append(output_path)
-
-        except Exception as e:
-            print(f"Error processing {img_path}: {str(e)}")
-
-    return processed_paths
+    return [path for path in results if path is not None]
 
 # Image information function
 def get_image_info(image):